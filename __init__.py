@@ -32,7 +32,10 @@ from .tex.ui import MHST2_ImportTex
 from .lmt.ui import MHST2_IMPORT_PT_LmtSettingPanel_1
 from .lmt.ui import MHST2_ImportLmt
 
-from .arc.arc_parser import bulk_extract_arc
+from .arc.ui import MHST2_ArcExtract
+from .arc.ui import MHST2_ArcIndex
+from .arc.ui import MHST2_ArcExtractDependencies
+from .arc.ui import MHST2_ArcVerify
 
 class ColoredFormatter(logging.Formatter):
     def __init__(self, *args, **kwargs):
@@ -91,6 +94,59 @@ class CustomAddonPreferences(bpy.types.AddonPreferences):
                  ('ERROR','ERROR','','',3)],
         default = 'INFO'
     )
+
+    extraction_worker_count: bpy.props.IntProperty(
+        name="Extraction workers",
+        description="Number of arc files extracted in parallel when unpacking the game",
+        default=min(os.cpu_count() or 1, 8),
+        min=1,
+        max=64,
+    )
+
+    extraction_format: bpy.props.EnumProperty(
+        name="Extraction format",
+        description="How the unpacked game files are stored",
+        items = [('LOOSE','Loose files','One file per game file','',0),
+                 ('PACK','Pack','A few large pack files, compressed as in the archives. The importers read from them directly. A cancelled pack build starts over','',1),
+                 ('PACK_UNCOMPRESSED','Uncompressed pack','A few large pack files, not compressed: bigger, but faster to read. A cancelled pack build starts over','',2)],
+        default = 'LOOSE'
+    )
+
+    extraction_dedup: bpy.props.BoolProperty(
+        name="Deduplicate extracted files",
+        description="Store identical files once and extract hardlinks to them. Saves disk space, but editing one of these files changes all its copies",
+        default=False,
+    )
+
+    extraction_link_loose_files: bpy.props.BoolProperty(
+        name="Link files that are not archived",
+        description="Link the game files that are not in an archive instead of copying them (reflink when the filesystem supports it, else hardlink). With hardlinks, editing one of these files also changes the installed game",
+        default=False,
+    )
+
+    extraction_include_paths: bpy.props.StringProperty(
+        name="Include paths",
+        description="Comma separated globs, only the matching files are extracted (e.g. stage/**, mod/em*)",
+        default="",
+    )
+
+    extraction_exclude_paths: bpy.props.StringProperty(
+        name="Exclude paths",
+        description="Comma separated globs, the matching files are not extracted",
+        default="",
+    )
+
+    extraction_include_classes: bpy.props.StringProperty(
+        name="Include resource classes",
+        description="Comma separated resource classes or extensions, only the files of these classes are extracted (e.g. rModel, rTexture, rMaterial, rMotionList, .lmt)",
+        default="",
+    )
+
+    extraction_exclude_classes: bpy.props.StringProperty(
+        name="Exclude resource classes",
+        description="Comma separated resource classes or extensions, the files of these classes are not extracted",
+        default="",
+    )
     
     def draw(self, context):
         layout = self.layout
@@ -99,21 +155,30 @@ class CustomAddonPreferences(bpy.types.AddonPreferences):
         layout.label(text="[Optionnal] Path to where the game is installed (the folder containing the .exe of the game), only necessary if you want to unpack the game.")
         layout.prop(self, "installation_game_path")
         layout.prop(self, "logging_level")
+        layout.prop(self, "extraction_worker_count")
+        layout.prop(self, "extraction_format")
+        layout.prop(self, "extraction_dedup")
+        layout.prop(self, "extraction_link_loose_files")
+        box = layout.box()
+        box.label(text="[Optionnal] Extraction filters, leave empty to unpack everything.")
+        box.prop(self, "extraction_include_paths")
+        box.prop(self, "extraction_exclude_paths")
+        box.prop(self, "extraction_include_classes")
+        box.prop(self, "extraction_exclude_classes")
         row = layout.row()
         row.alert = True
         button = row.operator("mhst2_import.mhst2_extract_arc",
-                         text="Unpack the game (check the system console for progress, might take around 10 minutes))",
+                         text="Unpack the game (might take around 10 minutes, progress in the status bar, Esc to cancel)",
                          icon="ERROR")
-
-
-class MHST2_ArcExtract(bpy.types.Operator):
-    bl_idname = "mhst2_import.mhst2_extract_arc"
-    bl_label = "Bulk extract arc files"
-    bl_options = {'REGISTER'}
-
-    def execute(self, context):
-        bulk_extract_arc(context)
-        return {'FINISHED'}
+        layout.operator("mhst2_import.mhst2_index_arc",
+                        text="Index the game archives (only reads the archive tables, takes a few seconds)",
+                        icon="VIEWZOOM")
+        layout.operator("mhst2_import.mhst2_extract_arc_dependencies",
+                        text="Extract a single map or model with the files it needs",
+                        icon="IMPORT")
+        layout.operator("mhst2_import.mhst2_verify_arc",
+                        text="Verify the unpacked game, and extract again the missing or damaged files",
+                        icon="CHECKMARK")
 
 
 class MHST2_import_menu(bpy.types.Menu):
@@ -143,6 +208,9 @@ def register():
     bpy.utils.register_class(MHST2_IMPORT_PT_IprSettingPanel_2)
     bpy.utils.register_class(MHST2_IMPORT_PT_LmtSettingPanel_1)
     bpy.utils.register_class(MHST2_ArcExtract)
+    bpy.utils.register_class(MHST2_ArcIndex)
+    bpy.utils.register_class(MHST2_ArcExtractDependencies)
+    bpy.utils.register_class(MHST2_ArcVerify)
     bpy.utils.register_class(MHST2_import_menu)
     bpy.types.TOPBAR_MT_file_import.append(MHST2_menu_func_import)
     pass
@@ -161,6 +229,9 @@ def unregister():
     bpy.utils.unregister_class(MHST2_IMPORT_PT_IprSettingPanel_2)
     bpy.utils.unregister_class(MHST2_IMPORT_PT_LmtSettingPanel_1)
     bpy.utils.unregister_class(MHST2_ArcExtract)
+    bpy.utils.unregister_class(MHST2_ArcIndex)
+    bpy.utils.unregister_class(MHST2_ArcExtractDependencies)
+    bpy.utils.unregister_class(MHST2_ArcVerify)
     bpy.utils.unregister_class(MHST2_import_menu)
     bpy.types.TOPBAR_MT_file_import.remove(MHST2_menu_func_import)
     pass
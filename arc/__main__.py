@@ -0,0 +1,130 @@
+# Headless arc tools, run from the addon folder without blender:
+#   python -m arc extract <installation path> <output path> [--workers N] [--include-path GLOB] [--format pack] ...
+#   python -m arc index <installation path> <output path>
+#   python -m arc dependencies <installation path> <output path> <asset path>
+#   python -m arc verify <installation path> <output path> [--deep] [--no-repair]
+#   python -m arc repack <installation path> <output path> <modded path>
+#   python -m arc benchmark <work path> [--arc-files N] [--entries N] [--entry-size BYTES] [--regenerate] [--output FILE]
+import os
+import sys
+import argparse
+
+import logging
+logger = logging.getLogger("mhst2_import")
+
+from .arc_parser import extract_arcs, ArcFilter
+from .arc_index import build_arc_index, open_arc_index, ARC_INDEX_FILENAME
+from .arc_dependencies import extract_dependencies
+from .arc_verify import verify_extraction
+from .arc_pack import build_arc_pack
+from .arc_repack import repack_arcs
+from .arc_benchmark import run_benchmark
+from .arc_parser import write_json_file
+
+def add_path_arguments(parser):
+    parser.add_argument("installation_path", help="Folder where the game is installed (the one containing the .exe of the game)")
+    parser.add_argument("output_path", help="Folder where the game is unpacked")
+    parser.add_argument("--workers", type=int, default=min(os.cpu_count() or 1, 8), help="Number of arc files processed in parallel")
+
+def add_filter_arguments(parser):
+    parser.add_argument("--include-path", action="append", default=[], help="Only extract the files matching this glob (e.g. stage/**), can be repeated")
+    parser.add_argument("--exclude-path", action="append", default=[], help="Don't extract the files matching this glob, can be repeated")
+    parser.add_argument("--include-class", action="append", default=[], help="Only extract the files of this resource class (e.g. rModel) or extension (e.g. .tex), can be repeated")
+    parser.add_argument("--exclude-class", action="append", default=[], help="Don't extract the files of this resource class or extension, can be repeated")
+
+def get_arc_filter(args):
+    return ArcFilter(
+        include_paths=args.include_path,
+        exclude_paths=args.exclude_path,
+        include_classes=args.include_class,
+        exclude_classes=args.exclude_class,
+    )
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m arc", description="Monster Hunter Stories 2 arc tools")
+    parser.add_argument("--log-level", default="INFO", choices=["DEBUG", "INFO", "WARNING", "ERROR"])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    extract_parser = subparsers.add_parser("extract", help="Unpack the game archives")
+    add_path_arguments(extract_parser)
+    add_filter_arguments(extract_parser)
+    extract_parser.add_argument("--format", default="loose", choices=["loose", "pack", "pack-uncompressed"], help="Extract the files one by one (loose), or store them in a few pack files, compressed as in the archives or not")
+    extract_parser.add_argument("--dedup", action="store_true", help="Store identical files once, the extracted files are hardlinks to them")
+    extract_parser.add_argument("--link-loose-files", action="store_true", help="Link the files that are not in an archive (reflink, or hardlink) instead of copying them")
+
+    index_parser = subparsers.add_parser("index", help="Index the game archives")
+    add_path_arguments(index_parser)
+
+    dependencies_parser = subparsers.add_parser("dependencies", help="Extract a .ipr or .mod file and the files it needs")
+    add_path_arguments(dependencies_parser)
+    dependencies_parser.add_argument("asset_path", help="Path of the asset inside the game archives (e.g. stage/.../v01_00.ipr)")
+
+    verify_parser = subparsers.add_parser("verify", help="Check the extracted files against the game archives, and extract again the bad ones")
+    add_path_arguments(verify_parser)
+    add_filter_arguments(verify_parser)
+    verify_parser.add_argument("--deep", action="store_true", help="Inflate the archived files again and compare their content, not only their size")
+    verify_parser.add_argument("--no-repair", action="store_true", help="Only report the missing or damaged files")
+
+    repack_parser = subparsers.add_parser("repack", help="Put modified files back in copies of the game archives")
+    repack_parser.add_argument("installation_path", help="Folder where the game is installed (the one containing the .exe of the game)")
+    repack_parser.add_argument("output_path", help="Folder where the repacked arc files are written, at the same place as in the installation folder")
+    repack_parser.add_argument("modded_path", help="Folder holding the modified files, laid out as in the unpacked game (e.g. <modded path>/mod/em/.../em000.mod)")
+    repack_parser.add_argument("--workers", type=int, default=min(os.cpu_count() or 1, 8), help="Number of files compressed in parallel")
+
+    benchmark_parser = subparsers.add_parser("benchmark", help="Time the extraction on synthetic encrypted archives, no game data needed")
+    benchmark_parser.add_argument("work_path", help="Folder where the synthetic archives are generated (and kept for the next runs) and extracted")
+    benchmark_parser.add_argument("--arc-files", type=int, default=4, help="Number of synthetic arc files")
+    benchmark_parser.add_argument("--entries", type=int, default=1000, help="Number of entries of each arc file (at most 65535)")
+    benchmark_parser.add_argument("--entry-size", type=int, default=32*1024, help="Average size of the entries, in bytes")
+    benchmark_parser.add_argument("--repeat", type=int, default=3, help="Number of runs of each benchmark")
+    benchmark_parser.add_argument("--fetch-count", type=int, default=100, help="Number of entries read one by one")
+    benchmark_parser.add_argument("--unencrypted", action="store_true", help="Generate plain ARC files instead of encrypted ones")
+    benchmark_parser.add_argument("--workers", type=int, default=min(os.cpu_count() or 1, 8), help="Number of arc files processed in parallel")
+    benchmark_parser.add_argument("--regenerate", action="store_true", help="Generate the synthetic archives again, as in a fresh work folder, instead of reusing them")
+    benchmark_parser.add_argument("--output", default=None, help="JSON file receiving the results (default: benchmark_results.json in the work folder)")
+
+    args = parser.parse_args(argv)
+    if args.command == "benchmark" and not 0 < args.entries <= 65535:
+        parser.error("--entries must be between 1 and 65535")
+
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(levelname)s | %(message)s'))
+    logger.addHandler(handler)
+    logger.setLevel(args.log_level)
+    logger.propagate = False
+
+    if args.command == "benchmark":
+        os.makedirs(args.work_path, exist_ok=True)
+        results = run_benchmark(args.work_path, args.arc_files, args.entries, args.entry_size, max(1, args.workers), max(1, args.repeat), args.fetch_count, not args.unencrypted, regenerate=args.regenerate)
+        output = args.output or os.path.join(args.work_path, "benchmark_results.json")
+        write_json_file(output, results, indent="\t")
+        logger.info("Results written to " + output)
+        return 0
+
+    for path in [args.installation_path, args.output_path] + ([args.modded_path] if args.command == "repack" else []):
+        if not os.path.isdir(path):
+            logger.error("Unable to access folder " + str(path))
+            return 1
+
+    if args.command == "extract" and args.format != "loose":
+        build_arc_pack(args.installation_path, args.output_path, worker_count=max(1, args.workers), arc_filter=get_arc_filter(args), compress=args.format == "pack")
+    elif args.command == "extract":
+        extract_arcs(args.installation_path, args.output_path, worker_count=args.workers, arc_filter=get_arc_filter(args), dedup=args.dedup, link_loose_files=args.link_loose_files)
+    elif args.command == "index":
+        build_arc_index(args.installation_path, os.path.join(args.output_path, ARC_INDEX_FILENAME), max(1, args.workers))
+    elif args.command == "dependencies":
+        index = open_arc_index(os.path.join(args.output_path, ARC_INDEX_FILENAME), args.installation_path, max(1, args.workers))
+        try:
+            extract_dependencies(index, args.asset_path, args.output_path)
+        finally:
+            index.close()
+    elif args.command == "verify":
+        summary = verify_extraction(args.installation_path, args.output_path, worker_count=max(1, args.workers), arc_filter=get_arc_filter(args), deep=args.deep, repair=not args.no_repair)
+        if summary["bad_files"] > 0 and args.no_repair:
+            return 2
+    elif args.command == "repack":
+        repack_arcs(args.installation_path, args.modded_path, args.output_path, worker_count=max(1, args.workers))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+import os
+import zlib
+import json
+import time
+import shutil
+import platform
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+import logging
+logger = logging.getLogger("mhst2_import")
+
+from .arc_parser import extract_arcs, find_archived_files, read_arc_entry, write_json_file, fileClassHashes, ArcFilter
+from .arc_repack import write_arc
+
+BENCHMARK_CONFIG_FILENAME = "benchmark_config.json"
+# Resource classes of the synthetic entries, the filtered extraction keeps the first one
+BENCHMARK_CLASSES = ["rTexture", "rModel", "rMaterial", "rMotionList"]
+
+def make_benchmark_payload(seed, entry_size):
+    # Pseudo random data compressing about as well as the game files (roughly half their size), the
+    # size varying between half and one and a half entry_size
+    rng = np.random.default_rng(seed)
+    size = int(rng.integers(entry_size//2, entry_size*3//2 + 1))
+    payload = rng.integers(0, 16, size, dtype=np.uint8).tobytes()
+    return zlib.compress(payload), size
+
+def generate_benchmark_game(game_path, arc_file_count, entry_count, entry_size, worker_count=1, encrypt=True, seed=0):
+    # Writes arc_file_count synthetic archives of entry_count entries each, laid out as in the game
+    archive_path = os.path.join(game_path, "nativeDX11x64", "archive")
+    os.makedirs(archive_path, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=max(1, worker_count)) as pool:
+        for arc_i in range(arc_file_count):
+            seeds = [seed*1000003 + arc_i*65536 + entry_i for entry_i in range(entry_count)]
+            payloads = pool.map(make_benchmark_payload, seeds, [entry_size]*entry_count)
+            entries = []
+            for entry_i, (payload, size) in enumerate(payloads):
+                file_path = "bench/a" + str(arc_i).zfill(2) + "/d" + str(entry_i//100).zfill(3) + "/f" + str(entry_i).zfill(5)
+                class_hash = fileClassHashes[BENCHMARK_CLASSES[entry_i%len(BENCHMARK_CLASSES)]]
+                entries.append((file_path, class_hash, payload, size))
+            # Encrypted on this thread only: the extraction timed next forks its workers from this process
+            write_arc(os.path.join(archive_path, "bench" + str(arc_i).zfill(2) + ".arc"), entries, encrypt=encrypt, data_alignment=0x8000, thread_count=1)
+
+def time_runs(function, repeat, setup=None):
+    # Seconds of each run of function, and what its last run returned
+    seconds = []
+    result = None
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start_time = time.perf_counter()
+        result = function()
+        seconds.append(time.perf_counter() - start_time)
+    return seconds, result
+
+def summarize_runs(seconds, **values):
+    summary = {"seconds": seconds, "best": min(seconds), "median": float(np.median(seconds))}
+    summary.update(values)
+    return summary
+
+def run_benchmark(work_path, arc_file_count=4, entry_count=1000, entry_size=32*1024, worker_count=1, repeat=3, fetch_count=100, encrypt=True, seed=0, regenerate=False):
+    # Times the listing, the full and filtered extractions and single entry reads over synthetic
+    # archives generated in work_path (kept between runs with the same settings, unless regenerate).
+    # Returns the results.
+    config = {"arc_files": arc_file_count, "entries": entry_count, "entry_size": entry_size, "encrypted": encrypt, "seed": seed}
+    game_path = os.path.join(work_path, "game")
+    config_path = os.path.join(game_path, BENCHMARK_CONFIG_FILENAME)
+    previous_config = None
+    if os.path.isfile(config_path):
+        with open(config_path, "r") as json_in:
+            previous_config = json.load(json_in)
+    if previous_config != config or regenerate:
+        logger.info("Generating " + str(arc_file_count) + " arc files of " + str(entry_count) + " entries.")
+        shutil.rmtree(game_path, ignore_errors=True)
+        start_time = time.perf_counter()
+        generate_benchmark_game(game_path, arc_file_count, entry_count, entry_size, worker_count, encrypt, seed)
+        logger.info("Generated in " + str(round(time.perf_counter() - start_time, 1)) + "s.")
+        write_json_file(config_path, config)
+    arc_bytes = sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(game_path) for name in names if name.endswith(".arc"))
+
+    results = {
+        "config": dict(config, workers=worker_count, repeat=repeat),
+        "environment": {"python": platform.python_version(), "numpy": np.__version__, "platform": platform.platform(), "cpu_count": os.cpu_count()},
+        "arc_bytes": arc_bytes,
+        "benchmarks": {},
+    }
+    benchmarks = results["benchmarks"]
+
+    seconds, archived_files = time_runs(lambda: find_archived_files(game_path, worker_count), repeat)
+    benchmarks["list"] = summarize_runs(seconds, files=len(archived_files))
+
+    extraction_path = os.path.join(work_path, "extraction")
+    def clear_extraction():
+        # Every run extracts everything again
+        shutil.rmtree(extraction_path, ignore_errors=True)
+        os.makedirs(extraction_path)
+    arc_filters = {"extract": None, "extract_filtered": ArcFilter(include_classes=[BENCHMARK_CLASSES[0]])}
+    for name, arc_filter in arc_filters.items():
+        seconds, summary = time_runs(lambda: extract_arcs(game_path, extraction_path, worker_count, arc_filter), repeat, clear_extraction)
+        benchmarks[name] = summarize_runs(seconds, files=summary["written_files"], written_bytes=summary["written_bytes"], read_bytes=summary["read_bytes"], read_mb_per_s=summary["read_bytes"]/1e6/max(min(seconds), 1e-6), stages=summary["stages"])
+    shutil.rmtree(extraction_path, ignore_errors=True)
+
+    rng = np.random.default_rng(seed)
+    paths = sorted(archived_files)
+    fetched_paths = [paths[i] for i in rng.choice(len(paths), min(fetch_count, len(paths)), replace=False)]
+    seconds, fetched_bytes = time_runs(lambda: sum(len(read_arc_entry(archived_files[path]["arc_file"], archived_files[path])) for path in fetched_paths), repeat)
+    benchmarks["fetch"] = summarize_runs(seconds, files=len(fetched_paths), fetched_bytes=fetched_bytes, best_per_file=min(seconds)/max(1, len(fetched_paths)))
+
+    for name, benchmark in benchmarks.items():
+        logger.info(name + ": best " + str(round(benchmark["best"], 3)) + "s, median " + str(round(benchmark["median"], 3)) + "s (" + str(benchmark["files"]) + " files)")
+    return results
@@ -0,0 +1,85 @@
+import os
+import json
+
+import logging
+logger = logging.getLogger("mhst2_import")
+
+from .arc_parser import read_arc_entry, extract_arc_entries, write_json_file
+try:
+    from ..ipr.ipr_parser import IprParser
+    from ..mrl.mrl_parser import MrlParser
+except ImportError:
+    # Running headless (python -m arc from the addon folder), where arc is the top-level package
+    from ipr.ipr_parser import IprParser
+    from mrl.mrl_parser import MrlParser
+
+def strip_extension(path):
+    return ".".join(path.split(".")[:-1])
+
+def find_clc_file(index, mrl_path):
+    # Same lookup order as load_mrl: next to the .mrl, below it, then anywhere below its parent
+    directory = os.path.dirname(mrl_path)
+    clc_files = index.list_directory(directory, ".clc")
+    if len(clc_files) == 0:
+        clc_files = index.list_directory(directory, ".clc", recursive=True)
+    if len(clc_files) == 0:
+        clc_files = index.list_directory(os.path.dirname(directory), ".clc", recursive=True)
+    if len(clc_files) == 0:
+        return None
+    return sorted(clc_files, key=len)[0]
+
+def find_dependencies(index, root_path):
+    # Closure of the files an import of root_path (a .ipr or a .mod) reads: the objects of an ipr,
+    # the .mrl next to each .mod, the textures of each material and the extra colors .clc file
+    root_path = root_path.replace("\\", "/")
+    dependencies = {}
+    pending = [root_path]
+    while len(pending) > 0:
+        path = pending.pop()
+        if path in dependencies:
+            continue
+        file_info = index.lookup(path)
+        dependencies[path] = file_info
+        if file_info is None:
+            logger.warning("Dependency " + path + " not found in the game archives")
+            continue
+
+        extension = file_info["extension"]
+        try:
+            if extension == ".ipr":
+                parser = IprParser(path=path, data=read_arc_entry(file_info["arc_file"], file_info))
+                for obj_instance in parser.read():
+                    pending.append(obj_instance["path"] + ".mod")
+            elif extension == ".mod":
+                mrl_path = strip_extension(path) + ".mrl"
+                if mrl_path in index:
+                    pending.append(mrl_path)
+            elif extension == ".mrl":
+                parser = MrlParser(path=path, data=read_arc_entry(file_info["arc_file"], file_info))
+                for material in parser.read().values():
+                    for texture_path in material["textures"].values():
+                        if texture_path is not None:
+                            pending.append(texture_path.replace("\\", "/") + ".tex")
+                clc_path = find_clc_file(index, path)
+                if clc_path is not None:
+                    pending.append(clc_path)
+        except Exception as e:
+            logger.warning("Could not read the dependencies of " + path + " (exception=" + str(e) + ")")
+    return {path: file_info for path, file_info in dependencies.items() if file_info is not None}
+
+def extract_dependencies(index, root_path, extraction_path, overwrite=False):
+    dependencies = find_dependencies(index, root_path)
+    logger.info("Extracting " + str(len(dependencies)) + " files needed by " + root_path + ".")
+
+    file_infos = list(dependencies.values())
+    if not overwrite:
+        file_infos = [file_info for file_info in file_infos if not os.path.exists(os.path.join(extraction_path, file_info["file_path"] + file_info["extension"]))]
+    extract_arc_entries(file_infos, extraction_path)
+
+    file_list_path = os.path.join(extraction_path, "file_list.json")
+    file_list = set(file_info["file_path"] + file_info["extension"] for file_info in dependencies.values())
+    if os.path.isfile(file_list_path):
+        with open(file_list_path, "r") as json_in:
+            file_list.update(json.load(json_in))
+    write_json_file(file_list_path, sorted(file_list), indent="\t")
+    return sorted(dependencies.keys())
@@ -0,0 +1,527 @@
+# Resource classes of the game: jamcrc of the class name (the hash stored in the arc TOC) -> (class
+# name, file extension). The hashes are precomputed so that loading the addon doesn't compute them.
+ARC_FILE_TYPES = {
+    0x1b883c38: ("rBattleBinary", ".btb"),
+    0x37cba824: ("rBattleCutCmdData", ".bccmd"),
+    0x19cbc725: ("rBattleSelectSetData", ".bsset"),
+    0x16775764: ("rAgingFieldPatrolDataNative", ".afpd"),
+    0x10a9b96b: ("rTalkDemoCut", ".cut"),
+    0x5b9300cb: ("rTalkDemoSound", ".tsnd"),
+    0x2b73db4a: ("rTalkDemoWorkOriginInfo", ".work"),
+    0x763119dc: ("rTalkDemoObjInitPos", ".pos"),
+    0x0b25c4b5: ("rFieldEnemyDefaultAifsmDataNaitive", ".fedad"),
+    0x125e09bd: ("rFieldConnectionInfoNative", ".fci"),
+    0x10a7bb93: ("rFieldPartsInfoNative", ".fpi"),
+    0x445f93c9: ("rFieldPartsLayoutNative", ".fpl"),
+    0x62711a14: ("rTraceSonarNative", ".ts"),
+    0x666f5559: ("rFieldPlacementObjectSetNative", ".fpos"),
+    0x790f56de: ("rFieldCamOption", ".fco"),
+    0x51a88271: ("rDungeonInfoListNative", ".dai"),
+    0x18c80d7a: ("rFieldNpcNekoTaxiList", ".fntl"),
+    0x1d8cc9b7: ("rFieldObjectList", ".fol"),
+    0x3c6f8994: ("rFieldCamera", ".fcr"),
+    0x5dcea23f: ("rOccluder2Native", ".occ2"),
+    0x101b237c: ("rInstanceDrawDistance", ".idd"),
+    0x50475e5b: ("rIDColor", ".idcol"),
+    0x5554b934: ("rInstancePlacement", ".ipr"),
+    0x0ad816b6: ("rPlayerMoveConfigData", ".pmc"),
+    0x12e98c07: ("rSoundGuiSe", ".sgs"),
+    0x5ea465eb: ("rSoundParamOffsetControl", ".spoc"),
+    0x5842f0b0: ("rSoundPelTiedSe", ".pts"),
+    0x3c14d076: ("rSoundAreaReverb", ".sar"),
+    0x783fe90c: ("rSoundSystemSetting", ".sss"),
+    0x1657a2d0: ("rSoundPronounceList", ".sptl"),
+    0x74de10e5: ("rEnaJoinProgressDataNative", ".ejpd"),
+    0x1762062b: ("rKizunaLvProgressDataNative", ".klpd"),
+    0x7a09dd6f: ("rReusJoinProgressDataNative", ".rjpd"),
+    0x31fde194: ("rFieldDirectionInfoNative", ".fdi"),
+    0x5e96db96: ("rAgingBtlBuddyTableNative", ".abbt"),
+    0x01a40b82: ("rAgingBtlEnemySetTableNative", ".abest"),
+    0x1f590daf: ("rAgingBtlStageTableNative", ".abst"),
+    0x037ffa39: ("rAgingCheckBuddyNative", ".acb"),
+    0x4fba8f45: ("rAgingCheckEnaLayArmorNative", ".acela"),
+    0x4eac1f02: ("rAgingCheckNaviAccesoryNative", ".acna"),
+    0x2b84e1a5: ("rAgingCheckPlArmorNative", ".acpa"),
+    0x30636087: ("rAgingCheckWeaponNative", ".acwp"),
+    0x7dbe0d1c: ("rAgingFieldTableNative", ".aft"),
+    0x21c6046e: ("rCheatCheckTableItemBattleNative", ".cctib"),
+    0x26329cc2: ("rCheatCheckTableWeaponBowNative", ".cctbw"),
+    0x73982d73: ("rCheatCheckTableWeaponGunNative", ".cctgn"),
+    0x5a24dd60: ("rDoubleKizunaCameraOffsetNative", ".bdkc"),
+    0x573d6a94: ("rDoubleKizunaMonsterConditionNative", ".bdkmc"),
+    0x4d14d010: ("rDoubleKizunaMonsterOffsetNative", ".bdkm"),
+    0x33fcb6ea: ("rDoubleKizunaSchedulerPathNative", ".bdkd"),
+    0x3c52bc0c: ("rActionCommandDelayTimeDataNative", ".acdd"),
+    0x7a7a0918: ("rAnimationSecondParamNative", ".asp"),
+    0x58ec7a6f: ("rGuiClearedDungeonItemParamNative", ".cdi"),
+    0x407448e4: ("rGuiColorDataNative", ".gcol"),
+    0x77426bf0: ("rGuiFadeDataNative", ".gfad"),
+    0x28f2c1ec: ("rGuiHatchBabyParamNative", ".ghbp"),
+    0x696c1e0d: ("rGuiModelDrawCameraParamNative", ".gmdc"),
+    0x625a3a47: ("rGuiModelDrawWindowParamNative", ".gmdw"),
+    0x12402250: ("rGuiMonsterModelParamNative", ".gmmp"),
+    0x6130bc1d: ("rGuiMultiVsPlayerParamNative", ".gmvp"),
+    0x09481374: ("rGuiNpcModelParamNative", ".gnpc"),
+    0x28aa3e01: ("rGuiParamNative", ".gpm"),
+    0x7d640e1f: ("rGuiRiderCardBuddyParamNative", ".grcb"),
+    0x173b3f48: ("rGuiStatusPlayerParamNative", ".gspp"),
+    0x0733327e: ("rGuiTraditionBuddyParamNative", ".gtbp"),
+    0x7913dbfe: ("rGuiWeaponModelParamNative", ".gwmp"),
+    0x7a5067af: ("rAchievementIconNative", ".aic"),
+    0x39d627d8: ("rCommandIconNative", ".cic"),
+    0x266af93d: ("rIconStatusDataNative", ".isd"),
+    0x1b00e427: ("rItemIconNative", ".iic"),
+    0x5a5f6394: ("rMonsterIconNative", ".mic"),
+    0x4a964019: ("rSkillIconNative", ".sic"),
+    0x2eb8b01e: ("rDramaMessageDataNative", ".drmd"),
+    0x402e3fc6: ("rFieldCommonMessageDataNative", ".fcmd"),
+    0x16c480a2: ("rGameMessageDataNative", ".grmd"),
+    0x27e64187: ("rNpcMessageDataNative", ".ntlkd"),
+    0x68f1827c: ("rTalkMessageDataNative", ".tlkd"),
+    0x61e4cc9b: ("rOptionKeyConfigButtonDataNative", ".okbd"),
+    0x53949dd5: ("rOptionKeyConfigDataNative", ".okd"),
+    0x23158686: ("rOptionKeyConfigKeyboardDataNative", ".okkd"),
+    0x29655734: ("rOptionLanguageDataNative", ".lad"),
+    0x057c6d7d: ("rOptionParamDataNative", ".opd"),
+    0x3a19c551: ("rOptionSettingDataNative", ".osd"),
+    0x60f5ffc4: ("rAmiiboGiftNative", ".agt"),
+    0x6bdca211: ("rBattleBuddyConditionDataNative", ".bbcnd"),
+    0x6f4e17a0: ("rBattleCmdCameraDataNative", ".bccam"),
+    0x186248a2: ("rBattleCmdIgnoreEnemyDataNative", ".bcige"),
+    0x64f03df3: ("rBattleEffHitInfoDataNative", ".behi"),
+    0x7e70da14: ("rBattleEnemyMCTblNative", ".bemct"),
+    0x3fba418f: ("rBattleEventResourceDataNative", ".bert"),
+    0x4ab3732a: ("rBattleEventResultDataNative", ".berd"),
+    0x1e7613e9: ("rBattleEventTblNative", ".bet"),
+    0x6539b0cf: ("rBattleMorphChangeDataNative", ".bmcd"),
+    0x632e29ae: ("rBattleMorphConditionDataNative", ".bmcnd"),
+    0x06a2a153: ("rBattleNavirouFsmTableNative", ".bnft"),
+    0x6dc15937: ("rBattleNavirouMessageNative", ".bnmt"),
+    0x61e05d38: ("rBattleNavirouSetTableNative", ".bnst"),
+    0x35dc8912: ("rBattleNavirouUniqueNative", ".bnut"),
+    0x0b5594ef: ("rBattlePartsConditionDataNative", ".bptcnd"),
+    0x0234545c: ("rBCATAppDataNative", ".bcatData"),
+    0x775141a7: ("rBingoBonusCategoryNative", ".bbc"),
+    0x463a19d2: ("rBreakFieldObjectDataNative", ".bfofd"),
+    0x6ef66649: ("rBuddyBtlMCDataNative", ".bdbcm"),
+    0x06cbc2af: ("rCharaCustomLogDataNative", ".chcl"),
+    0x04b7e501: ("rCharaRemakeTicketDataNative", ".crd"),
+    0x078dcd77: ("rDemoGalleryDataNative", ".dgd"),
+    0x235ef471: ("rDifficultyConvertCountNative", ".dcc"),
+    0x560f4efe: ("rDifficultyConvertGameFlagNative", ".dcgf"),
+    0x5b062235: ("rDLCAppDataNative", ".dlcData"),
+    0x36ffe6a5: ("rDLCViewDataNative", ".dlcView"),
+    0x6a8232e0: ("rDungeonChestLotTableNative", ".dclt"),
+    0x450ef4f9: ("rDungeonContainsDataNative", ".dcd"),
+    0x28ef4ab5: ("rDungeonCreatePatternNative", ".dcp"),
+    0x7f924054: ("rDungeonEggMonsterDataNative", ".demd"),
+    0x10207017: ("rDungeonEnemyFixedDataNative", ".defd"),
+    0x7990c468: ("rDungeonEnemyHomingDataNative", ".deh"),
+    0x5370c6b4: ("rDungeonEnemyLocatorDataNative", ".deloc"),
+    0x6d3ba3f2: ("rDungeonEnemyLotDataNative", ".deld"),
+    0x02c110d1: ("rDungeonNestRarenessDataNative", ".dnrd"),
+    0x29326572: ("rEggUniquePatternDataNative", ".eup"),
+    0x724c1f81: ("rEnvCreatureDataNative", ".ecr"),
+    0x04a36671: ("rExpeditionFieldDataNative", ".exfd"),
+    0x611c6b48: ("rExpeditionPolicyDataNative", ".expl"),
+    0x3bc16262: ("rExpeditionSlotNumDataNative", ".esd"),
+    0x756af443: ("rFieldAmbientDataNative", ".fldamb"),
+    0x5441b2f9: ("rFieldPartsDataNative", ".fpd"),
+    0x78b514c3: ("rFieldPartsNameDataNative", ".fldpn"),
+    0x19169e2e: ("rFieldSkyDataNative", ".fldsky"),
+    0x3187a8e3: ("rFieldSpotDataNative", ".flds"),
+    0x282ba529: ("rFixedDungeonConfigDataNative", ".fdcd"),
+    0x774025a0: ("rFortuneGiftNative", ".fgt"),
+    0x3254b136: ("rGeneRandomSetNative", ".grset"),
+    0x3fac66be: ("rGiftBuddyTableNative", ".tgb"),
+    0x4026a46f: ("rGiftEggTableNative", ".tge"),
+    0x08eb942a: ("rGuiFontDataNative", ".fnd"),
+    0x4f58c2ff: ("rGuiFontLanguageDataNative", ".gfld"),
+    0x1c082e56: ("rGuiLocalizeTextureDataNative", ".ltd"),
+    0x7355e446: ("rGuiMessageDataNative", ".msgm"),
+    0x301b1691: ("rGuiWorldMapNative", ".gwm"),
+    0x1821393e: ("rHabitatDataNative", ".hbt"),
+    0x59c9ec08: ("rHardDungeonUIDataNative", ".hdu"),
+    0x5b9eb03f: ("rHatchEggBonusDataNative", ".heb"),
+    0x44c7d091: ("rEditCameraDataNative", ".ecd"),
+    0x15d14528: ("rEditColorPresetDataNative", ".ecp"),
+    0x11486d83: ("rEditEyeShapeDataNative", ".eed"),
+    0x184d9145: ("rEditFaceShapeDataNative", ".efd"),
+    0x0656d874: ("rEditHairstyleDataNative", ".ehd"),
+    0x62c8cfaa: ("rEditMakeupTypeDataNative", ".emad"),
+    0x483e4d9d: ("rEditMouthShapeDataNative", ".emod"),
+    0x31e3f091: ("rEditParamDataNative", ".epd"),
+    0x72e5db76: ("rEditVoiceTypeDataNative", ".evd"),
+    0x76e4ad2a: ("rLinkedDungeonDataNative", ".ldd"),
+    0x3e0193ef: ("rMelynxShopAccessoryDataNative", ".macd"),
+    0x78e0cae8: ("rMelynxShopArmorDataNative", ".mard"),
+    0x0e7173d9: ("rMelynxShopDataNative", ".msp"),
+    0x7eb33de7: ("rMelynxShopWeaponDataNative", ".mwd"),
+    0x33cd0ec5: ("rMenuRiderNoteDataNative", ".mrnd"),
+    0x7e742f6f: ("rModTextureNoScaleDataNative", ".mtnscl"),
+    0x412dc7ea: ("rMonsterAdditionalShowTableNative", ".mas"),
+    0x20098dff: ("rMonsterBaseInfoDataNative", ".mbi"),
+    0x68cd2933: ("rMHSoundEmitter", ".ses"),
+    0x6e171a6e: ("rMHSoundSequence", ".mss"),
+    0x07437cce: ("rSoundAttributeSe", ".aser"),
+    0x538120de: ("rSoundEngine", ".engr"),
+    0x7ed4c86c: ("rSoundEngineXml", ".engr.xml"),
+    0x46810940: ("rSoundEngineValue", ".egvr"),
+    0x4ca26828: ("rSoundMotionSe", ".mser"),
+    0x271d08fe: ("rSoundSequenceSe", ".ssqr"),
+    0x49b5a885: ("rSoundSimpleCurve", ".sscr"),
+    0x6e402c69: ("rSoundSubMixerXml", ".smxr.xml"),
+    0x30fc745f: ("rSoundSubMixer", ".smxr"),
+    0x5a11b83a: ("uSoundSubMixer::CurrentSubMixer", ".smxr"),
+    0x6d1e7044: ("rMonsterPartsTableNative", ".mpt"),
+    0x2aa25c85: ("rNavirouGuideDataNative", ".ngt"),
+    0x0998ee97: ("rNpc2dFaceTexTableNative", ".nft"),
+    0x5f082723: ("rNpcAirouSetMotionDataNative", ".nasmd"),
+    0x7bd0ca86: ("rNpcLayeredArmorDataNative", ".nlad"),
+    0x1aaed135: ("rNpcSetMotionDataNative", ".nsmd"),
+    0x6306d6bd: ("rNpcTalkResourceDataNative", ".ntrp"),
+    0x3095892d: ("rNpcTalkZoneNative", ".ntz"),
+    0x4007c0e2: ("rPotEffectDataNative", ".pte"),
+    0x5bb9fa2d: ("rPotLevelDataNative", ".ptl"),
+    0x794decfd: ("rPotOfferingDataNative", ".pto"),
+    0x7eac0281: ("rPotPrayingDataNative", ".ptp"),
+    0x11fedaca: ("rPresetParamCharaCustomNative", ".tppcc"),
+    0x19728e41: ("rPresetParamLearningSkillSetNative", ".tppls"),
+    0x748cd103: ("rPresetParamOtomonNative", ".tppo"),
+    0x42758339: ("rPresetParamOtomonGeneNative", ".tppog"),
+    0x642ea19e: ("rRiderNoteDataRushNative", ".rndr"),
+    0x79df35d6: ("rRideSkillTableNative", ".rst"),
+    0x1c1a9e75: ("rSkillCalcNative", ".skc"),
+    0x31ad60f1: ("rSkillSetDataNative", ".wss"),
+    0x5dacbe91: ("rStableCapacityDataNative", ".scd"),
+    0x0bc2a5d1: ("rStatusChangeFlagsNative", ".scf"),
+    0x74eb7ad0: ("rStatusDataNative", ".sdt"),
+    0x42cb8e44: ("rStoryQuestDataNative", ".sqd"),
+    0x494935a5: ("rStoryQuestDefineNative", ".sqdf"),
+    0x436fd8ed: ("rSubQuestConditionDataNative", ".sqccd"),
+    0x625ed01e: ("rSubQuestDataRenewNative", ".suqd"),
+    0x29da6d56: ("rSubQuestVeilDataNative", ".svd"),
+    0x33c9fcc8: ("rSubstituteNpcTblNative", ".sntt"),
+    0x5cf2ed04: ("rSummaryDataNative", ".smr"),
+    0x55569aa8: ("rTalkDemoDefineDataNative", ".tdmspk"),
+    0x190fee2a: ("rTrialCleanNativeDataNative", ".tcn"),
+    0x161002ed: ("rTutorialArrowDataNative", ".tad"),
+    0x5ad1695d: ("rTutorialLockDataNative", ".tld"),
+    0x0d59f482: ("rVsItemSetDataNative", ".vsitemset"),
+    0x03a1c0b4: ("rVsPrizeDataNative", ".vsprize"),
+    0x4860c9d3: ("rVsRuleDataNative", ".vsrule"),
+    0x2773ee01: ("rSoundDemoControlNative", ".sdc"),
+    0x00311b28: ("rSoundDemoEnvControlNative", ".sdec"),
+    0x78b0dd5a: ("rSoundDemoSeControlNative", ".sdsc"),
+    0x652a9d2a: ("rSoundGuiOperationNative", ".sgo"),
+    0x4223a8d7: ("rSoundInfoSeNative", ".siet"),
+    0x5d2bc52b: ("rSoundInfoStreamNative", ".siets"),
+    0x46b4bb18: ("rSoundArchiveDataNative", ".samd"),
+    0x3077b6c2: ("rSoundArmorDataNative", ".sad"),
+    0x77f07a53: ("rSoundBattleStageDataNative", ".sbsd"),
+    0x761a320d: ("rSoundBattleStageDefineNative", ".sbsdef"),
+    0x647f6826: ("rSoundBgmMonsterDataNative", ".sbmd"),
+    0x687d3b6c: ("rSoundFootstepDataNative", ".sftd"),
+    0x0e67c162: ("rSoundFSMCommandBgmDataNative", ".sfcbd"),
+    0x63da3782: ("rSoundFSMCommandSeDataNative", ".sfcsd"),
+    0x6625f2e3: ("rSoundMonsterDataNative", ".smd"),
+    0x536d72d2: ("rSoundMonsterEnvironmentalDataNative", ".smed"),
+    0x6d77caea: ("rSoundMonsterKizunaDataNative", ".smkd"),
+    0x79fd8e53: ("rSoundNpcAirouDataNative", ".snad"),
+    0x782288cf: ("rSoundNpcDataNative", ".snd"),
+    0x0436326c: ("rSoundObjectDataNative", ".sod"),
+    0x4d97e624: ("rSoundSceneVolumeNative", ".ssv"),
+    0x2540634d: ("rSoundWeaponDataNative", ".swd"),
+    0x1b2a7235: ("rSoundNpcVoicePathDataNative", ".snvpd"),
+    0x7e6f48c2: ("rSoundPlayerVoicePathDataNative", ".spvpd"),
+    0x0e3fc0e5: ("rUnlockMixDataNative", ".ulm"),
+    0x0edcd859: ("rUnlockProgressDataNative", ".ulp"),
+    0x1431f1b8: ("rUnlockScriptDataNative", ".uls"),
+    0x3366f207: ("rFacialPartsComboNative", ".fpc"),
+    0x27662fae: ("rFacialPartsControl", ".fpctl"),
+    0x1296f4c9: ("rObjectModelAttachGroupNative", ".omg"),
+    0x0b9a0d12: ("rObjectModelAttachInfoNative", ".omi"),
+    0x2deb5f94: ("rObjectModelAttachSetData", ".omas"),
+    0x0f43f1a7: ("rMonsterLookAtParamNative", ".mlka"),
+    0x1b028405: ("rKizunaStoneOfsNative", ".kofb"),
+    0x116eb840: ("rWeaponKindOfsNative", ".wko"),
+    0x286d5fb5: ("uSceneCapture::rCaptureTexture", ".tex"),
+    0x21976a47: ("cInstancingResource", ".ext"),
+    0x29bcebba: ("rCheatCheckTableAccSkillNative", ".cctas"),
+    0x33fad761: ("rCheatCheckTableArmorNative", ".ccta"),
+    0x3b0a54ee: ("rCheatCheckTableBuddyNative", ".cctb"),
+    0x07fa7e9b: ("rCheatCheckTableBuddyFlagNative", ".cctbf"),
+    0x1c7e2497: ("rCheatCheckTableGeneNative", ".cctg"),
+    0x28017861: ("rCheatCheckTableNaviAccNative", ".cctna"),
+    0x0066ca70: ("rCheatCheckTableRangeNative", ".cctr"),
+    0x6538c7ee: ("rCheatCheckTableWeaponHamNative", ".ccthm"),
+    0x2e26b658: ("rCheatCheckTableWeaponHueNative", ".ccthu"),
+    0x6b96f6ec: ("rCheatCheckTableWeaponOneNative", ".cctwo"),
+    0x02875f0e: ("rCheatCheckTableWeaponTwoNative", ".cctwt"),
+    0x1075ba2a: ("rBattleArenaDLCTableNative", ".badt"),
+    0x74e54f38: ("rBattleArenaTrialTableNative", ".batt"),
+    0x6b203580: ("rBattleNaviTextEventNative", ".bte"),
+    0x639890f3: ("rBattleStatusEffectNative", ".bseff"),
+    0x32076cdc: ("rBattleVsPorchPresetNative", ".bvspp"),
+    0x11d02a25: ("rDLCItemTableNative", ".ditemp"),
+    0x06d5bfea: ("rDLCRegionTnmntTableNative", ".dtnmt"),
+    0x54521303: ("rDLCSubQuestDataNative", ".dsuqd"),
+    0x2f30e0cc: ("rDLCVsRuleTableNative", ".dvsrule"),
+    0x601bfdf2: ("rEnemyCameraParamNative", ".ecpd"),
+    0x5d7177c7: ("rLimitedShopDataNative", ".lshpd"),
+    0x4a8aeaf9: ("rLimitedShopPlaceDataNative", ".lshppd"),
+    0x5a002f31: ("rLinkPrizeDataNative", ".lpd"),
+    0x7f69bc1c: ("rMedalCompRewardNative", ".mcr"),
+    0x19283bb2: ("rMonsterEnumConversionTableNative", ".mectd"),
+    0x43bbf87c: ("rNavirouAccessoryDataNative", ".nad"),
+    0x1d17ecf4: ("rNestEggReviewANative", ".nstera"),
+    0x2cfff669: ("rNestEggReviewBNative", ".nsterb"),
+    0x61708880: ("rNestMessageNative", ".nstmsg"),
+    0x58599f3d: ("rOtomonCameraParamNative", ".ocpd"),
+    0x691b82b3: ("rPostmanRewardDataNative", ".pmrd"),
+    0x06a7028b: ("rStaffRollCutDataNative", ".srcd"),
+    0x591c06bf: ("rWorldMapMaskDataNative", ".wmmd"),
+    0x1172dadc: ("rTalkDemoViewSpriteDataNative", ".tdvs"),
+    0x6a89dec9: ("rArmorParamNative", ".arp"),
+    0x12d2a5c1: ("rDLCTableNative", ".dlc"),
+    0x19059f4c: ("rMedalDataListNative", ".mdl"),
+    0x7aec2c77: ("rMyhouseBoxCameraDataNative", ".mbcd"),
+    0x5abe83bd: ("rStoryTalkBalloonNative", ".stb"),
+    0x1c87ef02: ("rWeaponParamNative", ".wpp"),
+    0x6b592357: ("rBattleEnemyFileNative", ".bef"),
+    0x11659f42: ("rConditionPriorityDataNative", ".cndp"),
+    0x1d7cc46e: ("rGatherLevelTableNative", ".ghlt"),
+    0x5a7a72de: ("rLimitedShopNpcList", ".lsnl"),
+    0x3479a5c2: ("rMonsterBookDataNative", ".mbd"),
+    0x0da676a1: ("rPresetParamNative", ".tpp"),
+    0x0e308eac: ("rPresetParamEquipNative", ".tppe"),
+    0x74652852: ("rPresetParamItemNative", ".tppi"),
+    0x406e4fbc: ("rPresetParamPlayerNative", ".tppp"),
+    0x643683a4: ("rSkillFlagNative", ".skf"),
+    0x5f6335ed: ("rAppMovie", ".dat"),
+    0x7178c182: ("rAppMovieIntermediate", ".wmv"),
+    0x5664c347: ("rCardPose", ".cps"),
+    0x29a5c1d1: ("rRideParamNative", ".rdp"),
+    0x1d6cab29: ("rSequenceCameraList", ".scl"),
+    0x07bf8c95: ("rResourceNameForDevNative", ".rnmd"),
+    0x494ea0dd: ("rChestItemTableDataNative", ".cfid"),
+    0x0df1e4cd: ("rGatherSetTableDataNative", ".gstd"),
+    0x12935778: ("rFldPlParam_ARNative", ".fppar"),
+    0x54fc5eff: ("rFldPlParam_GRNative", ".fppgr"),
+    0x4bb345d4: ("rFldPlParam_NRNative", ".fppnr"),
+    0x28476fd4: ("rFldPlParam_WRNative", ".fppwr"),
+    0x4b206586: ("rAccessoryDataNative", ".acd"),
+    0x53b0b9bd: ("rAccessoryRareNative", ".acr"),
+    0x3d13cfe8: ("rAccessorySkillNative", ".acs"),
+    0x29a004e2: ("rArmorDataNative", ".ard"),
+    0x5f2290ee: ("rBattleArenaTableNative", ".bat"),
+    0x2303b203: ("rBattleCommonResourceNative", ".bcmr"),
+    0x26fb3d96: ("rBattleEnemySetNative", ".bes"),
+    0x1c6e8bef: ("rBattleEnemyTblNative", ".bemt"),
+    0x2220c447: ("rBattleEnemyTblPlanNative", ".bemtp"),
+    0x4a348080: ("rBattleNpcTblNative", ".bnt"),
+    0x28ed7e01: ("rBattlePlayerTblNative", ".bplt"),
+    0x4ecab145: ("rBattleResultBonusNative", ".brsb"),
+    0x33accaf2: ("rBattleStageResourceNative", ".bstr"),
+    0x5f2e8d28: ("rBattleWeaponTblNative", ".bwpt"),
+    0x6d2d08f8: ("rBroilerFlavorDataNative", ".bfd"),
+    0x6afa7c26: ("rBuddyPathDataNative", ".bdypa"),
+    0x51d84cf7: ("rBuddyPlanDataNative", ".bdypl"),
+    0x54775fd5: ("rCallingEncountDataNative", ".sce"),
+    0x02f8f1f3: ("rConditionNameDataNative", ".cnd"),
+    0x179adabe: ("rDemoDataNative", ".dmd"),
+    0x7100eb09: ("rDemoFlagDataNative", ".dfd"),
+    0x20b4a451: ("rEggBaseColorDataNative", ".ebc"),
+    0x40f45e76: ("rEncntEnemyPartyNative", ".eepd"),
+    0x09dbfb28: ("rEquiprShopDataNative", ".eshd"),
+    0x61765cab: ("rFieldAISetActNative", ".fasa"),
+    0x721b4d01: ("rFieldAISetKindNative", ".fask"),
+    0x3f9e5dfd: ("rFieldEnemyPathDataNative", ".fedpa"),
+    0x04bc6d2c: ("rFieldEnemyPlanDataNative", ".fedpl"),
+    0x38fb2fad: ("rFieldHuntingDataNative", ".fhd"),
+    0x522bb63a: ("rFieldMotionPackageDataNative", ".fmpd"),
+    0x46a2b0ab: ("rFieldNpcMotionNative", ".fnmd"),
+    0x3e063f35: ("rFieldPlayerMotionDataNative", ".fpm"),
+    0x7a69d276: ("rFieldSetFlagDataNative", ".fsfd"),
+    0x1b074932: ("rFurattoFieldDataNative", ".fofd"),
+    0x3252fef2: ("rFurattoTrendDataNative", ".fotd"),
+    0x524f8808: ("rGalleryFlagDataNative", ".gfd"),
+    0x1aefdeba: ("rGatherCommentDataNative", ".gcd"),
+    0x09c7ccf3: ("rGeneEditNative", ".ged"),
+    0x0c59ab00: ("rGeneLottingNative", ".glt"),
+    0x6497d007: ("rGeneralCountDataNative", ".gcd"),
+    0x1fdc33d3: ("rGeneralFlagDataNative", ".gfd"),
+    0x7a197d5b: ("rGeneTableNative", ".gtb"),
+    0x17911a85: ("rItemDataNative", ".itm"),
+    0x74931d0c: ("rItemMixNative", ".mix"),
+    0x74254971: ("rMainQuestDataNative", ".mqsd"),
+    0x50575abf: ("rMapMarkerNative", ".mmk"),
+    0x0199cb45: ("rMarkerDataNative", ".mkr"),
+    0x2a2c6685: ("rMaterialDataNative", ".matd"),
+    0x3565348b: ("rMergeStreamDataNative", ".asd"),
+    0x23bb8b11: ("rMixFlagNative", ".mxf"),
+    0x37e65eaf: ("rMonsterRankTableNative", ".mrt"),
+    0x6a7a1000: ("rNekoTaxiStationDataNative", ".nsd"),
+    0x7afe14f5: ("rNestHappeningNative", ".nhap"),
+    0x65cba083: ("rNestHappeningProbNative", ".nhapp"),
+    0x1fa3ff7a: ("rNpcAirouSetResourceLogDataNative", ".nasl"),
+    0x3876d6fa: ("rNpcSetResourceLogDataNative", ".npsl"),
+    0x34ad0def: ("rReactionCommentDataNative", ".rcd"),
+    0x27257d0a: ("rRiderNoteDataNative", ".rnd"),
+    0x0fbc2f41: ("rRiderNoteLargeCategoryDataNative", ".rnld"),
+    0x14aef07f: ("rRiderNotePageDataNative", ".rnpd"),
+    0x41e7512f: ("rRiderNoteSmallCategoryDataNative", ".rnsd"),
+    0x08fd201c: ("rRiderNoteThumbnailDataNative", ".rntd"),
+    0x084d7ee4: ("rShortDemoDataNative", ".sdm"),
+    0x4ca2fa66: ("rSkillTableNative", ".skt"),
+    0x60a06906: ("rStChapDataNative", ".schd"),
+    0x27a0c810: ("rStEpiDataNative", ".sed"),
+    0x3c1a0ca5: ("rStoryCountDataNative", ".scod"),
+    0x6c4cbf97: ("rStoryDataNative", ".std"),
+    0x1f2b4b7b: ("rStoryFlagDataNative", ".stfd"),
+    0x2daf8237: ("rStPrComDataNative", ".spcd"),
+    0x38d6b69a: ("rSubQuestCountDataNative", ".sqcd"),
+    0x6dd0aa68: ("rSubQuestFlagDataNative", ".sqfd"),
+    0x15fc0096: ("rSubStEpiDataNative", ".ssed"),
+    0x49252f6a: ("rSystemCountDataNative", ".sycd"),
+    0x6181664e: ("rTalkDemoActorDataNative", ".tdmact"),
+    0x6e16c5e5: ("rTalkDemoCommandDataNative", ".tdmcmd"),
+    0x518d06ad: ("rTalkDemoDataNative", ".tdmd"),
+    0x012ec25e: ("rTalkDemoEffectDataNative", ".tdmeff"),
+    0x33c07b1f: ("rTalkDemoFaceDataNative", ".tdmfc"),
+    0x507ada8a: ("rTalkDemoMotionDataNative", ".tdmmot"),
+    0x5b4eed89: ("rTalkDemoPoseDataNative", ".tdmpos"),
+    0x28c32975: ("rTalkDemoScript", ".tdms"),
+    0x702c6d5b: ("rTalkInfoDataNative", ".tid"),
+    0x41ae22a4: ("rTalkMsgDataNative", ".tmd"),
+    0x738d7596: ("rTalkSelectDataNative", ".tstd"),
+    0x1eb79437: ("rWeaponDataNative", ".wpd"),
+    0x35fa3632: ("rFieldGateDataNative", ".fgd"),
+    0x7370d1fc: ("rMHFSMList", ".fslm"),
+    0x701b8556: ("rWipeData", ".wpdt"),
+    0x1688c822: ("rBattleAtkNative", ".btat"),
+    0x0b684d5f: ("rFieldBuddyMotionDataNative", ".fbd"),
+    0x70f5036c: ("rFieldDataNative", ".fld"),
+    0x069b081e: ("rFieldEnemySetDataNative", ".fesd"),
+    0x6cba497b: ("rFieldIngredientSetDataNative", ".fisd"),
+    0x552a3c4f: ("rFieldMotionDataNative", ".fmd"),
+    0x79d46143: ("rFieldOrnamentSetDataNative", ".fosd"),
+    0x219d9e77: ("rFieldPredatorDataNative", ".fprd"),
+    0x324e3203: ("rFieldSchedulerSetDataNative", ".fssd"),
+    0x7f51f399: ("rMonsterRaceDataNative", ".mrd"),
+    0x0ca6ba1a: ("rNpcTalkNative", ".ntk"),
+    0x02fc82fe: ("rShopDataNative", ".shp"),
+    0x2fccd32c: ("rSystemFlagDataNative", ".sfd"),
+    0x1aedb3a9: ("rTalkDataNative", ".tlk"),
+    0x6fcc7ad4: ("rProofEffectColorControl", ".pec"),
+    0x5a525c16: ("rProofEffectList", ".pel"),
+    0x254309c9: ("rProofEffectMotSequenceList", ".psl"),
+    0x20ed9750: ("rProofEffectParamScript", ".pep"),
+    0x50fe2b3b: ("rCameraData", ".cmdt"),
+    0x21684fe4: ("rColorLinkColor", ".clc"),
+    0x2d4cf80a: ("rColorLinkInfo", ".cli"),
+    0x18d25fec: ("rConditionChangeInfo", ".ccinfo"),
+    0x2fe088c0: ("rDollPartsDisp", ".dpd"),
+    0x02178810: ("rGroundAdjustment", ".gar"),
+    0x7534679e: ("rModelEasyAnime", ".mea"),
+    0x208e1cad: ("rModelInPath", ".mip"),
+    0x3f53ecc9: ("rMonsterPartsDisp", ".mpd"),
+    0x4f1544f5: ("rNavirouPartsDisp", ".npd"),
+    0x54dd639f: ("rPartsVisibleInfo", ".pvi"),
+    0x67de29f7: ("rSchedulerPreLoadList", ".spll"),
+    0x086aee8e: ("rShadowParamNative", ".swp"),
+    0x215e5305: ("rVirtualJoint", ".vjr"),
+    0x049f01bd: ("rWeaponGimmickInfo", ".wgi"),
+    0x6aba51b0: ("rWeaponOfsForBodyNative", ".wofb"),
+    0x5cdd1f19: ("cResource", ".ext"),
+    0x58a15856: ("rModel", ".mod"),
+    0x76820d81: ("rMotionList", ".lmt"),
+    0x241f5deb: ("rTexture", ".tex"),
+    0x51fc779f: ("rCollision", ".sbc"),
+    0x25fa21cb: ("rAIWayPointGraph", ".gway"),
+    0x4c0db839: ("rScheduler", ".sdl"),
+    0x73850d05: ("rArchive", ".arc"),
+    0x535d969f: ("rCnsTinyChain", ".ctc"),
+    0x3e363245: ("rChain", ".chn"),
+    0x0026e7ff: ("rChainCol", ".ccl"),
+    0x66b45610: ("rAIFSM", ".fsm"),
+    0x59ee2276: ("rAIFSMList", ".fsl"),
+    0x785e6622: ("rAIConditionTree", ".cdt"),
+    0x39c52040: ("rCameraList", ".lcm"),
+    0x22948394: ("rGUI", ".gui"),
+    0x7808ea10: ("rRenderTargetTexture", ".rtex"),
+    0x276de8b7: ("rEffect2D", ".e2d"),
+    0x2d462600: ("rGUIFont", ".gfd"),
+    0x07f768af: ("rGUIIconInfo", ".gii"),
+    0x091f3631: ("rGUIStyle", ".gst"),
+    0x242bb29a: ("rGUIMessage", ".gmd"),
+    0x69a5c538: ("rDeformWeightMap", ".dwm"),
+    0x257d2f7c: ("rSwingModel", ".swm"),
+    0x358012e8: ("rVibration", ".vib"),
+    0x1bcc4966: ("rSoundRequest", ".srqr"),
+    0x167dbbff: ("rSoundStreamRequest", ".stqr"),
+    0x0ecd7df4: ("rSoundCurveSet", ".scsr"),
+    0x0315e81f: ("rSoundDirectionalSet", ".sdsr"),
+    0x2b40ae8f: ("rSoundEQ", ".equr"),
+    0x232e228c: ("rSoundReverb", ".revr"),
+    0x592d804b: ("rSoundCurveXml", ".scvr.xml"),
+    0x3a96d8a0: ("rSoundDirectionalCurveXml", ".sdcr.xml"),
+    0x15d782fb: ("rSoundBank", ".sbkr"),
+    0x1eb3767c: ("rSoundPhysicsRigidBody", ".sprr"),
+    0x7bec319a: ("rSoundPhysicsSoftBody", ".spsr"),
+    0x31edc625: ("rSoundPhysicsJoint", ".spjr"),
+    0x09e6b5f0: ("rShader2", ".mfx"),
+    0x7c832b6a: ("rImplicitSurface", ".is"),
+    0x126ad8e0: ("rMovie", ".ext"),
+    0x5f84f7c4: ("rMovieOnMemory", ".mem.wmv"),
+    0x31f693d6: ("rMovieOnDisk", ".wmvd"),
+    0x17a69ace: ("rMovieOnMemoryInterMediate", ".mem.wmv"),
+    0x71950384: ("rMovieOnDiskInterMediate", ".wmvd"),
+    0x4323d83a: ("rSceneTexture", ".stex"),
+    0x11c35522: ("rGrass2", ".gr2"),
+    0x628dfb41: ("rGrass2Setting", ".gr2s"),
+    0x6a5cdd23: ("rOccluder", ".occ"),
+    0x1e85e006: ("rISC", ".isc"),
+    0x5ea7a3e9: ("rSky", ".sky"),
+    0x3e356f93: ("rStarCatalog", ".stc"),
+    0x3d683c5b: ("rCloud", ".cld"),
+    0x465cb860: ("rSoundSourcePC", ".ext"),
+    0x724df879: ("rSoundSourceMSADPCM", ".xsew"),
+    0x255d51cd: ("rSoundSourceOggVorbis", ".sngw"),
+    0x6d5ae854: ("rEffectList", ".efl"),
+    0x6158a4a8: ("rCollisionHeightField", ".sbch"),
+    0x5a7fea62: ("rCnsIK", ".ik"),
+    0x02358e1a: ("rShaderPackage", ".spkg"),
+    0x294e9e8a: ("rShaderCache", ".sch"),
+    0x2749c8a8: ("rMaterial", ".mrl"),
+    0x064a3ad8: ("rSoundSpeakerSetXml", ".sssr.xml"),
+    0x2350e584: ("rCollisionObj", ".obc"),
+    0x2739b57c: ("rGrass", ".grs"),
+    0x27ab4075: ("rConstraint", ".ext"),
+    0x6b02a7af: ("rCnsLookAt", ".lat"),
+    0x4e397417: ("rEffectAnim", ".ean"),
+    0x02833703: ("rEffectStrip", ".efs"),
+    0x1ae50150: ("rVertices", ".vts"),
+    0x727c7279: ("rNulls", ".nls"),
+    0x31a91da3: ("rAI", ".ais"),
+    0x6fe1ea15: ("rSoundPhysicsList", ".splr"),
+    0x07b8bcde: ("rFacialAnimation", ".fca"),
+    0x279d506c: ("rMetaSet", ".mst"),
+    0x0330c7df: ("rMetaSetXml", ".mst.xml"),
+    0x526665b7: ("rCnsTinyIK", ".tik"),
+    0x4868dccc: ("rCnsScaleNormalize", ".scnl"),
+    0x15b493a9: ("rCnsRotateLimit", ".lim"),
+    0x5f6a608b: ("rCnsMatrix", ".mtx"),
+    0x4a06c178: ("rCnsJointOffset", ".jof"),
+    0x1ad7410b: ("rCnsParent", ".par"),
+    0x062c625e: ("rCnsParentN", ".pan"),
+    0x70fe7e25: ("rCnsLookAtEyeball", ".eye"),
+    0x6143e1bd: ("rGraphPatch", ".gpt"),
+    0x0437bcf2: ("rGrassWind", ".grw"),
+    0x1ef5e639: ("rConvexHull", ".hul"),
+    0x5175c242: ("rGeometry2", ".geo2"),
+    0x2672f2d4: ("rGeometry3", ".geo3"),
+    0x7c7e8cca: ("rSerial", ".srt"),
+    0x75967ad6: ("rDynamicSbc", ".dsc"),
+    0x5e4def9d: ("rGeometry2Group", ".geog"),
+}
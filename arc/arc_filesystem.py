@@ -0,0 +1,174 @@
+import os
+import threading
+from collections import OrderedDict
+from glob import glob
+
+import logging
+logger = logging.getLogger("mhst2_import")
+
+from .arc_parser import read_arc_entry
+from .arc_index import open_arc_index, ARC_INDEX_FILENAME
+from .arc_pack import ArcPack, ARC_PACK_INDEX_FILENAME
+
+ARC_FILE_SYSTEM_CACHE_SIZE = 256*1024*1024
+
+def find_index_path(game_path):
+    # A pack is preferred to the archives, its files don't need to be decrypted
+    for index_filename in [ARC_PACK_INDEX_FILENAME, ARC_INDEX_FILENAME]:
+        index_path = os.path.join(game_path, index_filename)
+        if os.path.isfile(index_path):
+            return index_path
+    return None
+
+class ArcFileSystem():
+    # Read-through view of the game path: files missing from disk are resolved against the pack or
+    # the archive index, and only their entry is read from the pack or the .arc file. Recently read
+    # files are kept in a LRU cache bounded in bytes.
+    def __init__(self, game_path, cache_size=ARC_FILE_SYSTEM_CACHE_SIZE):
+        self.game_path = os.path.abspath(game_path)
+        self.index_path = find_index_path(self.game_path)
+        self.index_mtime = os.path.getmtime(self.index_path)
+        if os.path.basename(self.index_path) == ARC_PACK_INDEX_FILENAME:
+            self.pack = ArcPack(self.index_path)
+            self.index = None
+        else:
+            self.pack = None
+            # Built again if the game was updated since
+            self.index = open_arc_index(self.index_path)
+        # Set when an archive changed since it was indexed, the next use opens the file system again
+        self.stale = False
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.cached_bytes = 0
+        self.lock = threading.Lock()
+
+    def relative_path(self, filepath):
+        relative_path = os.path.relpath(os.path.abspath(filepath), self.game_path)
+        if relative_path.startswith(".."):
+            return None
+        return relative_path.replace("\\", "/")
+
+    def exists(self, path):
+        if self.pack is not None:
+            return path in self.pack
+        return path in self.index
+
+    def read(self, path):
+        path = path.replace("\\", "/")
+        with self.lock:
+            if path in self.cache:
+                self.cache.move_to_end(path)
+                return self.cache[path]
+
+        if self.pack is not None:
+            data = self.pack.read(path)
+        else:
+            file_info = self.index.lookup(path)
+            if file_info is None:
+                raise FileNotFoundError(path + " is not in the archive index")
+            if self.index.is_archive_changed(file_info["arc_file"]):
+                self.stale = True
+                raise RuntimeError(file_info["arc_file"] + " changed since the game archives were indexed, they will be indexed again on the next import")
+            data = read_arc_entry(file_info["arc_file"], file_info)
+
+        with self.lock:
+            if path not in self.cache:
+                self.cache[path] = data
+                self.cached_bytes += len(data)
+            while self.cached_bytes > self.cache_size and len(self.cache) > 1:
+                _, evicted_data = self.cache.popitem(last=False)
+                self.cached_bytes -= len(evicted_data)
+        return data
+
+    def list_directory(self, directory, extension, recursive=False):
+        if self.pack is not None:
+            return self.pack.list_directory(directory, extension, recursive=recursive)
+        return self.index.list_directory(directory, extension, recursive=recursive)
+
+    def close(self):
+        if self.pack is not None:
+            self.pack.close()
+        else:
+            self.index.close()
+
+_file_systems = {}
+_game_paths = {}
+
+def find_game_path(filepath):
+    # The game path is the closest parent folder holding a pack or an archive index
+    directory = os.path.dirname(os.path.abspath(filepath))
+    visited = []
+    while directory not in _game_paths:
+        visited.append(directory)
+        if find_index_path(directory) is not None:
+            _game_paths[directory] = directory
+            break
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return None
+        directory = parent
+    game_path = _game_paths[directory]
+    for visited_directory in visited:
+        _game_paths[visited_directory] = game_path
+    return game_path
+
+def get_arc_file_system(filepath):
+    game_path = find_game_path(filepath)
+    if game_path is None:
+        return None
+    file_system = _file_systems.get(game_path)
+    index_path = find_index_path(game_path)
+    if index_path is None:
+        return None
+    if file_system is None or file_system.stale or file_system.index_path != index_path or file_system.index_mtime != os.path.getmtime(index_path):
+        # First use, the game archives were indexed or packed again, or they changed since
+        if file_system is not None:
+            file_system.close()
+        file_system = ArcFileSystem(game_path)
+        _file_systems[game_path] = file_system
+    return file_system
+
+def close_arc_file_systems():
+    # Releases the packs mapped in memory, which can't be replaced while they're open on Windows
+    for file_system in _file_systems.values():
+        file_system.close()
+    _file_systems.clear()
+
+def read_from_archives(filepath):
+    # Returns the content of a game file that is only available inside the archives, or None when it
+    # should be read from disk as usual.
+    if os.path.isfile(filepath):
+        return None
+    file_system = get_arc_file_system(filepath)
+    if file_system is None:
+        return None
+    path = file_system.relative_path(filepath)
+    if path is None or not file_system.exists(path):
+        return None
+    logger.debug("Reading " + path + " from the game archives")
+    return file_system.read(path)
+
+def game_file_exists(filepath):
+    if os.path.isfile(filepath):
+        return True
+    file_system = get_arc_file_system(filepath)
+    if file_system is None:
+        return False
+    path = file_system.relative_path(filepath)
+    return path is not None and file_system.exists(path)
+
+def glob_game_files(directory, extension, recursive=False):
+    if recursive:
+        files = glob(os.path.join(directory, "**", "*" + extension), recursive=True)
+    else:
+        files = glob(os.path.join(directory, "*" + extension))
+    files = set(os.path.abspath(x) for x in files)
+
+    file_system = get_arc_file_system(os.path.join(directory, "_"))
+    if file_system is not None:
+        path = file_system.relative_path(directory)
+        if path is not None:
+            path = "" if path == "." else path
+            for archived_path in file_system.list_directory(path, extension, recursive=recursive):
+                files.add(os.path.abspath(os.path.join(file_system.game_path, archived_path)))
+    return sorted(files)
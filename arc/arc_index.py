@@ -0,0 +1,154 @@
+import os
+import sqlite3
+
+import logging
+logger = logging.getLogger("mhst2_import")
+
+from .arc_parser import list_arc_toc, select_arc_toc, toc_file_infos, create_worker_pool, find_arc_files
+
+ARC_INDEX_FILENAME = "arc_index.db"
+ARC_INDEX_VERSION = 1
+
+def build_arc_index(installation_path, index_path, worker_count=1):
+    arc_files = find_arc_files(installation_path)
+    logger.info("Indexing " + str(len(arc_files)) + " arc files.")
+
+    if worker_count == 1:
+        arc_tocs = list(map(list_arc_toc, arc_files))
+    else:
+        with create_worker_pool(worker_count) as pool:
+            arc_tocs = list(pool.map(list_arc_toc, arc_files))
+
+    archives = []
+    entries = {}
+    overridden_entries = []
+    # Archives are sorted by increasing priority, so a later one replaces what was already there
+    for arc_id, (arc_file, toc) in enumerate(zip(arc_files, arc_tocs)):
+        # Every .arc file is listed, even one that isn't an archive, to tell when they change
+        stat = os.stat(arc_file)
+        archives.append((arc_id, os.path.relpath(arc_file, installation_path).replace("\\", "/"), stat.st_size, stat.st_mtime))
+        if toc is None:
+            continue
+        for file_info in toc_file_infos(toc, select_arc_toc(toc)):
+            path = file_info["file_path"] + file_info["extension"]
+            row = (path, file_info["file_path"], file_info["extension"], arc_id, file_info["offset"], file_info["compressed_size"], file_info["decompressed_size"], file_info["extension_hash"])
+            if path.lower() in entries:
+                overridden_entries.append(entries[path.lower()])
+            entries[path.lower()] = row
+
+    temp_index_path = index_path + ".tmp"
+    if os.path.exists(temp_index_path):
+        os.remove(temp_index_path)
+    connection = sqlite3.connect(temp_index_path)
+    with connection:
+        connection.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+        connection.execute("CREATE TABLE archives (id INTEGER PRIMARY KEY, path TEXT, size INTEGER, mtime REAL)")
+        connection.execute("CREATE TABLE entries (path TEXT PRIMARY KEY COLLATE NOCASE, file_path TEXT, extension TEXT, archive_id INTEGER, offset INTEGER, compressed_size INTEGER, decompressed_size INTEGER, extension_hash INTEGER) WITHOUT ROWID")
+        connection.execute("CREATE TABLE overridden_entries (path TEXT COLLATE NOCASE, file_path TEXT, extension TEXT, archive_id INTEGER, offset INTEGER, compressed_size INTEGER, decompressed_size INTEGER, extension_hash INTEGER)")
+        connection.executemany("INSERT INTO meta VALUES (?, ?)", [("version", str(ARC_INDEX_VERSION)), ("installation_path", os.path.abspath(installation_path))])
+        connection.executemany("INSERT INTO archives VALUES (?, ?, ?, ?)", archives)
+        connection.executemany("INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)", sorted(entries.values()))
+        connection.executemany("INSERT INTO overridden_entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)", overridden_entries)
+    connection.close()
+    os.replace(temp_index_path, index_path)
+
+    logger.info("Indexed " + str(len(entries)) + " files (" + str(len(overridden_entries)) + " overridden by a higher priority archive).")
+    return len(entries)
+
+def list_index_directory(connection, directory, extension, recursive=False):
+    # Paths of the entries table in directory with the given extension
+    directory = directory.replace("\\", "/").strip("/")
+    prefix = directory + "/" if directory != "" else ""
+    rows = connection.execute("SELECT path FROM entries WHERE path LIKE ? AND extension = ? COLLATE NOCASE", (prefix + "%", extension))
+    # LIKE treats "_" as a wildcard, the prefix is checked again here
+    paths = [path for (path,) in rows if path.lower().startswith(prefix.lower())]
+    if not recursive:
+        paths = [path for path in paths if "/" not in path[len(prefix):]]
+    return sorted(paths)
+
+class ArcIndex():
+    def __init__(self, index_path, installation_path=None):
+        self.path = index_path
+        if not os.path.isfile(index_path):
+            raise RuntimeError(str(index_path) + " does not exist, index the game archives first")
+        self.connection = sqlite3.connect(index_path, check_same_thread=False)
+        meta = dict(self.connection.execute("SELECT key, value FROM meta"))
+        if int(meta["version"]) != ARC_INDEX_VERSION:
+            raise RuntimeError(str(index_path) + " was built by another version of the addon, index the game archives again")
+        if installation_path is None:
+            installation_path = meta["installation_path"]
+        self.installation_path = installation_path
+        self.archives = {}
+        # The size and modification time of each archive when it was indexed
+        self.archive_stats = {}
+        for arc_id, path, size, mtime in self.connection.execute("SELECT id, path, size, mtime FROM archives"):
+            self.archives[arc_id] = os.path.normpath(os.path.join(installation_path, path))
+            self.archive_stats[self.archives[arc_id]] = (size, mtime)
+
+    def is_archive_changed(self, arc_file):
+        try:
+            stat = os.stat(arc_file)
+        except OSError:
+            return True
+        return self.archive_stats.get(os.path.normpath(arc_file)) != (stat.st_size, stat.st_mtime)
+
+    def find_changed_archives(self):
+        # The archives added, removed or changed since they were indexed: the offsets of the index
+        # can't be trusted anymore
+        arc_files = set(os.path.normpath(arc_file) for arc_file in find_arc_files(self.installation_path))
+        changed_arc_files = set(self.archive_stats) ^ arc_files
+        changed_arc_files.update(arc_file for arc_file in arc_files & set(self.archive_stats) if self.is_archive_changed(arc_file))
+        return sorted(os.path.relpath(arc_file, self.installation_path).replace("\\", "/") for arc_file in changed_arc_files)
+
+    def _to_file_info(self, row):
+        _, file_path, extension, arc_id, offset, compressed_size, decompressed_size, extension_hash = row
+        return {
+            "arc_file": self.archives[arc_id],
+            "file_path": file_path,
+            "extension": extension,
+            "extension_hash": extension_hash,
+            "compressed_size": compressed_size,
+            "decompressed_size": decompressed_size,
+            "offset": offset,
+        }
+
+    def lookup(self, path):
+        row = self.connection.execute("SELECT * FROM entries WHERE path = ?", (path.replace("\\", "/"),)).fetchone()
+        if row is None:
+            return None
+        return self._to_file_info(row)
+
+    def __contains__(self, path):
+        return self.connection.execute("SELECT 1 FROM entries WHERE path = ?", (path.replace("\\", "/"),)).fetchone() is not None
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def list_directory(self, directory, extension, recursive=False):
+        return list_index_directory(self.connection, directory, extension, recursive)
+
+    def entries(self):
+        return [self._to_file_info(row) for row in self.connection.execute("SELECT * FROM entries ORDER BY path")]
+
+    def overridden_entries(self):
+        return [self._to_file_info(row) for row in self.connection.execute("SELECT * FROM overridden_entries ORDER BY path, archive_id")]
+
+    def close(self):
+        self.connection.close()
+
+def open_arc_index(index_path, installation_path=None, worker_count=1):
+    # Opens the archive index, built again first if it's missing or if the archives changed since
+    # (a game update). installation_path defaults to the one of the existing index.
+    if os.path.isfile(index_path):
+        index = ArcIndex(index_path)
+        changed_archives = index.find_changed_archives()
+        if len(changed_archives) == 0:
+            return index
+        index.close()
+        if installation_path is None:
+            installation_path = index.installation_path
+        logger.info(str(len(changed_archives)) + " arc files changed since they were indexed (" + changed_archives[0] + (", ..." if len(changed_archives) > 1 else "") + "), indexing the game archives again.")
+    elif installation_path is None:
+        raise RuntimeError(str(index_path) + " does not exist, index the game archives first")
+    build_arc_index(installation_path, index_path, worker_count)
+    return ArcIndex(index_path)
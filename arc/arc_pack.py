@@ -0,0 +1,235 @@
+import os
+import mmap
+import zlib
+import sqlite3
+import threading
+from glob import glob
+from collections import deque
+
+import logging
+logger = logging.getLogger("mhst2_import")
+
+from .arc_parser import find_archived_files, find_loose_files, create_worker_pool, read_arc_file, inflate_to_file, write_json_file, TEMP_SUFFIX
+from .arc_index import list_index_directory
+
+ARC_PACK_INDEX_FILENAME = "arc_pack.db"
+ARC_PACK_INDEX_VERSION = 1
+ARC_PACK_FILENAME = "assets_{:03d}.pack"
+ARC_PACK_FILE_SIZE = 2*1024*1024*1024 # a new pack file is started past this size
+ARC_PACK_PENDING_BYTES = 256*1024*1024 # payloads read ahead of the pack writer, at most
+
+def read_arc_payloads(arc_file, file_infos):
+    # The payloads of some entries of arc_file, as stored in the archive (zlib)
+    _, bs, _ = read_arc_file(arc_file)
+    return [bytes(bs.data[file_info["offset"]:file_info["offset"] + file_info["compressed_size"]]) for file_info in file_infos]
+
+class PackWriter():
+    # Appends payloads to the pack files of extraction_path, written under a temporary name until
+    # close()
+    def __init__(self, extraction_path):
+        self.extraction_path = extraction_path
+        self.pack_names = []
+        self.rows = []
+        self.file_out = None
+
+    def add(self, path, file_path, extension, payload, size, compressed):
+        if self.file_out is None or self.file_out.tell() + len(payload) > ARC_PACK_FILE_SIZE:
+            self.start_pack_file()
+        offset = self.file_out.tell()
+        self.file_out.write(payload)
+        self.rows.append((path, file_path, extension, len(self.pack_names) - 1, offset, len(payload), size, int(compressed)))
+        return len(payload)
+
+    def add_inflated(self, path, file_path, extension, compressed_payload, size):
+        # Stores a payload inflated, chunk by chunk, straight into the pack file
+        if self.file_out is None or self.file_out.tell() + size > ARC_PACK_FILE_SIZE:
+            self.start_pack_file()
+        offset = self.file_out.tell()
+        stored_size = inflate_to_file(compressed_payload, self.file_out)
+        self.rows.append((path, file_path, extension, len(self.pack_names) - 1, offset, stored_size, size, 0))
+        return stored_size
+
+    def start_pack_file(self):
+        if self.file_out is not None:
+            self.file_out.close()
+        self.pack_names.append(ARC_PACK_FILENAME.format(len(self.pack_names)))
+        self.file_out = open(os.path.join(self.extraction_path, self.pack_names[-1] + TEMP_SUFFIX), "wb")
+
+    def abort(self):
+        if self.file_out is not None:
+            self.file_out.close()
+        for pack_name in self.pack_names:
+            temp_name = os.path.join(self.extraction_path, pack_name + TEMP_SUFFIX)
+            if os.path.exists(temp_name):
+                os.remove(temp_name)
+        index_path = os.path.join(self.extraction_path, ARC_PACK_INDEX_FILENAME)
+        if os.path.exists(index_path + TEMP_SUFFIX):
+            os.remove(index_path + TEMP_SUFFIX)
+        self.file_out = None
+        self.pack_names = []
+
+    def close(self, metadata):
+        if self.file_out is not None:
+            self.file_out.close()
+        index_path = os.path.join(self.extraction_path, ARC_PACK_INDEX_FILENAME)
+        if os.path.exists(index_path + TEMP_SUFFIX):
+            os.remove(index_path + TEMP_SUFFIX)
+        connection = sqlite3.connect(index_path + TEMP_SUFFIX)
+        with connection:
+            connection.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+            connection.execute("CREATE TABLE packs (id INTEGER PRIMARY KEY, name TEXT)")
+            connection.execute("CREATE TABLE entries (path TEXT PRIMARY KEY COLLATE NOCASE, file_path TEXT, extension TEXT, pack_id INTEGER, offset INTEGER, stored_size INTEGER, size INTEGER, compressed INTEGER) WITHOUT ROWID")
+            connection.executemany("INSERT INTO meta VALUES (?, ?)", [("version", str(ARC_PACK_INDEX_VERSION))] + list(metadata.items()))
+            connection.executemany("INSERT INTO packs VALUES (?, ?)", list(enumerate(self.pack_names)))
+            connection.executemany("INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)", self.rows)
+        connection.close()
+
+        # The pack files are only swapped with the index, they always match each other
+        for pack_name in self.pack_names:
+            os.replace(os.path.join(self.extraction_path, pack_name + TEMP_SUFFIX), os.path.join(self.extraction_path, pack_name))
+        os.replace(index_path + TEMP_SUFFIX, index_path)
+        for pack_file in glob(os.path.join(self.extraction_path, "assets_*.pack")):
+            if os.path.basename(pack_file) not in self.pack_names:
+                os.remove(pack_file)
+
+def write_arc_pack(writer, installation_path, extraction_path, archived_files, arc_file_infos, worker_count=1, arc_filter=None, compress=True, progress=None):
+    # Adds the files of the game to writer, returns the number of files that are not archived, or None
+    # if cancelled
+    pool = create_worker_pool(worker_count) if worker_count > 1 else None
+    try:
+        # Archives are read in parallel, but written in order so that the packs are always laid out the
+        # same way. Only a few of them, and ARC_PACK_PENDING_BYTES of payloads, are waiting in memory.
+        pending = deque()
+        pending_bytes = 0
+        jobs = sorted(arc_file_infos.items())
+        job_i = 0
+        while job_i < len(jobs) or len(pending) > 0:
+            while job_i < len(jobs) and (len(pending) == 0 or (pool is not None and len(pending) < 2*worker_count and pending_bytes < ARC_PACK_PENDING_BYTES)):
+                arc_file, file_infos = jobs[job_i]
+                job_bytes = sum(file_info["compressed_size"] for file_info in file_infos)
+                if pool is None:
+                    pending.append((file_infos, read_arc_payloads(arc_file, file_infos), job_bytes))
+                else:
+                    pending.append((file_infos, pool.submit(read_arc_payloads, arc_file, file_infos), job_bytes))
+                pending_bytes += job_bytes
+                job_i += 1
+            file_infos, payloads, job_bytes = pending.popleft()
+            if pool is not None:
+                payloads = payloads.result()
+            pending_bytes -= job_bytes
+            written_bytes = 0
+            for file_info, payload in zip(file_infos, payloads):
+                path = file_info["file_path"] + file_info["extension"]
+                if compress:
+                    written_bytes += writer.add(path, file_info["file_path"], file_info["extension"], payload, file_info["decompressed_size"], True)
+                else:
+                    written_bytes += writer.add_inflated(path, file_info["file_path"], file_info["extension"], payload, file_info["decompressed_size"])
+            del payloads
+            if progress is not None:
+                progress.advance(os.path.getsize(file_infos[0]["arc_file"]), written_bytes)
+                if progress.is_cancelled():
+                    return None
+            if (job_i - len(pending))%50 == 0:
+                logger.info(str(job_i - len(pending)) + "/" + str(len(jobs)) + " arc files packed")
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    # Files of the game that are not in an archive, unless an archive has the same path
+    loose_file_count = 0
+    if extraction_path != installation_path:
+        for loose_file, relative_path in find_loose_files(installation_path, worker_count, arc_filter):
+            if relative_path.lower() in archived_files:
+                continue
+            with open(loose_file, "rb") as file_in:
+                payload = file_in.read()
+            file_path, extension = relative_path.rsplit(".", 1)
+            writer.add(relative_path, file_path, "." + extension, payload, len(payload), False)
+            loose_file_count += 1
+    return loose_file_count
+
+def build_arc_pack(installation_path, extraction_path, worker_count=1, arc_filter=None, compress=True, progress=None):
+    # Packs the files of the game in a few large files instead of extracting them one by one. Each
+    # payload is kept compressed as in the archives, or stored inflated when compress is False.
+    if arc_filter is not None and arc_filter.is_empty():
+        arc_filter = None
+    archived_files = find_archived_files(installation_path, worker_count, arc_filter)
+    arc_file_infos = {}
+    for file_info in archived_files.values():
+        arc_file_infos.setdefault(file_info["arc_file"], []).append(file_info)
+    logger.info("Packing " + str(len(archived_files)) + " files from " + str(len(arc_file_infos)) + " arc files.")
+
+    if progress is not None:
+        progress.start([os.path.getsize(arc_file) for arc_file in arc_file_infos])
+    writer = PackWriter(extraction_path)
+    try:
+        loose_file_count = write_arc_pack(writer, installation_path, extraction_path, archived_files, arc_file_infos, worker_count, arc_filter, compress, progress)
+        if loose_file_count is not None:
+            writer.close({"installation_path": os.path.abspath(installation_path), "compressed": str(int(compress))})
+    except BaseException:
+        # Nothing of a failed or cancelled pack is kept, the previous one (if any) is left untouched
+        writer.abort()
+        raise
+    if loose_file_count is None:
+        writer.abort()
+        logger.info("Packing cancelled.")
+        return 0
+    file_list = sorted(row[0] for row in writer.rows)
+    write_json_file(os.path.join(extraction_path, "file_list.json"), file_list, indent="\t")
+    logger.info("Packed " + str(len(file_list)) + " files (" + str(loose_file_count) + " not archived) in " + str(len(writer.pack_names)) + " pack files.")
+    return len(file_list)
+
+class ArcPack():
+    # Read access to the files of a pack by path, the pack files being memory mapped
+    def __init__(self, index_path):
+        self.path = index_path
+        if not os.path.isfile(index_path):
+            raise RuntimeError(str(index_path) + " does not exist, pack the game archives first")
+        self.connection = sqlite3.connect(index_path, check_same_thread=False)
+        meta = dict(self.connection.execute("SELECT key, value FROM meta"))
+        if int(meta["version"]) != ARC_PACK_INDEX_VERSION:
+            raise RuntimeError(str(index_path) + " was built by another version of the addon, pack the game archives again")
+        directory = os.path.dirname(index_path)
+        self.pack_files = {pack_id: os.path.join(directory, name) for pack_id, name in self.connection.execute("SELECT id, name FROM packs")}
+        self.maps = {}
+        self.lock = threading.Lock()
+
+    def get_map(self, pack_id):
+        with self.lock:
+            if pack_id not in self.maps:
+                with open(self.pack_files[pack_id], "rb") as file_in:
+                    self.maps[pack_id] = mmap.mmap(file_in.fileno(), 0, access=mmap.ACCESS_READ)
+            return self.maps[pack_id]
+
+    def lookup(self, path):
+        row = self.connection.execute("SELECT pack_id, offset, stored_size, size, compressed FROM entries WHERE path = ?", (path.replace("\\", "/"),)).fetchone()
+        if row is None:
+            return None
+        pack_id, offset, stored_size, size, compressed = row
+        return {"pack_id": pack_id, "offset": offset, "stored_size": stored_size, "size": size, "compressed": bool(compressed)}
+
+    def read(self, path):
+        entry = self.lookup(path)
+        if entry is None:
+            raise FileNotFoundError(path + " is not in the pack")
+        pack_map = self.get_map(entry["pack_id"])
+        offset = entry["offset"]
+        if entry["compressed"]:
+            return zlib.decompress(memoryview(pack_map)[offset:offset + entry["stored_size"]])
+        return pack_map[offset:offset + entry["stored_size"]]
+
+    def __contains__(self, path):
+        return self.connection.execute("SELECT 1 FROM entries WHERE path = ?", (path.replace("\\", "/"),)).fetchone() is not None
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def list_directory(self, directory, extension, recursive=False):
+        return list_index_directory(self.connection, directory, extension, recursive)
+
+    def close(self):
+        with self.lock:
+            for pack_map in self.maps.values():
+                pack_map.close()
+            self.maps = {}
+        self.connection.close()
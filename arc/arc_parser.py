@@ -1,546 +1,68 @@
-import bpy
-import addon_utils
-
 import struct
 import zlib
 import os
 import sys
 from glob import glob
+from fnmatch import fnmatchcase
 import ctypes
 import numpy as np
 import shutil
 import json
+import hashlib
+import time
+import multiprocessing
+import threading
+import queue
+try:
+    import fcntl
+except ImportError:
+    # Windows
+    fcntl = None
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
 import logging
 logger = logging.getLogger("mhst2_import")
 
+from .arc_file_types import ARC_FILE_TYPES
+
 def jamcrc(string):
     return (zlib.crc32(str(string).encode()) ^ 0xffffffff) & 0x7fffffff
 
-fileExts = {}
-fileExts[jamcrc("rBattleBinary")] = ".btb"
-fileExts[jamcrc("rBattleCutCmdData")] = ".bccmd"
-fileExts[jamcrc("rBattleSelectSetData")] = ".bsset"
-fileExts[jamcrc("rAgingFieldPatrolDataNative")] = ".afpd"
-fileExts[jamcrc("rTalkDemoCut")] = ".cut"
-fileExts[jamcrc("rTalkDemoSound")] = ".tsnd"
-fileExts[jamcrc("rTalkDemoWorkOriginInfo")] = ".work"
-fileExts[jamcrc("rTalkDemoObjInitPos")] = ".pos"
-fileExts[jamcrc("rFieldEnemyDefaultAifsmDataNaitive")] = ".fedad"
-fileExts[jamcrc("rFieldConnectionInfoNative")] = ".fci"
-fileExts[jamcrc("rFieldPartsInfoNative")] = ".fpi"
-fileExts[jamcrc("rFieldPartsLayoutNative")] = ".fpl"
-fileExts[jamcrc("rTraceSonarNative")] = ".ts"
-fileExts[jamcrc("rFieldPlacementObjectSetNative")] = ".fpos"
-fileExts[jamcrc("rFieldCamOption")] = ".fco"
-fileExts[jamcrc("rDungeonInfoListNative")] = ".dai"
-fileExts[jamcrc("rFieldNpcNekoTaxiList")] = ".fntl"
-fileExts[jamcrc("rFieldObjectList")] = ".fol"
-fileExts[jamcrc("rFieldCamera")] = ".fcr"
-fileExts[jamcrc("rOccluder2Native")] = ".occ2"
-fileExts[jamcrc("rInstanceDrawDistance")] = ".idd"
-fileExts[jamcrc("rIDColor")] = ".idcol"
-fileExts[jamcrc("rInstancePlacement")] = ".ipr"
-fileExts[jamcrc("rPlayerMoveConfigData")] = ".pmc"
-fileExts[jamcrc("rSoundGuiSe")] = ".sgs"
-fileExts[jamcrc("rSoundParamOffsetControl")] = ".spoc"
-fileExts[jamcrc("rSoundPelTiedSe")] = ".pts"
-fileExts[jamcrc("rSoundAreaReverb")] = ".sar"
-fileExts[jamcrc("rSoundSystemSetting")] = ".sss"
-fileExts[jamcrc("rSoundPronounceList")] = ".sptl"
-fileExts[jamcrc("rEnaJoinProgressDataNative")] = ".ejpd"
-fileExts[jamcrc("rKizunaLvProgressDataNative")] = ".klpd"
-fileExts[jamcrc("rReusJoinProgressDataNative")] = ".rjpd"
-fileExts[jamcrc("rFieldDirectionInfoNative")] = ".fdi"
-fileExts[jamcrc("rAgingBtlBuddyTableNative")] = ".abbt"
-fileExts[jamcrc("rAgingBtlEnemySetTableNative")] = ".abest"
-fileExts[jamcrc("rAgingBtlStageTableNative")] = ".abst"
-fileExts[jamcrc("rAgingCheckBuddyNative")] = ".acb"
-fileExts[jamcrc("rAgingCheckEnaLayArmorNative")] = ".acela"
-fileExts[jamcrc("rAgingCheckNaviAccesoryNative")] = ".acna"
-fileExts[jamcrc("rAgingCheckPlArmorNative")] = ".acpa"
-fileExts[jamcrc("rAgingCheckWeaponNative")] = ".acwp"
-fileExts[jamcrc("rAgingFieldTableNative")] = ".aft"
-fileExts[jamcrc("rCheatCheckTableItemBattleNative")] = ".cctib"
-fileExts[jamcrc("rCheatCheckTableWeaponBowNative")] = ".cctbw"
-fileExts[jamcrc("rCheatCheckTableWeaponGunNative")] = ".cctgn"
-fileExts[jamcrc("rDoubleKizunaCameraOffsetNative")] = ".bdkc"
-fileExts[jamcrc("rDoubleKizunaMonsterConditionNative")] = ".bdkmc"
-fileExts[jamcrc("rDoubleKizunaMonsterOffsetNative")] = ".bdkm"
-fileExts[jamcrc("rDoubleKizunaSchedulerPathNative")] = ".bdkd"
-fileExts[jamcrc("rActionCommandDelayTimeDataNative")] = ".acdd"
-fileExts[jamcrc("rAnimationSecondParamNative")] = ".asp"
-fileExts[jamcrc("rGuiClearedDungeonItemParamNative")] = ".cdi"
-fileExts[jamcrc("rGuiColorDataNative")] = ".gcol"
-fileExts[jamcrc("rGuiFadeDataNative")] = ".gfad"
-fileExts[jamcrc("rGuiHatchBabyParamNative")] = ".ghbp"
-fileExts[jamcrc("rGuiModelDrawCameraParamNative")] = ".gmdc"
-fileExts[jamcrc("rGuiModelDrawWindowParamNative")] = ".gmdw"
-fileExts[jamcrc("rGuiMonsterModelParamNative")] = ".gmmp"
-fileExts[jamcrc("rGuiMultiVsPlayerParamNative")] = ".gmvp"
-fileExts[jamcrc("rGuiNpcModelParamNative")] = ".gnpc"
-fileExts[jamcrc("rGuiParamNative")] = ".gpm"
-fileExts[jamcrc("rGuiRiderCardBuddyParamNative")] = ".grcb"
-fileExts[jamcrc("rGuiStatusPlayerParamNative")] = ".gspp"
-fileExts[jamcrc("rGuiTraditionBuddyParamNative")] = ".gtbp"
-fileExts[jamcrc("rGuiWeaponModelParamNative")] = ".gwmp"
-fileExts[jamcrc("rAchievementIconNative")] = ".aic"
-fileExts[jamcrc("rCommandIconNative")] = ".cic"
-fileExts[jamcrc("rIconStatusDataNative")] = ".isd"
-fileExts[jamcrc("rItemIconNative")] = ".iic"
-fileExts[jamcrc("rMonsterIconNative")] = ".mic"
-fileExts[jamcrc("rSkillIconNative")] = ".sic"
-fileExts[jamcrc("rDramaMessageDataNative")] = ".drmd"
-fileExts[jamcrc("rFieldCommonMessageDataNative")] = ".fcmd"
-fileExts[jamcrc("rGameMessageDataNative")] = ".grmd"
-fileExts[jamcrc("rNpcMessageDataNative")] = ".ntlkd"
-fileExts[jamcrc("rTalkMessageDataNative")] = ".tlkd"
-fileExts[jamcrc("rOptionKeyConfigButtonDataNative")] = ".okbd"
-fileExts[jamcrc("rOptionKeyConfigDataNative")] = ".okd"
-fileExts[jamcrc("rOptionKeyConfigKeyboardDataNative")] = ".okkd"
-fileExts[jamcrc("rOptionLanguageDataNative")] = ".lad"
-fileExts[jamcrc("rOptionParamDataNative")] = ".opd"
-fileExts[jamcrc("rOptionSettingDataNative")] = ".osd"
-fileExts[jamcrc("rAmiiboGiftNative")] = ".agt"
-fileExts[jamcrc("rBattleBuddyConditionDataNative")] = ".bbcnd"
-fileExts[jamcrc("rBattleCmdCameraDataNative")] = ".bccam"
-fileExts[jamcrc("rBattleCmdIgnoreEnemyDataNative")] = ".bcige"
-fileExts[jamcrc("rBattleEffHitInfoDataNative")] = ".behi"
-fileExts[jamcrc("rBattleEnemyMCTblNative")] = ".bemct"
-fileExts[jamcrc("rBattleEventResourceDataNative")] = ".bert"
-fileExts[jamcrc("rBattleEventResultDataNative")] = ".berd"
-fileExts[jamcrc("rBattleEventTblNative")] = ".bet"
-fileExts[jamcrc("rBattleMorphChangeDataNative")] = ".bmcd"
-fileExts[jamcrc("rBattleMorphConditionDataNative")] = ".bmcnd"
-fileExts[jamcrc("rBattleNavirouFsmTableNative")] = ".bnft"
-fileExts[jamcrc("rBattleNavirouMessageNative")] = ".bnmt"
-fileExts[jamcrc("rBattleNavirouSetTableNative")] = ".bnst"
-fileExts[jamcrc("rBattleNavirouUniqueNative")] = ".bnut"
-fileExts[jamcrc("rBattlePartsConditionDataNative")] = ".bptcnd"
-fileExts[jamcrc("rBCATAppDataNative")] = ".bcatData"
-fileExts[jamcrc("rBingoBonusCategoryNative")] = ".bbc"
-fileExts[jamcrc("rBreakFieldObjectDataNative")] = ".bfofd"
-fileExts[jamcrc("rBuddyBtlMCDataNative")] = ".bdbcm"
-fileExts[jamcrc("rCharaCustomLogDataNative")] = ".chcl"
-fileExts[jamcrc("rCharaRemakeTicketDataNative")] = ".crd"
-fileExts[jamcrc("rDemoGalleryDataNative")] = ".dgd"
-fileExts[jamcrc("rDifficultyConvertCountNative")] = ".dcc"
-fileExts[jamcrc("rDifficultyConvertGameFlagNative")] = ".dcgf"
-fileExts[jamcrc("rDLCAppDataNative")] = ".dlcData"
-fileExts[jamcrc("rDLCViewDataNative")] = ".dlcView"
-fileExts[jamcrc("rDungeonChestLotTableNative")] = ".dclt"
-fileExts[jamcrc("rDungeonContainsDataNative")] = ".dcd"
-fileExts[jamcrc("rDungeonCreatePatternNative")] = ".dcp"
-fileExts[jamcrc("rDungeonEggMonsterDataNative")] = ".demd"
-fileExts[jamcrc("rDungeonEnemyFixedDataNative")] = ".defd"
-fileExts[jamcrc("rDungeonEnemyHomingDataNative")] = ".deh"
-fileExts[jamcrc("rDungeonEnemyLocatorDataNative")] = ".deloc"
-fileExts[jamcrc("rDungeonEnemyLotDataNative")] = ".deld"
-fileExts[jamcrc("rDungeonNestRarenessDataNative")] = ".dnrd"
-fileExts[jamcrc("rEggUniquePatternDataNative")] = ".eup"
-fileExts[jamcrc("rEnvCreatureDataNative")] = ".ecr"
-fileExts[jamcrc("rExpeditionFieldDataNative")] = ".exfd"
-fileExts[jamcrc("rExpeditionPolicyDataNative")] = ".expl"
-fileExts[jamcrc("rExpeditionSlotNumDataNative")] = ".esd"
-fileExts[jamcrc("rFieldAmbientDataNative")] = ".fldamb"
-fileExts[jamcrc("rFieldPartsDataNative")] = ".fpd"
-fileExts[jamcrc("rFieldPartsNameDataNative")] = ".fldpn"
-fileExts[jamcrc("rFieldSkyDataNative")] = ".fldsky"
-fileExts[jamcrc("rFieldSpotDataNative")] = ".flds"
-fileExts[jamcrc("rFixedDungeonConfigDataNative")] = ".fdcd"
-fileExts[jamcrc("rFortuneGiftNative")] = ".fgt"
-fileExts[jamcrc("rGeneRandomSetNative")] = ".grset"
-fileExts[jamcrc("rGiftBuddyTableNative")] = ".tgb"
-fileExts[jamcrc("rGiftEggTableNative")] = ".tge"
-fileExts[jamcrc("rGuiFontDataNative")] = ".fnd"
-fileExts[jamcrc("rGuiFontLanguageDataNative")] = ".gfld"
-fileExts[jamcrc("rGuiLocalizeTextureDataNative")] = ".ltd"
-fileExts[jamcrc("rGuiMessageDataNative")] = ".msgm"
-fileExts[jamcrc("rGuiWorldMapNative")] = ".gwm"
-fileExts[jamcrc("rHabitatDataNative")] = ".hbt"
-fileExts[jamcrc("rHardDungeonUIDataNative")] = ".hdu"
-fileExts[jamcrc("rHatchEggBonusDataNative")] = ".heb"
-fileExts[jamcrc("rEditCameraDataNative")] = ".ecd"
-fileExts[jamcrc("rEditColorPresetDataNative")] = ".ecp"
-fileExts[jamcrc("rEditEyeShapeDataNative")] = ".eed"
-fileExts[jamcrc("rEditFaceShapeDataNative")] = ".efd"
-fileExts[jamcrc("rEditHairstyleDataNative")] = ".ehd"
-fileExts[jamcrc("rEditMakeupTypeDataNative")] = ".emad"
-fileExts[jamcrc("rEditMouthShapeDataNative")] = ".emod"
-fileExts[jamcrc("rEditParamDataNative")] = ".epd"
-fileExts[jamcrc("rEditVoiceTypeDataNative")] = ".evd"
-fileExts[jamcrc("rLinkedDungeonDataNative")] = ".ldd"
-fileExts[jamcrc("rMelynxShopAccessoryDataNative")] = ".macd"
-fileExts[jamcrc("rMelynxShopArmorDataNative")] = ".mard"
-fileExts[jamcrc("rMelynxShopDataNative")] = ".msp"
-fileExts[jamcrc("rMelynxShopWeaponDataNative")] = ".mwd"
-fileExts[jamcrc("rMenuRiderNoteDataNative")] = ".mrnd"
-fileExts[jamcrc("rModTextureNoScaleDataNative")] = ".mtnscl"
-fileExts[jamcrc("rMonsterAdditionalShowTableNative")] = ".mas"
-fileExts[jamcrc("rMonsterBaseInfoDataNative")] = ".mbi"
-fileExts[jamcrc("rMHSoundEmitter")] = ".ses"
-fileExts[jamcrc("rMHSoundSequence")] = ".mss"
-fileExts[jamcrc("rSoundAttributeSe")] = ".aser"
-fileExts[jamcrc("rSoundEngine")] = ".engr"
-fileExts[jamcrc("rSoundEngineXml")] = ".engr.xml"
-fileExts[jamcrc("rSoundEngineValue")] = ".egvr"
-fileExts[jamcrc("rSoundMotionSe")] = ".mser"
-fileExts[jamcrc("rSoundSequenceSe")] = ".ssqr"
-fileExts[jamcrc("rSoundSimpleCurve")] = ".sscr"
-fileExts[jamcrc("rSoundSubMixerXml")] = ".smxr.xml"
-fileExts[jamcrc("rSoundSubMixer")] = ".smxr"
-fileExts[jamcrc("uSoundSubMixer::CurrentSubMixer")] = ".smxr"
-fileExts[jamcrc("rMonsterPartsTableNative")] = ".mpt"
-fileExts[jamcrc("rNavirouGuideDataNative")] = ".ngt"
-fileExts[jamcrc("rNpc2dFaceTexTableNative")] = ".nft"
-fileExts[jamcrc("rNpcAirouSetMotionDataNative")] = ".nasmd"
-fileExts[jamcrc("rNpcLayeredArmorDataNative")] = ".nlad"
-fileExts[jamcrc("rNpcSetMotionDataNative")] = ".nsmd"
-fileExts[jamcrc("rNpcTalkResourceDataNative")] = ".ntrp"
-fileExts[jamcrc("rNpcTalkZoneNative")] = ".ntz"
-fileExts[jamcrc("rPotEffectDataNative")] = ".pte"
-fileExts[jamcrc("rPotLevelDataNative")] = ".ptl"
-fileExts[jamcrc("rPotOfferingDataNative")] = ".pto"
-fileExts[jamcrc("rPotPrayingDataNative")] = ".ptp"
-fileExts[jamcrc("rPresetParamCharaCustomNative")] = ".tppcc"
-fileExts[jamcrc("rPresetParamLearningSkillSetNative")] = ".tppls"
-fileExts[jamcrc("rPresetParamOtomonNative")] = ".tppo"
-fileExts[jamcrc("rPresetParamOtomonGeneNative")] = ".tppog"
-fileExts[jamcrc("rRiderNoteDataRushNative")] = ".rndr"
-fileExts[jamcrc("rRideSkillTableNative")] = ".rst"
-fileExts[jamcrc("rSkillCalcNative")] = ".skc"
-fileExts[jamcrc("rSkillSetDataNative")] = ".wss"
-fileExts[jamcrc("rStableCapacityDataNative")] = ".scd"
-fileExts[jamcrc("rStatusChangeFlagsNative")] = ".scf"
-fileExts[jamcrc("rStatusDataNative")] = ".sdt"
-fileExts[jamcrc("rStoryQuestDataNative")] = ".sqd"
-fileExts[jamcrc("rStoryQuestDefineNative")] = ".sqdf"
-fileExts[jamcrc("rSubQuestConditionDataNative")] = ".sqccd"
-fileExts[jamcrc("rSubQuestDataRenewNative")] = ".suqd"
-fileExts[jamcrc("rSubQuestVeilDataNative")] = ".svd"
-fileExts[jamcrc("rSubstituteNpcTblNative")] = ".sntt"
-fileExts[jamcrc("rSummaryDataNative")] = ".smr"
-fileExts[jamcrc("rTalkDemoDefineDataNative")] = ".tdmspk"
-fileExts[jamcrc("rTrialCleanNativeDataNative")] = ".tcn"
-fileExts[jamcrc("rTutorialArrowDataNative")] = ".tad"
-fileExts[jamcrc("rTutorialLockDataNative")] = ".tld"
-fileExts[jamcrc("rVsItemSetDataNative")] = ".vsitemset"
-fileExts[jamcrc("rVsPrizeDataNative")] = ".vsprize"
-fileExts[jamcrc("rVsRuleDataNative")] = ".vsrule"
-fileExts[jamcrc("rSoundDemoControlNative")] = ".sdc"
-fileExts[jamcrc("rSoundDemoEnvControlNative")] = ".sdec"
-fileExts[jamcrc("rSoundDemoSeControlNative")] = ".sdsc"
-fileExts[jamcrc("rSoundGuiOperationNative")] = ".sgo"
-fileExts[jamcrc("rSoundInfoSeNative")] = ".siet"
-fileExts[jamcrc("rSoundInfoStreamNative")] = ".siets"
-fileExts[jamcrc("rSoundArchiveDataNative")] = ".samd"
-fileExts[jamcrc("rSoundArmorDataNative")] = ".sad"
-fileExts[jamcrc("rSoundBattleStageDataNative")] = ".sbsd"
-fileExts[jamcrc("rSoundBattleStageDefineNative")] = ".sbsdef"
-fileExts[jamcrc("rSoundBgmMonsterDataNative")] = ".sbmd"
-fileExts[jamcrc("rSoundFootstepDataNative")] = ".sftd"
-fileExts[jamcrc("rSoundFSMCommandBgmDataNative")] = ".sfcbd"
-fileExts[jamcrc("rSoundFSMCommandSeDataNative")] = ".sfcsd"
-fileExts[jamcrc("rSoundMonsterDataNative")] = ".smd"
-fileExts[jamcrc("rSoundMonsterEnvironmentalDataNative")] = ".smed"
-fileExts[jamcrc("rSoundMonsterKizunaDataNative")] = ".smkd"
-fileExts[jamcrc("rSoundNpcAirouDataNative")] = ".snad"
-fileExts[jamcrc("rSoundNpcDataNative")] = ".snd"
-fileExts[jamcrc("rSoundObjectDataNative")] = ".sod"
-fileExts[jamcrc("rSoundSceneVolumeNative")] = ".ssv"
-fileExts[jamcrc("rSoundWeaponDataNative")] = ".swd"
-fileExts[jamcrc("rSoundNpcVoicePathDataNative")] = ".snvpd"
-fileExts[jamcrc("rSoundPlayerVoicePathDataNative")] = ".spvpd"
-fileExts[jamcrc("rUnlockMixDataNative")] = ".ulm"
-fileExts[jamcrc("rUnlockProgressDataNative")] = ".ulp"
-fileExts[jamcrc("rUnlockScriptDataNative")] = ".uls"
-fileExts[jamcrc("rFacialPartsComboNative")] = ".fpc"
-fileExts[jamcrc("rFacialPartsControl")] = ".fpctl"
-fileExts[jamcrc("rObjectModelAttachGroupNative")] = ".omg"
-fileExts[jamcrc("rObjectModelAttachInfoNative")] = ".omi"
-fileExts[jamcrc("rObjectModelAttachSetData")] = ".omas"
-fileExts[jamcrc("rMonsterLookAtParamNative")] = ".mlka"
-fileExts[jamcrc("rKizunaStoneOfsNative")] = ".kofb"
-fileExts[jamcrc("rWeaponKindOfsNative")] = ".wko"
-fileExts[jamcrc("uSceneCapture::rCaptureTexture")] = ".tex"
-fileExts[jamcrc("cInstancingResource")] = ".ext"
-fileExts[jamcrc("rCheatCheckTableAccSkillNative")] = ".cctas"
-fileExts[jamcrc("rCheatCheckTableArmorNative")] = ".ccta"
-fileExts[jamcrc("rCheatCheckTableBuddyNative")] = ".cctb"
-fileExts[jamcrc("rCheatCheckTableBuddyFlagNative")] = ".cctbf"
-fileExts[jamcrc("rCheatCheckTableGeneNative")] = ".cctg"
-fileExts[jamcrc("rCheatCheckTableNaviAccNative")] = ".cctna"
-fileExts[jamcrc("rCheatCheckTableRangeNative")] = ".cctr"
-fileExts[jamcrc("rCheatCheckTableWeaponHamNative")] = ".ccthm"
-fileExts[jamcrc("rCheatCheckTableWeaponHueNative")] = ".ccthu"
-fileExts[jamcrc("rCheatCheckTableWeaponOneNative")] = ".cctwo"
-fileExts[jamcrc("rCheatCheckTableWeaponTwoNative")] = ".cctwt"
-fileExts[jamcrc("rBattleArenaDLCTableNative")] = ".badt"
-fileExts[jamcrc("rBattleArenaTrialTableNative")] = ".batt"
-fileExts[jamcrc("rBattleNaviTextEventNative")] = ".bte"
-fileExts[jamcrc("rBattleStatusEffectNative")] = ".bseff"
-fileExts[jamcrc("rBattleVsPorchPresetNative")] = ".bvspp"
-fileExts[jamcrc("rDLCItemTableNative")] = ".ditemp"
-fileExts[jamcrc("rDLCRegionTnmntTableNative")] = ".dtnmt"
-fileExts[jamcrc("rDLCSubQuestDataNative")] = ".dsuqd"
-fileExts[jamcrc("rDLCVsRuleTableNative")] = ".dvsrule"
-fileExts[jamcrc("rEnemyCameraParamNative")] = ".ecpd"
-fileExts[jamcrc("rLimitedShopDataNative")] = ".lshpd"
-fileExts[jamcrc("rLimitedShopPlaceDataNative")] = ".lshppd"
-fileExts[jamcrc("rLinkPrizeDataNative")] = ".lpd"
-fileExts[jamcrc("rMedalCompRewardNative")] = ".mcr"
-fileExts[jamcrc("rMonsterEnumConversionTableNative")] = ".mectd"
-fileExts[jamcrc("rNavirouAccessoryDataNative")] = ".nad"
-fileExts[jamcrc("rNestEggReviewANative")] = ".nstera"
-fileExts[jamcrc("rNestEggReviewBNative")] = ".nsterb"
-fileExts[jamcrc("rNestMessageNative")] = ".nstmsg"
-fileExts[jamcrc("rOtomonCameraParamNative")] = ".ocpd"
-fileExts[jamcrc("rPostmanRewardDataNative")] = ".pmrd"
-fileExts[jamcrc("rStaffRollCutDataNative")] = ".srcd"
-fileExts[jamcrc("rWorldMapMaskDataNative")] = ".wmmd"
-fileExts[jamcrc("rTalkDemoViewSpriteDataNative")] = ".tdvs"
-fileExts[jamcrc("rArmorParamNative")] = ".arp"
-fileExts[jamcrc("rDLCTableNative")] = ".dlc"
-fileExts[jamcrc("rMedalDataListNative")] = ".mdl"
-fileExts[jamcrc("rMyhouseBoxCameraDataNative")] = ".mbcd"
-fileExts[jamcrc("rStoryTalkBalloonNative")] = ".stb"
-fileExts[jamcrc("rWeaponParamNative")] = ".wpp"
-fileExts[jamcrc("rBattleEnemyFileNative")] = ".bef"
-fileExts[jamcrc("rConditionPriorityDataNative")] = ".cndp"
-fileExts[jamcrc("rGatherLevelTableNative")] = ".ghlt"
-fileExts[jamcrc("rLimitedShopNpcList")] = ".lsnl"
-fileExts[jamcrc("rMonsterBookDataNative")] = ".mbd"
-fileExts[jamcrc("rPresetParamNative")] = ".tpp"
-fileExts[jamcrc("rPresetParamEquipNative")] = ".tppe"
-fileExts[jamcrc("rPresetParamItemNative")] = ".tppi"
-fileExts[jamcrc("rPresetParamPlayerNative")] = ".tppp"
-fileExts[jamcrc("rSkillFlagNative")] = ".skf"
-fileExts[jamcrc("rAppMovie")] = ".dat"
-fileExts[jamcrc("rAppMovieIntermediate")] = ".wmv"
-fileExts[jamcrc("rCardPose")] = ".cps"
-fileExts[jamcrc("rRideParamNative")] = ".rdp"
-fileExts[jamcrc("rSequenceCameraList")] = ".scl"
-fileExts[jamcrc("rResourceNameForDevNative")] = ".rnmd"
-fileExts[jamcrc("rChestItemTableDataNative")] = ".cfid"
-fileExts[jamcrc("rGatherSetTableDataNative")] = ".gstd"
-fileExts[jamcrc("rFldPlParam_ARNative")] = ".fppar"
-fileExts[jamcrc("rFldPlParam_GRNative")] = ".fppgr"
-fileExts[jamcrc("rFldPlParam_NRNative")] = ".fppnr"
-fileExts[jamcrc("rFldPlParam_WRNative")] = ".fppwr"
-fileExts[jamcrc("rAccessoryDataNative")] = ".acd"
-fileExts[jamcrc("rAccessoryRareNative")] = ".acr"
-fileExts[jamcrc("rAccessorySkillNative")] = ".acs"
-fileExts[jamcrc("rArmorDataNative")] = ".ard"
-fileExts[jamcrc("rBattleArenaTableNative")] = ".bat"
-fileExts[jamcrc("rBattleCommonResourceNative")] = ".bcmr"
-fileExts[jamcrc("rBattleEnemySetNative")] = ".bes"
-fileExts[jamcrc("rBattleEnemyTblNative")] = ".bemt"
-fileExts[jamcrc("rBattleEnemyTblPlanNative")] = ".bemtp"
-fileExts[jamcrc("rBattleNpcTblNative")] = ".bnt"
-fileExts[jamcrc("rBattlePlayerTblNative")] = ".bplt"
-fileExts[jamcrc("rBattleResultBonusNative")] = ".brsb"
-fileExts[jamcrc("rBattleStageResourceNative")] = ".bstr"
-fileExts[jamcrc("rBattleWeaponTblNative")] = ".bwpt"
-fileExts[jamcrc("rBroilerFlavorDataNative")] = ".bfd"
-fileExts[jamcrc("rBuddyPathDataNative")] = ".bdypa"
-fileExts[jamcrc("rBuddyPlanDataNative")] = ".bdypl"
-fileExts[jamcrc("rCallingEncountDataNative")] = ".sce"
-fileExts[jamcrc("rConditionNameDataNative")] = ".cnd"
-fileExts[jamcrc("rDemoDataNative")] = ".dmd"
-fileExts[jamcrc("rDemoFlagDataNative")] = ".dfd"
-fileExts[jamcrc("rEggBaseColorDataNative")] = ".ebc"
-fileExts[jamcrc("rEncntEnemyPartyNative")] = ".eepd"
-fileExts[jamcrc("rEquiprShopDataNative")] = ".eshd"
-fileExts[jamcrc("rFieldAISetActNative")] = ".fasa"
-fileExts[jamcrc("rFieldAISetKindNative")] = ".fask"
-fileExts[jamcrc("rFieldEnemyPathDataNative")] = ".fedpa"
-fileExts[jamcrc("rFieldEnemyPlanDataNative")] = ".fedpl"
-fileExts[jamcrc("rFieldHuntingDataNative")] = ".fhd"
-fileExts[jamcrc("rFieldMotionPackageDataNative")] = ".fmpd"
-fileExts[jamcrc("rFieldNpcMotionNative")] = ".fnmd"
-fileExts[jamcrc("rFieldPlayerMotionDataNative")] = ".fpm"
-fileExts[jamcrc("rFieldSetFlagDataNative")] = ".fsfd"
-fileExts[jamcrc("rFurattoFieldDataNative")] = ".fofd"
-fileExts[jamcrc("rFurattoTrendDataNative")] = ".fotd"
-fileExts[jamcrc("rGalleryFlagDataNative")] = ".gfd"
-fileExts[jamcrc("rGatherCommentDataNative")] = ".gcd"
-fileExts[jamcrc("rGeneEditNative")] = ".ged"
-fileExts[jamcrc("rGeneLottingNative")] = ".glt"
-fileExts[jamcrc("rGeneralCountDataNative")] = ".gcd"
-fileExts[jamcrc("rGeneralFlagDataNative")] = ".gfd"
-fileExts[jamcrc("rGeneTableNative")] = ".gtb"
-fileExts[jamcrc("rItemDataNative")] = ".itm"
-fileExts[jamcrc("rItemMixNative")] = ".mix"
-fileExts[jamcrc("rMainQuestDataNative")] = ".mqsd"
-fileExts[jamcrc("rMapMarkerNative")] = ".mmk"
-fileExts[jamcrc("rMarkerDataNative")] = ".mkr"
-fileExts[jamcrc("rMaterialDataNative")] = ".matd"
-fileExts[jamcrc("rMergeStreamDataNative")] = ".asd"
-fileExts[jamcrc("rMixFlagNative")] = ".mxf"
-fileExts[jamcrc("rMonsterRankTableNative")] = ".mrt"
-fileExts[jamcrc("rNekoTaxiStationDataNative")] = ".nsd"
-fileExts[jamcrc("rNestHappeningNative")] = ".nhap"
-fileExts[jamcrc("rNestHappeningProbNative")] = ".nhapp"
-fileExts[jamcrc("rNpcAirouSetResourceLogDataNative")] = ".nasl"
-fileExts[jamcrc("rNpcSetResourceLogDataNative")] = ".npsl"
-fileExts[jamcrc("rReactionCommentDataNative")] = ".rcd"
-fileExts[jamcrc("rRiderNoteDataNative")] = ".rnd"
-fileExts[jamcrc("rRiderNoteLargeCategoryDataNative")] = ".rnld"
-fileExts[jamcrc("rRiderNotePageDataNative")] = ".rnpd"
-fileExts[jamcrc("rRiderNoteSmallCategoryDataNative")] = ".rnsd"
-fileExts[jamcrc("rRiderNoteThumbnailDataNative")] = ".rntd"
-fileExts[jamcrc("rShortDemoDataNative")] = ".sdm"
-fileExts[jamcrc("rSkillTableNative")] = ".skt"
-fileExts[jamcrc("rStChapDataNative")] = ".schd"
-fileExts[jamcrc("rStEpiDataNative")] = ".sed"
-fileExts[jamcrc("rStoryCountDataNative")] = ".scod"
-fileExts[jamcrc("rStoryDataNative")] = ".std"
-fileExts[jamcrc("rStoryFlagDataNative")] = ".stfd"
-fileExts[jamcrc("rStPrComDataNative")] = ".spcd"
-fileExts[jamcrc("rSubQuestCountDataNative")] = ".sqcd"
-fileExts[jamcrc("rSubQuestFlagDataNative")] = ".sqfd"
-fileExts[jamcrc("rSubStEpiDataNative")] = ".ssed"
-fileExts[jamcrc("rSystemCountDataNative")] = ".sycd"
-fileExts[jamcrc("rTalkDemoActorDataNative")] = ".tdmact"
-fileExts[jamcrc("rTalkDemoCommandDataNative")] = ".tdmcmd"
-fileExts[jamcrc("rTalkDemoDataNative")] = ".tdmd"
-fileExts[jamcrc("rTalkDemoEffectDataNative")] = ".tdmeff"
-fileExts[jamcrc("rTalkDemoFaceDataNative")] = ".tdmfc"
-fileExts[jamcrc("rTalkDemoMotionDataNative")] = ".tdmmot"
-fileExts[jamcrc("rTalkDemoPoseDataNative")] = ".tdmpos"
-fileExts[jamcrc("rTalkDemoScript")] = ".tdms"
-fileExts[jamcrc("rTalkInfoDataNative")] = ".tid"
-fileExts[jamcrc("rTalkMsgDataNative")] = ".tmd"
-fileExts[jamcrc("rTalkSelectDataNative")] = ".tstd"
-fileExts[jamcrc("rWeaponDataNative")] = ".wpd"
-fileExts[jamcrc("rFieldGateDataNative")] = ".fgd"
-fileExts[jamcrc("rMHFSMList")] = ".fslm"
-fileExts[jamcrc("rWipeData")] = ".wpdt"
-fileExts[jamcrc("rBattleAtkNative")] = ".btat"
-fileExts[jamcrc("rFieldBuddyMotionDataNative")] = ".fbd"
-fileExts[jamcrc("rFieldDataNative")] = ".fld"
-fileExts[jamcrc("rFieldEnemySetDataNative")] = ".fesd"
-fileExts[jamcrc("rFieldIngredientSetDataNative")] = ".fisd"
-fileExts[jamcrc("rFieldMotionDataNative")] = ".fmd"
-fileExts[jamcrc("rFieldOrnamentSetDataNative")] = ".fosd"
-fileExts[jamcrc("rFieldPredatorDataNative")] = ".fprd"
-fileExts[jamcrc("rFieldSchedulerSetDataNative")] = ".fssd"
-fileExts[jamcrc("rMonsterRaceDataNative")] = ".mrd"
-fileExts[jamcrc("rNpcTalkNative")] = ".ntk"
-fileExts[jamcrc("rShopDataNative")] = ".shp"
-fileExts[jamcrc("rSystemFlagDataNative")] = ".sfd"
-fileExts[jamcrc("rTalkDataNative")] = ".tlk"
-fileExts[jamcrc("rProofEffectColorControl")] = ".pec"
-fileExts[jamcrc("rProofEffectList")] = ".pel"
-fileExts[jamcrc("rProofEffectMotSequenceList")] = ".psl"
-fileExts[jamcrc("rProofEffectParamScript")] = ".pep"
-fileExts[jamcrc("rCameraData")] = ".cmdt"
-fileExts[jamcrc("rColorLinkColor")] = ".clc"
-fileExts[jamcrc("rColorLinkInfo")] = ".cli"
-fileExts[jamcrc("rConditionChangeInfo")] = ".ccinfo"
-fileExts[jamcrc("rDollPartsDisp")] = ".dpd"
-fileExts[jamcrc("rGroundAdjustment")] = ".gar"
-fileExts[jamcrc("rModelEasyAnime")] = ".mea"
-fileExts[jamcrc("rModelInPath")] = ".mip"
-fileExts[jamcrc("rMonsterPartsDisp")] = ".mpd"
-fileExts[jamcrc("rNavirouPartsDisp")] = ".npd"
-fileExts[jamcrc("rPartsVisibleInfo")] = ".pvi"
-fileExts[jamcrc("rSchedulerPreLoadList")] = ".spll"
-fileExts[jamcrc("rShadowParamNative")] = ".swp"
-fileExts[jamcrc("rVirtualJoint")] = ".vjr"
-fileExts[jamcrc("rWeaponGimmickInfo")] = ".wgi"
-fileExts[jamcrc("rWeaponOfsForBodyNative")] = ".wofb"
-fileExts[jamcrc("cResource")] = ".ext"
-fileExts[jamcrc("rModel")] = ".mod"
-fileExts[jamcrc("rMotionList")] = ".lmt"
-fileExts[jamcrc("rTexture")] = ".tex"
-fileExts[jamcrc("rCollision")] = ".sbc"
-fileExts[jamcrc("rAIWayPointGraph")] = ".gway"
-fileExts[jamcrc("rScheduler")] = ".sdl"
-fileExts[jamcrc("rArchive")] = ".arc"
-fileExts[jamcrc("rCnsTinyChain")] = ".ctc"
-fileExts[jamcrc("rChain")] = ".chn"
-fileExts[jamcrc("rChainCol")] = ".ccl"
-fileExts[jamcrc("rAIFSM")] = ".fsm"
-fileExts[jamcrc("rAIFSMList")] = ".fsl"
-fileExts[jamcrc("rAIConditionTree")] = ".cdt"
-fileExts[jamcrc("rCameraList")] = ".lcm"
-fileExts[jamcrc("rGUI")] = ".gui"
-fileExts[jamcrc("rRenderTargetTexture")] = ".rtex"
-fileExts[jamcrc("rEffect2D")] = ".e2d"
-fileExts[jamcrc("rGUIFont")] = ".gfd"
-fileExts[jamcrc("rGUIIconInfo")] = ".gii"
-fileExts[jamcrc("rGUIStyle")] = ".gst"
-fileExts[jamcrc("rGUIMessage")] = ".gmd"
-fileExts[jamcrc("rDeformWeightMap")] = ".dwm"
-fileExts[jamcrc("rSwingModel")] = ".swm"
-fileExts[jamcrc("rVibration")] = ".vib"
-fileExts[jamcrc("rSoundRequest")] = ".srqr"
-fileExts[jamcrc("rSoundStreamRequest")] = ".stqr"
-fileExts[jamcrc("rSoundCurveSet")] = ".scsr"
-fileExts[jamcrc("rSoundDirectionalSet")] = ".sdsr"
-fileExts[jamcrc("rSoundEQ")] = ".equr"
-fileExts[jamcrc("rSoundReverb")] = ".revr"
-fileExts[jamcrc("rSoundCurveXml")] = ".scvr.xml"
-fileExts[jamcrc("rSoundDirectionalCurveXml")] = ".sdcr.xml"
-fileExts[jamcrc("rSoundBank")] = ".sbkr"
-fileExts[jamcrc("rSoundPhysicsRigidBody")] = ".sprr"
-fileExts[jamcrc("rSoundPhysicsSoftBody")] = ".spsr"
-fileExts[jamcrc("rSoundPhysicsJoint")] = ".spjr"
-fileExts[jamcrc("rShader2")] = ".mfx"
-fileExts[jamcrc("rImplicitSurface")] = ".is"
-fileExts[jamcrc("rMovie")] = ".ext"
-fileExts[jamcrc("rMovieOnMemory")] = ".mem.wmv"
-fileExts[jamcrc("rMovieOnDisk")] = ".wmvd"
-fileExts[jamcrc("rMovieOnMemoryInterMediate")] = ".mem.wmv"
-fileExts[jamcrc("rMovieOnDiskInterMediate")] = ".wmvd"
-fileExts[jamcrc("rSceneTexture")] = ".stex"
-fileExts[jamcrc("rGrass2")] = ".gr2"
-fileExts[jamcrc("rGrass2Setting")] = ".gr2s"
-fileExts[jamcrc("rOccluder")] = ".occ"
-fileExts[jamcrc("rISC")] = ".isc"
-fileExts[jamcrc("rSky")] = ".sky"
-fileExts[jamcrc("rStarCatalog")] = ".stc"
-fileExts[jamcrc("rCloud")] = ".cld"
-fileExts[jamcrc("rSoundSourcePC")] = ".ext"
-fileExts[jamcrc("rSoundSourceMSADPCM")] = ".xsew"
-fileExts[jamcrc("rSoundSourceOggVorbis")] = ".sngw"
-fileExts[jamcrc("rEffectList")] = ".efl"
-fileExts[jamcrc("rCollisionHeightField")] = ".sbch"
-fileExts[jamcrc("rCnsIK")] = ".ik"
-fileExts[jamcrc("rShaderPackage")] = ".spkg"
-fileExts[jamcrc("rShaderCache")] = ".sch"
-fileExts[jamcrc("rMaterial")] = ".mrl"
-fileExts[jamcrc("rSoundSpeakerSetXml")] = ".sssr.xml"
-fileExts[jamcrc("rCollisionObj")] = ".obc"
-fileExts[jamcrc("rGrass")] = ".grs"
-fileExts[jamcrc("rConstraint")] = ".ext"
-fileExts[jamcrc("rCnsLookAt")] = ".lat"
-fileExts[jamcrc("rEffectAnim")] = ".ean"
-fileExts[jamcrc("rEffectStrip")] = ".efs"
-fileExts[jamcrc("rVertices")] = ".vts"
-fileExts[jamcrc("rNulls")] = ".nls"
-fileExts[jamcrc("rAI")] = ".ais"
-fileExts[jamcrc("rSoundPhysicsList")] = ".splr"
-fileExts[jamcrc("rFacialAnimation")] = ".fca"
-fileExts[jamcrc("rMetaSet")] = ".mst"
-fileExts[jamcrc("rMetaSetXml")] = ".mst.xml"
-fileExts[jamcrc("rCnsTinyIK")] = ".tik"
-fileExts[jamcrc("rCnsScaleNormalize")] = ".scnl"
-fileExts[jamcrc("rCnsRotateLimit")] = ".lim"
-fileExts[jamcrc("rCnsMatrix")] = ".mtx"
-fileExts[jamcrc("rCnsJointOffset")] = ".jof"
-fileExts[jamcrc("rCnsParent")] = ".par"
-fileExts[jamcrc("rCnsParentN")] = ".pan"
-fileExts[jamcrc("rCnsLookAtEyeball")] = ".eye"
-fileExts[jamcrc("rGraphPatch")] = ".gpt"
-fileExts[jamcrc("rGrassWind")] = ".grw"
-fileExts[jamcrc("rConvexHull")] = ".hul"
-fileExts[jamcrc("rGeometry2")] = ".geo2"
-fileExts[jamcrc("rGeometry3")] = ".geo3"
-fileExts[jamcrc("rSerial")] = ".srt"
-fileExts[jamcrc("rDynamicSbc")] = ".dsc"
-fileExts[jamcrc("rGeometry2Group")] = ".geog"
+fileExts = {extension_hash: extension for extension_hash, (_, extension) in ARC_FILE_TYPES.items()}
+fileClassHashes = {class_name: extension_hash for extension_hash, (class_name, _) in ARC_FILE_TYPES.items()}
+# Reverse indexes, from an extension to the hashes and the names of its resource classes
+fileExtHashes = {}
+fileExtClasses = {}
+for extension_hash, (class_name, extension) in ARC_FILE_TYPES.items():
+    fileExtHashes.setdefault(extension, []).append(extension_hash)
+    fileExtClasses.setdefault(extension, []).append(class_name)
+knownExtHashes = np.array(sorted(fileExts), dtype=np.uint32)
+
+ARC_MAGIC = 4411969 # "ARC\0"
+ARC_MAGIC_ENCRYPTED = 1128485441 # "ARCC"
+ARC_HEADER_SIZE = 8
+ARC_TOC_ENTRY_SIZE = 144
+ARC_KEY = b"QZHaM;-5:)dV#"
+DECRYPT_CHUNK_SIZE = 4*1024*1024
+INFLATE_CHUNK_SIZE = 1024*1024
+PIPELINE_QUEUE_SIZE = 8 # chunks waiting to be written, per writer thread
+PIPELINE_MAX_OPEN_FILES = 64 # entries being inflated or written at the same time, per pipeline
+ARC_MANIFEST_FILENAME = "arc_manifest.json"
+ARC_CONFLICTS_FILENAME = "arc_conflicts.json"
+EXTRACTION_STATS_FILENAME = "extraction_stats.json"
+EXTRACTION_STAGES = ["read", "hash", "decrypt", "toc", "inflate", "mkdir", "write"]
+ARC_STORE_FOLDER = ".arc_store"
+ARC_JOURNAL_FILENAME = "arc_journal.jsonl"
+TEMP_SUFFIX = ".tmp"
+FICLONE = 0x40049409 # Linux ioctl cloning a file (reflink)
+# A TOC record, decoded for all the entries of an archive at once
+ARC_TOC_DTYPE = np.dtype([
+    ("path", "S128"),
+    ("extension_hash", "<u4"),
+    ("compressed_size", "<u4"),
+    ("decompressed_size", "<u4"),
+    ("offset", "<u4"),
+])
 
 class Reader():
     def __init__(self, data):
@@ -679,15 +201,7 @@ def SetLoggingLevel(level):
     elif level == "ERROR":
         logger.setLevel(logging.ERROR)
 
-def bulk_extract_arc(context):
-
-    candidate_modules = [mod for mod in addon_utils.modules() if mod.bl_info["name"] == "MH Stories 2 tool suite"]
-    if len(candidate_modules) > 1:
-        logger.warning("Inconsistencies while loading the addon preferences: make sure you don't have multiple versions of the addon installed.")
-    mod = candidate_modules[0]
-    addon_prefs = context.preferences.addons[mod.__name__].preferences
-    SetLoggingLevel(addon_prefs.logging_level)
-
+def load_blowfish_library():
     shared_library_path = None
     shared_library_filename = "blowfish.so"
     if sys.platform == "linux" or sys.platform == "linux2":
@@ -698,127 +212,955 @@ def bulk_extract_arc(context):
     shared_library_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), shared_library_filename)
 
     lib = ctypes.cdll.LoadLibrary(shared_library_path)
-    lib.decrypt_arc.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.c_void_p, ctypes.c_uint]
+    lib.decrypt_arc.argtypes = [ctypes.c_void_p, ctypes.c_uint64, ctypes.c_void_p, ctypes.c_uint64]
     lib.decrypt_arc.restype = ctypes.c_int
+    if hasattr(lib, "encrypt_arc"):
+        # Missing from builds of the library older than the archive repacker
+        lib.encrypt_arc.argtypes = [ctypes.c_void_p, ctypes.c_uint64, ctypes.c_void_p, ctypes.c_uint64]
+        lib.encrypt_arc.restype = ctypes.c_int
+    return lib
+
+_blowfish_lib = None
 
-    extraction_path = addon_prefs.game_path
-    if extraction_path == "":
-        logger.error("Fill the game path before starting the ARC file extraction")
+def get_blowfish_library():
+    # Each worker process loads its own handle on first use
+    global _blowfish_lib
+    if _blowfish_lib is None:
+        _blowfish_lib = load_blowfish_library()
+    return _blowfish_lib
+
+def release_blowfish_library():
+    global _blowfish_lib
+    if _blowfish_lib is None:
         return
+    if sys.platform == "win32":
+        dll_close = ctypes.windll.kernel32.FreeLibrary
+        dll_close.argtypes = [ctypes.c_void_p]
+        dll_close(_blowfish_lib._handle)
+    _blowfish_lib = None
+
+def decrypt_arc_data(lib, data, key=ARC_KEY, thread_count=None):
+    apply_arc_cipher(lib, lib.decrypt_arc, data, key, thread_count)
+
+def encrypt_arc_data(lib, data, key=ARC_KEY, thread_count=None):
+    if not hasattr(lib, "encrypt_arc"):
+        raise RuntimeError("This build of the blowfish library can't encrypt archives, build it again from blowfish.c")
+    apply_arc_cipher(lib, lib.encrypt_arc, data, key, thread_count)
+
+# The process which started the OpenMP threads of the blowfish library. Workers forked from it
+# inherit them broken: an OpenMP call there with more than one thread never returns.
+_openmp_pid = None
+
+def apply_arc_cipher(lib, cipher, data, key=ARC_KEY, thread_count=None):
+    # Blowfish ECB blocks are independent, so the buffer is split in 8 bytes aligned chunks processed
+    # on several threads (the ctypes call releases the GIL). Builds of the library compiled with
+    # OpenMP (the linux one) already split the work themselves: they are called once, with their
+    # number of threads set to thread_count. In a process forked after OpenMP started, they are
+    # split in chunks too, each call running on one OpenMP thread.
+    global _openmp_pid
+    if thread_count is None:
+        thread_count = os.cpu_count() or 1
+    thread_count = max(1, thread_count)
+    openmp_thread_count = None
+    if hasattr(lib, "omp_set_num_threads"):
+        if _openmp_pid is None and thread_count > 1:
+            _openmp_pid = os.getpid()
+        if _openmp_pid is None or _openmp_pid == os.getpid():
+            openmp_thread_count = thread_count
+            thread_count = 1
+        else:
+            openmp_thread_count = 1
+    data_array = np.frombuffer(data, np.uint8)
+    key_array = np.frombuffer(key, np.uint8)
+    data_pointer = data_array.ctypes.data
+    key_pointer = key_array.ctypes.data
+    # A trailing partial block can't be processed on its own
+    data_size = len(data_array) - len(data_array)%8
+
+    def apply_chunk(start, size):
+        if openmp_thread_count is not None:
+            # Set for the calling thread only
+            lib.omp_set_num_threads(openmp_thread_count)
+        cipher(data_pointer + start, size, key_pointer, len(key_array))
 
-    if not os.path.isdir(extraction_path):
-        logger.error("Unable to access folder " + str(extraction_path))
+    chunk_size = max(DECRYPT_CHUNK_SIZE, -(-data_size // thread_count))
+    chunk_size += -chunk_size%8
+    chunks = [(start, min(chunk_size, data_size - start)) for start in range(0, data_size, chunk_size)]
+    if thread_count == 1 or len(chunks) <= 1:
+        apply_chunk(0, data_size)
         return
+    with ThreadPoolExecutor(max_workers=thread_count) as pool:
+        list(pool.map(lambda chunk: apply_chunk(*chunk), chunks))
 
-    if addon_prefs.installation_game_path == "":
-        installation_path = extraction_path
-    else:
-        if not os.path.isdir(addon_prefs.installation_game_path):
-            logger.error("Unable to access folder " + str(addon_prefs.installation_game_path))
-            return
-        installation_path = addon_prefs.installation_game_path
+def create_worker_pool(worker_count):
+    # Forked workers inherit the already imported addon, while spawned ones would have to import it
+    # again (and bpy with it), so threads are used where fork isn't available. Decryption, zlib and
+    # file writes all release the GIL. Run headless (python -m arc), this module imports without
+    # blender and can be spawned.
+    if sys.platform == "linux" or sys.platform == "linux2":
+        return ProcessPoolExecutor(max_workers=worker_count, mp_context=multiprocessing.get_context("fork"))
+    if __name__.split(".")[0] == "arc":
+        return ProcessPoolExecutor(max_workers=worker_count, mp_context=multiprocessing.get_context("spawn"))
+    return ThreadPoolExecutor(max_workers=worker_count)
+
+def split_filter_string(filter_string):
+    return [x.strip() for x in filter_string.split(",") if x.strip() != ""]
+
+def get_class_hashes(class_name):
+    # The hashes of a resource class name (e.g. rTexture), or of all the classes of an extension
+    # (e.g. .tex)
+    if class_name.startswith("."):
+        if class_name not in fileExtClasses:
+            logger.warning("Unknown extension " + class_name + " in the extraction filters")
+            return [jamcrc(class_name)]
+        return fileExtHashes[class_name]
+    if class_name not in fileClassHashes:
+        logger.warning("Unknown resource class " + class_name + " in the extraction filters")
+        return [jamcrc(class_name)]
+    return [fileClassHashes[class_name]]
+
+class ArcFilter():
+    # Selects archive entries by glob on their path (extension included, "*" also matches "/") and by
+    # resource class name (as found in the fileExts table, e.g. rModel or rTexture) or extension
+    def __init__(self, include_paths=None, exclude_paths=None, include_classes=None, exclude_classes=None):
+        self.include_paths = [x.replace("\\", "/").lower() for x in include_paths or []]
+        self.exclude_paths = [x.replace("\\", "/").lower() for x in exclude_paths or []]
+        self.include_classes = list(include_classes or [])
+        self.exclude_classes = list(exclude_classes or [])
+        self.include_hashes = set(class_hash for x in self.include_classes for class_hash in get_class_hashes(x))
+        self.exclude_hashes = set(class_hash for x in self.exclude_classes for class_hash in get_class_hashes(x))
+
+    def is_empty(self):
+        return len(self.include_paths) + len(self.exclude_paths) + len(self.include_hashes) + len(self.exclude_hashes) == 0
+
+    def match(self, path, extension_hashes):
+        path = path.lower()
+        if len(self.include_hashes) > 0 and not any(x in self.include_hashes for x in extension_hashes):
+            return False
+        if any(x in self.exclude_hashes for x in extension_hashes):
+            return False
+        if len(self.include_paths) > 0 and not any(fnmatchcase(path, x) for x in self.include_paths):
+            return False
+        if any(fnmatchcase(path, x) for x in self.exclude_paths):
+            return False
+        return True
+
+    def match_file_info(self, file_info):
+        return self.match(file_info["file_path"] + file_info["extension"], [file_info["extension_hash"]])
 
+    def match_toc(self, toc, mask=None):
+        # Boolean mask of the matching records of a decoded TOC (see decode_arc_toc), among those of
+        # mask. Classes are matched on the whole array, globs only on the records left.
+        mask = np.ones(len(toc), dtype=bool) if mask is None else mask.copy()
+        if len(self.include_hashes) > 0:
+            mask &= np.isin(toc["extension_hash"], np.array(list(self.include_hashes), dtype=np.uint32))
+        if len(self.exclude_hashes) > 0:
+            mask &= ~np.isin(toc["extension_hash"], np.array(list(self.exclude_hashes), dtype=np.uint32))
+        if len(self.include_paths) + len(self.exclude_paths) > 0:
+            indexes = np.flatnonzero(mask)
+            paths = toc["path"][indexes].tolist()
+            extension_hashes = toc["extension_hash"][indexes].tolist()
+            for record_i, path, extension_hash in zip(indexes, paths, extension_hashes):
+                mask[record_i] = self.match(decode_toc_path(path) + fileExts.get(extension_hash, ""), [extension_hash])
+        return mask
 
+def write_json_file(path, data, **kwargs):
+    # The file is replaced at once, a crash never leaves it half written
+    with open(path + TEMP_SUFFIX, "w") as json_out:
+        json.dump(data, json_out, **kwargs)
+    os.replace(path + TEMP_SUFFIX, path)
+
+def arc_priority(arc_path):
+    # When the same asset is found in several archives, the one with the highest priority wins:
+    # archives in a patch folder (or named after one) override the base ones, ties are broken by
+    # their relative path so that the outcome never depends on the order the filesystem lists them.
+    arc_path = arc_path.replace("\\", "/").lower()
+    is_patch = any(part.startswith("patch") for part in arc_path.split("/"))
+    return (is_patch, arc_path)
+
+def find_arc_files(installation_path):
     arc_files = glob(os.path.join(installation_path, "**", "*.arc"), recursive=True)
-    logger.info("Found " + str(len(arc_files)) + " arc files.")
+    return sorted(arc_files, key=lambda arc_file: arc_priority(os.path.relpath(arc_file, installation_path)))
 
-    extracted_file_count = 0
-    file_list = set()
-    for arc_file_i, arc_file in enumerate(arc_files):
-        with open(arc_file, "rb") as file_in:
-            data = file_in.read()
-        arc_bs = Reader(data)
+def decode_arc_toc(toc_data, file_count):
+    # A structured array over the TOC records, no copy is made
+    return np.frombuffer(toc_data, dtype=ARC_TOC_DTYPE, count=file_count)
+
+def decode_toc_path(path):
+    # The path is null terminated, whatever follows the first null is padding
+    return path.split(b"\0", 1)[0].decode("latin-1").replace("\\", "/")
+
+def select_arc_toc(toc, arc_filter=None):
+    # The indexes of the records of a known resource class, and matching arc_filter
+    mask = np.isin(toc["extension_hash"], knownExtHashes)
+    if arc_filter is not None:
+        mask = arc_filter.match_toc(toc, mask)
+    return np.flatnonzero(mask)
+
+def toc_paths(toc, indexes):
+    # The paths (extension included) of some records of a decoded TOC, of a known resource class
+    records = toc[indexes]
+    return [decode_toc_path(path) + fileExts[extension_hash] for path, extension_hash in zip(records["path"].tolist(), records["extension_hash"].tolist())]
+
+def toc_file_infos(toc, indexes=None):
+    # The dicts of some records of a decoded TOC (all of them by default)
+    records = toc if indexes is None else toc[indexes]
+    file_infos = []
+    # Whole columns are converted at once, records one by one would be much slower
+    for path, extension_hash, compressed_size, decompressed_size, offset in zip(*(records[field].tolist() for field in ARC_TOC_DTYPE.names)):
+        file_infos.append({
+            "file_path": decode_toc_path(path),
+            "extension_hash": extension_hash,
+            "extension": fileExts.get(extension_hash),
+            "compressed_size": compressed_size,
+            "decompressed_size": decompressed_size & 0x1fffffff, # the top bits are flags
+            "offset": offset - ARC_HEADER_SIZE, # because the header isn't included
+        })
+    return file_infos
+
+def list_arc_toc(arc_file):
+    # Only the header and the TOC records are read: ECB blocks being independent, the TOC can be
+    # decrypted without touching the rest of the archive. Returns the decoded TOC.
+    with open(arc_file, "rb") as file_in:
+        arc_bs = Reader(file_in.read(ARC_HEADER_SIZE))
         magic = arc_bs.readUInt()
         _ = arc_bs.readUShort()
         file_count = arc_bs.readUShort()
-        if magic == 1128485441:
-            # Encrypted arc
-            ebs = Reader(arc_bs.data[arc_bs.offset:])
-            key = b"QZHaM;-5:)dV#"
-            ret = lib.decrypt_arc(
-                np.frombuffer(ebs.data, np.uint8).ctypes.data_as(ctypes.c_void_p),
-                len(ebs.data),
-                np.frombuffer(key, np.uint8).ctypes.data_as(ctypes.c_void_p),
-                len(key)
-            )
-            bs = Reader(ebs.data)
-
-        elif magic == b"ARC\x00":
-            # Regular arc
-            bs = Reader(arc_bs.data[bs.offset:])
-        else:
-            logger.warning("File " + arc_file + " is not an recognized ARC file. ")
+        toc_data = bytearray(file_in.read(file_count * ARC_TOC_ENTRY_SIZE))
+
+    if magic == ARC_MAGIC_ENCRYPTED:
+        decrypt_arc_data(get_blowfish_library(), toc_data, thread_count=1)
+    elif magic != ARC_MAGIC:
+        logger.warning("File " + arc_file + " is not an recognized ARC file. ")
+        return None
+    return decode_arc_toc(toc_data, file_count)
+
+def list_arc(arc_file):
+    toc = list_arc_toc(arc_file)
+    if toc is None:
+        return None
+    return toc_file_infos(toc)
+
+def find_archived_files(installation_path, worker_count=1, arc_filter=None):
+    # The entry (with its "arc_file") each file of the game is extracted from. Archives are listed by
+    # increasing priority, so a later entry replaces an earlier one.
+    arc_files = find_arc_files(installation_path)
+    if worker_count == 1:
+        arc_tocs = list(map(list_arc_toc, arc_files))
+    else:
+        with create_worker_pool(worker_count) as pool:
+            arc_tocs = list(pool.map(list_arc_toc, arc_files))
+
+    archived_files = {}
+    for arc_file, toc in zip(arc_files, arc_tocs):
+        if toc is None:
             continue
+        for file_info in toc_file_infos(toc, select_arc_toc(toc, arc_filter)):
+            file_info["arc_file"] = arc_file
+            archived_files[(file_info["file_path"] + file_info["extension"]).lower()] = file_info
+    return archived_files
 
-        file_infos = []
-
-        for file_i in range(file_count):
-            file_info = {}
-            starting_point = bs.tell()
-            file_info["file_path"] = bs.readString().replace("\\", "/")
-            bs.seek(starting_point + 128)
-            extension_hash = bs.readUInt()
-            if extension_hash in fileExts.keys():
-                file_info["extension"] = fileExts[extension_hash]
-            file_info["compressed_size"] = bs.readUInt()
-            file_info["decompressed_size"] = bs.readUInt()
-            file_info["offset"] = bs.readUInt() - 8 # because the header isn't included
-            if extension_hash not in fileExts.keys():
-                continue
-            file_infos.append(file_info)
+def read_arc_entry_payload(arc_file, file_info):
+    # Reads and decrypts only the 8 bytes aligned range covering the compressed payload of one
+    # entry of the TOC (as returned by list_arc or toc_file_infos).
+    start = file_info["offset"] - file_info["offset"]%8
+    end = file_info["offset"] + file_info["compressed_size"]
+    end += -end%8
+    with open(arc_file, "rb") as file_in:
+        magic = Reader(file_in.read(4)).readUInt()
+        file_in.seek(ARC_HEADER_SIZE + start)
+        data = bytearray(file_in.read(end - start))
+
+    if magic == ARC_MAGIC_ENCRYPTED:
+        decrypt_arc_data(get_blowfish_library(), data, thread_count=1)
+    elif magic != ARC_MAGIC:
+        raise RuntimeError(str(arc_file) + " is not a recognized ARC file (magic = " + str(magic) + ")")
+    payload_start = file_info["offset"] - start
+    return memoryview(data)[payload_start:payload_start + file_info["compressed_size"]]
+
+def read_arc_entry(arc_file, file_info):
+    return zlib.decompress(read_arc_entry_payload(arc_file, file_info))
+
+class StageTimes():
+    # Bytes, operations and seconds spent in each stage of an extraction. Threads add to it
+    # concurrently, so the seconds of a stage are summed over the threads running it.
+    def __init__(self):
+        self.stages = {stage: {"bytes": 0, "count": 0, "seconds": 0.0} for stage in EXTRACTION_STAGES}
+        self.lock = threading.Lock()
+
+    def add(self, stage, start_time, byte_count=0):
+        seconds = time.perf_counter() - start_time
+        with self.lock:
+            self.stages[stage]["bytes"] += byte_count
+            self.stages[stage]["count"] += 1
+            self.stages[stage]["seconds"] += seconds
+
+def merge_stage_times(total_stages, stages):
+    for stage, values in stages.items():
+        for key, value in values.items():
+            total_stages[stage][key] += value
+
+def inflate_to_file(compressed_data, file_out, stage_times=None):
+    # Inflates at most INFLATE_CHUNK_SIZE bytes at a time and writes them right away, so the memory
+    # used doesn't depend on the size of the entry. Returns the number of bytes written.
+    decompressor = zlib.decompressobj()
+    written_bytes = 0
+    start_time = time.perf_counter()
+    chunk = decompressor.decompress(compressed_data, INFLATE_CHUNK_SIZE)
+    while len(chunk) > 0:
+        if stage_times is not None:
+            stage_times.add("inflate", start_time, len(chunk))
+        file_out.write(chunk)
+        written_bytes += len(chunk)
+        start_time = time.perf_counter()
+        chunk = decompressor.decompress(decompressor.unconsumed_tail, INFLATE_CHUNK_SIZE)
+    if not decompressor.eof:
+        raise zlib.error("Incomplete or truncated stream")
+    return written_bytes
+
+def fingerprint_arc(data):
+    # Hashes the whole archive, as stored on disk: a patched archive of the same size is always told
+    # apart from the previous one
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+class QueuedFile():
+    # File-like object handed to inflate_to_file: the chunks are queued to a writer thread
+    def __init__(self, writer_queue, file_out):
+        self.writer_queue = writer_queue
+        self.file_out = file_out
+
+    def write(self, chunk):
+        self.writer_queue.put((self.file_out, "write", chunk))
+
+class ExtractionPipeline():
+    # Overlaps the inflating of the entries (CPU) with their writing (disk), which both release the
+    # GIL. Inflater threads queue the chunks of each entry to one writer thread, so that the chunks
+    # of a file are written in order. The queues are bounded: at most PIPELINE_QUEUE_SIZE chunks per
+    # writer are waiting in memory.
+    def __init__(self, inflater_count, writer_count, stage_times=None):
+        self.stage_times = stage_times if stage_times is not None else StageTimes()
+        self.writer_queues = [queue.Queue(PIPELINE_QUEUE_SIZE) for _ in range(writer_count)]
+        self.writers = [threading.Thread(target=self.write_loop, args=(writer_queue,), daemon=True) for writer_queue in self.writer_queues]
+        for writer in self.writers:
+            writer.start()
+        self.inflaters = ThreadPoolExecutor(inflater_count)
+        self.futures = []
+        self.created_directories = set()
+        self.errors = []
+        self.open_files = threading.Semaphore(PIPELINE_MAX_OPEN_FILES)
+
+    def make_directory(self, directory):
+        # Most entries of an archive share a few folders, os.makedirs is only called once for each
+        if directory not in self.created_directories:
+            start_time = time.perf_counter()
+            os.makedirs(directory, exist_ok=True)
+            self.stage_times.add("mkdir", start_time)
+            self.created_directories.add(directory)
+
+    def write_loop(self, writer_queue):
+        failed_files = set()
+        while True:
+            file_out, action, chunk = writer_queue.get()
+            if action == "stop":
+                break
+            try:
+                if file_out in failed_files:
+                    if action != "write":
+                        # Don't leave the temporary file of a failed entry behind
+                        failed_files.discard(file_out)
+                        os.remove(file_out.name)
+                elif action == "write":
+                    start_time = time.perf_counter()
+                    file_out.write(chunk)
+                    self.stage_times.add("write", start_time, len(chunk))
+                elif action == "close":
+                    start_time = time.perf_counter()
+                    file_out.close()
+                    try:
+                        os.replace(file_out.name, file_out.output_name)
+                    except OSError:
+                        if not (file_out.shared and os.path.isfile(file_out.output_name)):
+                            raise
+                        # Another worker stored the same content first
+                        os.remove(file_out.name)
+                    self.stage_times.add("write", start_time)
+                elif action == "abort":
+                    file_out.close()
+                    os.remove(file_out.name)
+            except Exception as e:
+                # Keep consuming the queue so that the inflaters are never blocked
+                self.errors.append(e)
+                file_out.close()
+                if action == "write":
+                    failed_files.add(file_out)
+            finally:
+                if action != "write":
+                    self.open_files.release()
+
+    def inflate(self, compressed_data, output_name, temp_name, shared, writer_queue):
+        # The temporary file is only opened once the entry is being inflated, and closed by the
+        # writer: at most PIPELINE_MAX_OPEN_FILES files are open
+        try:
+            start_time = time.perf_counter()
+            file_out = open(temp_name, "wb")
+            self.stage_times.add("write", start_time)
+        except Exception:
+            self.open_files.release()
+            raise
+        file_out.output_name = output_name
+        file_out.shared = shared
+        try:
+            written_bytes = inflate_to_file(compressed_data, QueuedFile(writer_queue, file_out), self.stage_times)
+        except Exception:
+            writer_queue.put((file_out, "abort", None))
+            raise
+        writer_queue.put((file_out, "close", None))
+        return written_bytes
+
+    def submit(self, compressed_data, output_name, shared=False):
+        # Entries are written to a temporary file renamed once complete: an interrupted extraction
+        # never leaves a truncated file behind. Blocks while too many entries are in flight.
+        # A shared output may be written by other workers at the same time (the dedup store): each one
+        # has its own temporary file, and the first one renamed wins.
+        self.make_directory(os.path.dirname(output_name))
+        temp_name = output_name + TEMP_SUFFIX
+        if shared:
+            temp_name = output_name + "." + str(os.getpid()) + "." + str(threading.get_ident()) + TEMP_SUFFIX
+        self.open_files.acquire()
+        writer_queue = self.writer_queues[len(self.futures)%len(self.writer_queues)]
+        self.futures.append(self.inflaters.submit(self.inflate, compressed_data, output_name, temp_name, shared, writer_queue))
+
+    def close(self):
+        # Waits for every entry to be written, returns the number of bytes written
+        try:
+            written_bytes = sum(future.result() for future in self.futures)
+        finally:
+            self.inflaters.shutdown()
+            for writer_queue in self.writer_queues:
+                writer_queue.put((None, "stop", None))
+            for writer in self.writers:
+                writer.join()
+        if len(self.errors) > 0:
+            raise self.errors[0]
+        return written_bytes
+
+def get_store_name(extraction_path, compressed_data):
+    payload_hash = hashlib.blake2b(compressed_data, digest_size=16).hexdigest()
+    return os.path.join(extraction_path, ARC_STORE_FOLDER, payload_hash[:2], payload_hash)
+
+def reflink_file(source, destination):
+    # Copy-on-write clone of source, which shares its blocks until one of them is modified. Raises
+    # OSError when the filesystem (or the OS) can't do it.
+    if fcntl is None:
+        raise OSError("Reflinks are not supported on this platform")
+    with open(source, "rb") as file_in, open(destination, "wb") as file_out:
+        try:
+            fcntl.ioctl(file_out.fileno(), FICLONE, file_in.fileno())
+        except OSError:
+            file_out.close()
+            os.remove(destination)
+            raise
+
+def link_file(source, destination):
+    # Reflinks destination to source, or hardlinks it, or copies it as a last resort. The link or the
+    # copy is made under a temporary name then renamed, so that an interrupted one never leaves a
+    # partial destination, and an existing destination (maybe linked to other files) is replaced
+    # instead of being written to.
+    temp_name = destination + TEMP_SUFFIX
+    if os.path.lexists(temp_name):
+        os.remove(temp_name)
+    try:
+        reflink_file(source, temp_name)
+    except OSError:
+        try:
+            os.link(source, temp_name)
+        except OSError:
+            shutil.copyfile(source, temp_name)
+    os.replace(temp_name, destination)
+
+def scan_directory(directory):
+    files = []
+    subdirectories = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir():
+                    subdirectories.append(entry.path)
+                elif entry.is_file():
+                    files.append(entry.path)
+    except OSError as e:
+        logger.warning("Could not list " + str(directory) + " (exception=" + str(e) + ")")
+    return files, subdirectories
+
+def walk_directory(root, thread_count=1):
+    # Lists the files below root, the folders being scanned in parallel
+    files = []
+    with ThreadPoolExecutor(max(1, thread_count)) as executor:
+        pending = [executor.submit(scan_directory, root)]
+        while len(pending) > 0:
+            directory_files, subdirectories = pending.pop().result()
+            files.extend(directory_files)
+            pending.extend(executor.submit(scan_directory, subdirectory) for subdirectory in subdirectories)
+    return sorted(files)
 
+def find_loose_files(installation_path, thread_count=1, arc_filter=None):
+    # Files of the game that are not in an archive, with their path relative to nativeDX11x64
+    loose_path = os.path.join(installation_path, "nativeDX11x64")
+    loose_files = []
+    for loose_file in walk_directory(loose_path, thread_count):
+        extension = "." + os.path.basename(loose_file).split(".")[-1]
+        if extension not in fileExtHashes or extension == ".arc":
+            continue
+        relative_path = os.path.relpath(loose_file, loose_path).replace("\\", "/")
+        if arc_filter is not None and not arc_filter.match(relative_path, fileExtHashes[extension]):
+            continue
+        loose_files.append((loose_file, relative_path))
+    return loose_files
+
+def extract_loose_file(source, destination, link=False, stage_times=None):
+    # Returns the number of bytes written, None if the file was already there
+    if os.path.exists(destination):
+        return None
+    if stage_times is None:
+        stage_times = StageTimes()
+    start_time = time.perf_counter()
+    os.makedirs(os.path.dirname(destination), exist_ok=True)
+    stage_times.add("mkdir", start_time)
+    start_time = time.perf_counter()
+    if link:
+        link_file(source, destination)
+        written_bytes = 0
+    else:
+        shutil.copy(source, destination + TEMP_SUFFIX)
+        os.replace(destination + TEMP_SUFFIX, destination)
+        written_bytes = os.path.getsize(destination)
+    stage_times.add("write", start_time, written_bytes)
+    return written_bytes
+
+def read_arc_body(data_view, decrypt_thread_count=None, stage_times=None):
+    # Decrypts in place the archive in data_view, returns a Reader over what follows the header and
+    # the number of files, or (None, None) if it's not an archive
+    arc_bs = Reader(data_view)
+    magic = arc_bs.readUInt()
+    _ = arc_bs.readUShort()
+    file_count = arc_bs.readUShort()
+    if magic == ARC_MAGIC_ENCRYPTED:
+        # Encrypted arc
+        bs = Reader(data_view[arc_bs.offset:])
+        start_time = time.perf_counter()
+        decrypt_arc_data(get_blowfish_library(), bs.data, thread_count=decrypt_thread_count)
+        if stage_times is not None:
+            stage_times.add("decrypt", start_time, len(bs.data))
+    elif magic == ARC_MAGIC:
+        # Regular arc
+        bs = Reader(data_view[arc_bs.offset:])
+    else:
+        return None, None
+    return bs, file_count
+
+def read_arc_data(arc_file, stage_times=None):
+    # The archive is read once in a mutable buffer, for read_arc_body to decrypt it in place: every
+    # slice taken out of it is a view, there's no second copy of the archive in memory.
+    with open(arc_file, "rb") as file_in:
+        start_time = time.perf_counter()
+        data = bytearray(os.fstat(file_in.fileno()).st_size)
+        data_view = memoryview(data)[:file_in.readinto(data)]
+    if stage_times is not None:
+        stage_times.add("read", start_time, len(data_view))
+    return data_view
+
+def read_arc_file(arc_file, decrypt_thread_count=None):
+    # Reads and decrypts a whole archive. Returns the archive, a Reader over what follows its header
+    # and the number of files.
+    data_view = read_arc_data(arc_file)
+    bs, file_count = read_arc_body(data_view, decrypt_thread_count)
+    if bs is None:
+        raise RuntimeError(str(arc_file) + " is not a recognized ARC file (magic = " + str(Reader(data_view).readUInt()) + ")")
+    return data_view, bs, file_count
+
+def extract_arc_entries(file_infos, extraction_path):
+    # Extracts a few entries (with their "arc_file", as given by the index), each one being read on
+    # its own. Existing files are replaced.
+    for file_info in sorted(file_infos, key=lambda x: (x["arc_file"], x["offset"])):
+        output_name = os.path.join(extraction_path, file_info["file_path"] + file_info["extension"])
+        compressed_bytes = read_arc_entry_payload(file_info["arc_file"], file_info)
+        os.makedirs(os.path.dirname(output_name), exist_ok=True)
+        with open(output_name + TEMP_SUFFIX, "wb") as file_out:
+            inflate_to_file(compressed_bytes, file_out)
+        os.replace(output_name + TEMP_SUFFIX, output_name)
+
+def extract_arc_file(arc_file, extraction_path, decrypt_thread_count=None, previous_record=None, overwrite=False, arc_filter=None, overridden_paths=None, dedup=False):
+    stage_times = StageTimes()
+    arc_stats = {"read_bytes": 0, "written_files": 0, "written_bytes": 0, "linked_files": 0, "stages": stage_times.stages}
+    stat = os.stat(arc_file)
+    # The fingerprint is taken before the archive is decrypted in place
+    data_view = read_arc_data(arc_file, stage_times)
+    arc_stats["read_bytes"] = len(data_view)
+    start_time = time.perf_counter()
+    arc_record = {"size": stat.st_size, "mtime": stat.st_mtime_ns, "hash": fingerprint_arc(data_view), "files": []}
+    stage_times.add("hash", start_time, len(data_view))
+    if previous_record is not None and previous_record["size"] == arc_record["size"] and previous_record["hash"] == arc_record["hash"]:
+        # Only the modification time changed
+        arc_record["files"] = previous_record["files"]
+        return arc_record, arc_stats
+    bs, file_count = read_arc_body(data_view, decrypt_thread_count, stage_times)
+    if bs is None:
+        logger.warning("File " + arc_file + " is not an recognized ARC file. ")
+        return None, arc_stats
+
+    start_time = time.perf_counter()
+    # Filtered entries are never inflated, nor turned into dicts
+    toc = decode_arc_toc(bs.data, file_count)
+    file_infos = toc_file_infos(toc, select_arc_toc(toc, arc_filter))
+    # When an archive lists a file twice, its last entry wins, as in the archive index
+    file_infos = list({(file_info["file_path"] + file_info["extension"]).lower(): file_info for file_info in file_infos}.values())
+    stage_times.add("toc", start_time, file_count*ARC_TOC_ENTRY_SIZE)
+
+    file_list = set()
+    # With dedup, each payload is inflated once in the store (named after the hash of the compressed
+    # payload) and the extracted files are hardlinks to it
+    store_links = {}
+    thread_count = max(1, decrypt_thread_count or os.cpu_count() or 1)
+    pipeline = ExtractionPipeline(thread_count, max(1, thread_count//2), stage_times)
+    try:
         for file_info in file_infos:
             file_list.add((file_info["file_path"] + file_info["extension"]).replace("\\", "/"))
             output_name = os.path.join(extraction_path, file_info["file_path"] + file_info["extension"])
-            if os.path.exists(output_name):
-                pass
+            if overridden_paths is not None and (file_info["file_path"] + file_info["extension"]).lower() in overridden_paths:
+                # A higher priority archive has its own copy of this file
+                continue
+            output_exists = os.path.lexists(output_name)
+            if output_exists and not overwrite:
+                continue
+            compressed_bytes = bs.data[file_info["offset"]:file_info["offset"] + file_info["compressed_size"]]
+            if dedup:
+                store_name = get_store_name(extraction_path, compressed_bytes)
+                if store_name in store_links:
+                    store_links[store_name].append(output_name)
+                elif os.path.isfile(store_name):
+                    pipeline.make_directory(os.path.dirname(output_name))
+                    start_time = time.perf_counter()
+                    link_file(store_name, output_name)
+                    stage_times.add("write", start_time)
+                    arc_stats["linked_files"] += 1
+                else:
+                    store_links[store_name] = [output_name]
+                    # Other workers may be writing the same payload
+                    pipeline.submit(compressed_bytes, store_name, shared=True)
+                    arc_stats["written_files"] += 1
             else:
-                bs.seek(file_info["offset"])
-                compressed_bytes = bs.readBytes(file_info["compressed_size"])
-                decompressed_bytes = zlib.decompress(compressed_bytes)
+                if output_exists:
+                    # Don't write through a hardlink of a previous dedup extraction
+                    os.remove(output_name)
+                pipeline.submit(compressed_bytes, output_name)
+                arc_stats["written_files"] += 1
+    finally:
+        arc_stats["written_bytes"] += pipeline.close()
 
-                try:
-                    os.makedirs(os.path.dirname(output_name))
-                except FileExistsError as e:
-                    pass
-                with open(output_name, "wb") as file_out:
-                    file_out.write(decompressed_bytes)
+    for store_name, output_names in store_links.items():
+        for output_name in output_names:
+            pipeline.make_directory(os.path.dirname(output_name))
+            start_time = time.perf_counter()
+            link_file(store_name, output_name)
+            stage_times.add("write", start_time)
+        arc_stats["linked_files"] += len(output_names) - 1
+    arc_record["files"] = sorted(file_list)
+    return arc_record, arc_stats
+
+def read_arc_journal(journal_path):
+    journal = {}
+    if not os.path.isfile(journal_path):
+        return journal
+    with open(journal_path, "r") as journal_in:
+        for line in journal_in:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # Last line cut by a crash
+                continue
+            journal[entry["arc"]] = entry["record"]
+    return journal
+
+def resolve_arc_conflicts(arc_files, installation_path, arc_paths):
+    # arc_files are sorted by increasing priority (see find_arc_files) and arc_paths gives the files
+    # of each archive. Returns the paths (lowercase) each archive must leave to another one, and the
+    # conflict report: for each file found in several archives, the archive it's extracted from and
+    # the archives whose copy is ignored.
+    owners = {}
+    for arc_file in arc_files:
+        arc_name = os.path.relpath(arc_file, installation_path).replace("\\", "/")
+        for path in arc_paths.get(arc_name, []):
+            owners.setdefault(path.lower(), []).append((arc_name, path))
+
+    arc_overridden_paths = {}
+    conflicts = {}
+    for path_key, path_owners in owners.items():
+        if len(path_owners) == 1:
+            continue
+        winner_name, path = path_owners[-1]
+        loser_names = []
+        for arc_name, _ in path_owners[:-1]:
+            if arc_name != winner_name:
+                arc_overridden_paths.setdefault(arc_name, set()).add(path_key)
+                loser_names.append(arc_name)
+        if len(loser_names) > 0:
+            conflicts[path] = {"archive": winner_name, "overridden": loser_names}
+    return arc_overridden_paths, conflicts
+
+def find_arc_winners(arc_names, arc_paths):
+    # arc_names are sorted by increasing priority and arc_paths gives the files of each archive.
+    # Returns the archive each file (lowercase) is extracted from.
+    winners = {}
+    for arc_name in arc_names:
+        for path in arc_paths.get(arc_name, []):
+            winners[path.lower()] = arc_name
+    return winners
+
+def reclaim_arc_files(installation_path, extraction_path, previous_manifest, arc_names, arc_paths, extracted_arc_names):
+    # A file now extracted from another archive than in the previous extraction (a patch archive
+    # dropped it, or was removed) keeps the old copy if its new archive is unchanged, as unchanged
+    # archives aren't extracted again. Those files are extracted again from their new archive.
+    # Returns their count.
+    previous_winners = find_arc_winners(sorted(previous_manifest, key=arc_priority), {arc_name: record["files"] for arc_name, record in previous_manifest.items()})
+    reclaimed_paths = {}
+    for path_key, arc_name in find_arc_winners(arc_names, arc_paths).items():
+        if arc_name not in extracted_arc_names and previous_winners.get(path_key, arc_name) != arc_name:
+            reclaimed_paths.setdefault(arc_name, set()).add(path_key)
+
+    reclaimed_file_count = 0
+    for arc_name, path_keys in sorted(reclaimed_paths.items()):
+        arc_file = os.path.join(installation_path, arc_name)
+        toc = list_arc_toc(arc_file)
+        if toc is None:
+            continue
+        file_infos = {}
+        for file_info in toc_file_infos(toc, select_arc_toc(toc)):
+            path_key = (file_info["file_path"] + file_info["extension"]).lower()
+            if path_key in path_keys:
+                file_info["arc_file"] = arc_file
+                file_infos[path_key] = file_info
+        extract_arc_entries(file_infos.values(), extraction_path)
+        logger.info("Extracted again " + str(len(file_infos)) + " files now taken from " + arc_name + ".")
+        reclaimed_file_count += len(file_infos)
+    return reclaimed_file_count
+
+class ExtractionProgress():
+    # Shared with the thread running an extraction: tells how far it is, and asks it to stop. The
+    # extraction stops after the arc files being extracted, and can be resumed later.
+    def __init__(self):
+        self.total_arc_files = 0
+        self.done_arc_files = 0
+        self.total_bytes = 0
+        self.done_bytes = 0
+        self.written_bytes = 0
+        self.start_time = time.perf_counter()
+        self.cancel_event = threading.Event()
+
+    def start(self, arc_sizes):
+        self.total_arc_files = len(arc_sizes)
+        self.total_bytes = sum(arc_sizes)
+        self.start_time = time.perf_counter()
+
+    def advance(self, arc_size, written_bytes=0):
+        self.done_arc_files += 1
+        self.done_bytes += arc_size
+        self.written_bytes += written_bytes
+
+    def fraction(self):
+        if self.total_bytes == 0:
+            return 0.0
+        return min(1.0, self.done_bytes/self.total_bytes)
+
+    def eta(self):
+        # Seconds left, estimated from the size of the arc files left, None until one is done
+        if self.done_bytes == 0:
+            return None
+        return (time.perf_counter() - self.start_time)/self.done_bytes*(self.total_bytes - self.done_bytes)
+
+    def cancel(self):
+        self.cancel_event.set()
 
-        if extracted_file_count%50 == 0:
-            logger.info(str(extracted_file_count) + "/" + str(len(arc_files)) + " arc files extracted")
-        extracted_file_count += 1
+    def is_cancelled(self):
+        return self.cancel_event.is_set()
 
+def extract_arcs(installation_path, extraction_path, worker_count=1, arc_filter=None, dedup=False, link_loose_files=False, progress=None):
+    start_time = time.perf_counter()
+    worker_count = max(1, worker_count)
+    # Leftover cores go to the decryption of each archive
+    decrypt_thread_count = max(1, (os.cpu_count() or 1) // worker_count)
+
+    if arc_filter is not None and arc_filter.is_empty():
+        arc_filter = None
+
+    arc_files = find_arc_files(installation_path)
+
+    # Archives whose size and modification time didn't change since the last extraction aren't opened
+    manifest_path = os.path.join(extraction_path, ARC_MANIFEST_FILENAME)
+    previous_manifest = None
+    # Filtered extractions only pull a part of each archive, so they don't use the manifest
+    if os.path.isfile(manifest_path) and arc_filter is None:
+        with open(manifest_path, "r") as json_in:
+            previous_manifest = json.load(json_in)
+    # New or changed archives replace the files extracted by a previous run, while a first run keeps
+    # the files that are already there
+    overwrite = previous_manifest is not None
+    if arc_filter is not None:
+        logger.info("Extraction filtered, the archive manifest won't be updated.")
+
+    # The archives completed by an interrupted extraction are in the journal, a new run resumes
+    # after them
+    journal_path = os.path.join(extraction_path, ARC_JOURNAL_FILENAME)
+    journal = read_arc_journal(journal_path) if arc_filter is None else {}
+    if len(journal) > 0:
+        logger.info("Resuming an interrupted extraction, " + str(len(journal)) + " arc files were already extracted.")
+
+    manifest = {}
+    arc_jobs = []
+    file_list = set()
+    for arc_file in arc_files:
+        arc_name = os.path.relpath(arc_file, installation_path).replace("\\", "/")
+        previous_record = previous_manifest.get(arc_name) if previous_manifest is not None else None
+        if arc_name in journal:
+            previous_record = journal[arc_name]
+        stat = os.stat(arc_file)
+        if previous_record is not None and previous_record["size"] == stat.st_size and previous_record["mtime"] == stat.st_mtime_ns:
+            manifest[arc_name] = previous_record
+            file_list.update(previous_record["files"])
+        else:
+            arc_jobs.append((arc_name, arc_file, previous_record))
+    logger.info("Found " + str(len(arc_files)) + " arc files, " + str(len(arc_files) - len(arc_jobs)) + " unchanged since the last extraction (" + str(worker_count) + " workers).")
+
+    summary = {"arc_files": len(arc_files), "extracted_arc_files": 0, "read_bytes": 0, "written_files": 0, "written_bytes": 0, "linked_files": 0, "overridden_files": 0, "stages": StageTimes().stages, "cancelled": False}
+    arc_sizes = {arc_name: os.path.getsize(arc_file) for arc_name, arc_file, _ in arc_jobs}
+    if progress is not None:
+        progress.start(list(arc_sizes.values()))
+    arc_stats_list = {}
+    extracted_file_count = 0
+    extracted_arc_names = set()
+    pool = create_worker_pool(worker_count) if worker_count > 1 else None
+    journal_out = open(journal_path, "a") if arc_filter is None else None
+    try:
+        # Files found in several archives are only extracted from the one with the highest priority,
+        # the TOCs (or the file lists of the manifest, for the unchanged archives) tell which one.
+        if pool is None:
+            arc_tocs = list(map(list_arc_toc, [arc_file for _, arc_file, _ in arc_jobs]))
+        else:
+            arc_tocs = list(pool.map(list_arc_toc, [arc_file for _, arc_file, _ in arc_jobs]))
+        arc_paths = {arc_name: record["files"] for arc_name, record in manifest.items()}
+        for (arc_name, _, _), toc in zip(arc_jobs, arc_tocs):
+            if toc is not None:
+                arc_paths[arc_name] = toc_paths(toc, select_arc_toc(toc))
+        arc_overridden_paths, conflicts = resolve_arc_conflicts(arc_files, installation_path, arc_paths)
+        summary["overridden_files"] = sum(len(conflict["overridden"]) for conflict in conflicts.values())
+        if len(conflicts) > 0:
+            logger.info(str(len(conflicts)) + " files are in several arc files, only the copy of the highest priority arc file is extracted.")
+
+        if pool is None:
+            arc_records = ((arc_name, extract_arc_file(arc_file, extraction_path, decrypt_thread_count, previous_record, overwrite, arc_filter, arc_overridden_paths.get(arc_name), dedup)) for arc_name, arc_file, previous_record in arc_jobs)
+        else:
+            futures = {pool.submit(extract_arc_file, arc_file, extraction_path, decrypt_thread_count, previous_record, overwrite, arc_filter, arc_overridden_paths.get(arc_name), dedup): arc_name for arc_name, arc_file, previous_record in arc_jobs}
+            arc_records = ((futures[future], future.result()) for future in as_completed(futures))
+
+        for arc_name, (arc_record, arc_stats) in arc_records:
+            arc_stats_list[arc_name] = arc_stats
+            if progress is not None:
+                progress.advance(arc_sizes[arc_name], arc_stats["written_bytes"])
+            for key, value in arc_stats.items():
+                if key == "stages":
+                    merge_stage_times(summary["stages"], value)
+                else:
+                    summary[key] += value
+            if arc_record is None:
+                continue
+            if arc_stats["stages"]["toc"]["count"] > 0:
+                # Its files were written, not only its fingerprint checked
+                extracted_arc_names.add(arc_name)
+            manifest[arc_name] = arc_record
+            file_list.update(arc_record["files"])
+            if journal_out is not None:
+                journal_out.write(json.dumps({"arc": arc_name, "record": arc_record}) + "\n")
+                journal_out.flush()
+                os.fsync(journal_out.fileno())
+
+            if extracted_file_count%50 == 0:
+                logger.info(str(extracted_file_count) + "/" + str(len(arc_jobs)) + " arc files extracted")
+            extracted_file_count += 1
+            if progress is not None and progress.is_cancelled():
+                summary["cancelled"] = True
+                break
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+        if journal_out is not None:
+            journal_out.close()
+
+    if summary["cancelled"]:
+        # The journal keeps the arc files already done for the next run
+        logger.info("Extraction cancelled after " + str(extracted_file_count) + "/" + str(len(arc_jobs)) + " arc files, start it again to resume.")
+        release_blowfish_library()
+        summary["extracted_arc_files"] = extracted_file_count
+        summary["seconds"] = time.perf_counter() - start_time
+        return summary
+
+    if previous_manifest is not None:
+        arc_names = [os.path.relpath(arc_file, installation_path).replace("\\", "/") for arc_file in arc_files]
+        summary["written_files"] += reclaim_arc_files(installation_path, extraction_path, previous_manifest, arc_names, arc_paths, extracted_arc_names)
+
+    if arc_filter is None:
+        write_json_file(manifest_path, manifest)
+        # Every archive is in the manifest now
+        os.remove(journal_path)
+    write_json_file(os.path.join(extraction_path, ARC_CONFLICTS_FILENAME), conflicts, indent="\t", sort_keys=True)
     logger.info(str(extracted_file_count) + " arc files extracted.")
+    summary["extracted_arc_files"] = extracted_file_count
 
     
     if extraction_path != installation_path:
-        extracted_file_count = 0
-
-        other_files = []
-        for x in glob(os.path.join(installation_path, "nativeDX11x64", "**", "*"), recursive=True):
-            if "." + x.split(".")[-1] in fileExts.values() and x.split(".")[-1] != "arc":
-                other_files.append(x)
-        logger.info("Found " + str(len(other_files)) + " other files.")
-
-        for other_file in other_files:
-            file_list.add(other_file[other_file.find("nativeDX11x64") + len("nativeDX11x64")+1:].replace("\\", "/"))
-            dest_path = os.path.join(extraction_path, other_file[other_file.find("nativeDX11x64") + len("nativeDX11x64")+1:])
-            if os.path.exists(dest_path):
-                pass
-            else:
-                try:
-                    os.makedirs(os.path.dirname(dest_path))
-                except FileExistsError as e:
+        other_files = find_loose_files(installation_path, worker_count, arc_filter)
+        logger.info("Found " + str(len(other_files)) + " other files" + (", linked instead of copied." if link_loose_files else "."))
+
+        loose_stage_times = StageTimes()
+        with ThreadPoolExecutor(worker_count) as executor:
+            futures = [executor.submit(extract_loose_file, other_file, os.path.join(extraction_path, relative_path), link_loose_files, loose_stage_times) for other_file, relative_path in other_files]
+            for extracted_file_count, ((_, relative_path), future) in enumerate(zip(other_files, futures)):
+                file_list.add(relative_path)
+                written_bytes = future.result()
+                if written_bytes is None:
                     pass
-                shutil.copy(other_file, dest_path)
-            if extracted_file_count%50 == 0:
-                logger.info(str(extracted_file_count) + "/" + str(len(other_files)) + " other files extracted")
-            extracted_file_count += 1
+                elif link_loose_files:
+                    summary["linked_files"] += 1
+                else:
+                    summary["written_files"] += 1
+                    summary["written_bytes"] += written_bytes
+                if extracted_file_count%50 == 0:
+                    logger.info(str(extracted_file_count) + "/" + str(len(other_files)) + " other files extracted")
+        arc_stats_list["nativeDX11x64 (other files)"] = {"stages": loose_stage_times.stages}
+        merge_stage_times(summary["stages"], loose_stage_times.stages)
 
+    file_list_path = os.path.join(extraction_path, "file_list.json")
+    if arc_filter is not None and os.path.isfile(file_list_path):
+        # A filtered extraction adds to what was already extracted
+        with open(file_list_path, "r") as json_in:
+            file_list.update(json.load(json_in))
     file_list = sorted(list(file_list))
-    with open(os.path.join(extraction_path, "file_list.json"), "w") as json_out:
-        json.dump(file_list, json_out, indent="\t")
-    if sys.platform == "win32":
-        dll_close = ctypes.windll.kernel32.FreeLibrary
-        dll_close.argtypes = [ctypes.c_void_p]
-        dll_close(lib._handle)
+    write_json_file(file_list_path, file_list, indent="\t")
+    release_blowfish_library()
+
+    summary["seconds"] = time.perf_counter() - start_time
+    seconds = max(summary["seconds"], 1e-6)
+    logger.info("Extraction done in " + str(round(summary["seconds"], 1)) + "s: read " + str(round(summary["read_bytes"]/1e6, 1)) + " MB of archives (" + str(round(summary["read_bytes"]/1e6/seconds, 1)) + " MB/s), wrote " + str(summary["written_files"]) + " files, " + str(round(summary["written_bytes"]/1e6, 1)) + " MB (" + str(round(summary["written_bytes"]/1e6/seconds, 1)) + " MB/s).")
+    if summary["linked_files"] > 0:
+        logger.info(str(summary["linked_files"]) + " files were linked instead of being written.")
+
+    # The seconds of a stage are summed over the threads and the workers running it, so its MB/s is
+    # the speed of one thread
+    for stage in EXTRACTION_STAGES:
+        stage_stats = summary["stages"][stage]
+        stage_speed = ""
+        if stage_stats["bytes"] > 0:
+            stage_speed = ", " + str(round(stage_stats["bytes"]/1e6/max(stage_stats["seconds"], 1e-6), 1)) + " MB/s"
+        logger.info("  " + stage + ": " + str(stage_stats["count"]) + " operations, " + str(round(stage_stats["bytes"]/1e6, 1)) + " MB in " + str(round(stage_stats["seconds"], 2)) + "s" + stage_speed)
+    write_json_file(os.path.join(extraction_path, EXTRACTION_STATS_FILENAME), {"summary": summary, "archives": arc_stats_list}, indent="\t", sort_keys=True)
+    return summary
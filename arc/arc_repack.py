@@ -0,0 +1,135 @@
+import os
+import zlib
+import struct
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+import logging
+logger = logging.getLogger("mhst2_import")
+
+from .arc_parser import Reader, read_arc_file, decode_arc_toc, decode_toc_path, encrypt_arc_data, get_blowfish_library, find_archived_files, walk_directory
+from .arc_parser import fileExts, ARC_MAGIC, ARC_MAGIC_ENCRYPTED, ARC_HEADER_SIZE, ARC_TOC_ENTRY_SIZE, ARC_TOC_DTYPE, TEMP_SUFFIX
+
+ARC_MAX_DECOMPRESSED_SIZE = 0x1fffffff # the top bits of the field are flags
+
+def compress_replacement(replacement):
+    # replacement is the new content of an entry, or the path of the file holding it
+    if isinstance(replacement, str):
+        with open(replacement, "rb") as file_in:
+            replacement = file_in.read()
+    if len(replacement) > ARC_MAX_DECOMPRESSED_SIZE:
+        raise RuntimeError("A file of " + str(len(replacement)) + " bytes is too large to be archived")
+    return zlib.compress(replacement), len(replacement)
+
+def repack_arc(arc_file, output_file, replacements, worker_count=1):
+    # Writes to output_file the archive arc_file with some of its entries replaced. replacements maps
+    # paths inside the archive (extension included) to their new content or to the file holding it.
+    # Only the new payloads are compressed (in parallel), the others are copied still compressed.
+    data_view, bs, file_count = read_arc_file(arc_file)
+    magic = Reader(data_view).readUInt()
+
+    toc = decode_arc_toc(bs.data, file_count).copy()
+    paths = [(decode_toc_path(path) + fileExts.get(extension_hash, "")).lower() for path, extension_hash in zip(toc["path"].tolist(), toc["extension_hash"].tolist())]
+    replacements = {path.replace("\\", "/").lower(): replacement for path, replacement in replacements.items()}
+    missing_paths = sorted(set(replacements) - set(paths))
+    if len(missing_paths) > 0:
+        raise RuntimeError(", ".join(missing_paths) + " not found in " + str(arc_file))
+
+    with ThreadPoolExecutor(max_workers=max(1, worker_count)) as pool:
+        compressed_replacements = dict(zip(replacements, pool.map(compress_replacement, replacements.values())))
+
+    # Payloads keep their order, from where the first one started: whatever padding follows the TOC
+    # is kept, and the TOC itself is written over once the new offsets are known
+    offsets = toc["offset"].astype(np.int64) - ARC_HEADER_SIZE
+    data_start = int(offsets.min()) if file_count > 0 else file_count*ARC_TOC_ENTRY_SIZE
+    chunks = [bs.data[:data_start]]
+    data_size = data_start
+    # Entries sharing a payload in the original archive still share it
+    copied_payloads = {}
+    replaced_file_count = 0
+    for record_i in np.argsort(offsets, kind="stable").tolist():
+        path = paths[record_i]
+        if path in compressed_replacements:
+            payload, size = compressed_replacements[path]
+            payload_key = ("replacement", path)
+            replaced_file_count += 1
+            toc["decompressed_size"][record_i] = (int(toc["decompressed_size"][record_i]) & ~ARC_MAX_DECOMPRESSED_SIZE) | size
+        else:
+            offset = int(offsets[record_i])
+            payload = bs.data[offset:offset + int(toc["compressed_size"][record_i])]
+            payload_key = ("original", offset, len(payload))
+        if payload_key not in copied_payloads:
+            copied_payloads[payload_key] = data_size
+            chunks.append(payload)
+            data_size += len(payload)
+        toc["compressed_size"][record_i] = len(payload)
+        toc["offset"][record_i] = copied_payloads[payload_key] + ARC_HEADER_SIZE
+    chunks.append(bytes(-data_size%8)) # whole blowfish blocks only
+
+    body = bytearray(b"".join(chunks))
+    body[:file_count*ARC_TOC_ENTRY_SIZE] = toc.tobytes()
+    if magic == ARC_MAGIC_ENCRYPTED:
+        encrypt_arc_data(get_blowfish_library(), body)
+
+    if os.path.dirname(output_file) != "":
+        os.makedirs(os.path.dirname(output_file), exist_ok=True)
+    with open(output_file + TEMP_SUFFIX, "wb") as file_out:
+        file_out.write(data_view[:ARC_HEADER_SIZE])
+        file_out.write(body)
+    os.replace(output_file + TEMP_SUFFIX, output_file)
+    return {"replaced_files": replaced_file_count, "size": ARC_HEADER_SIZE + len(body)}
+
+def write_arc(output_file, entries, encrypt=True, data_alignment=0, version=7, thread_count=None):
+    # Writes a new archive. entries are (file_path, extension_hash, compressed payload, decompressed
+    # size), payloads are laid out in that order from the first multiple of data_alignment past the TOC.
+    # The version field of the header is not read by the extractor.
+    toc = np.zeros(len(entries), dtype=ARC_TOC_DTYPE)
+    data_start = ARC_HEADER_SIZE + len(entries)*ARC_TOC_ENTRY_SIZE
+    if data_alignment > 0:
+        data_start += -data_start%data_alignment
+    chunks = [bytes(data_start - ARC_HEADER_SIZE)]
+    data_size = data_start
+    for entry_i, (file_path, extension_hash, payload, size) in enumerate(entries):
+        encoded_path = file_path.replace("/", "\\").encode("latin-1")
+        if len(encoded_path) >= ARC_TOC_DTYPE["path"].itemsize:
+            raise RuntimeError(file_path + " is too long to be archived")
+        toc[entry_i] = (encoded_path, extension_hash, len(payload), size, data_size)
+        chunks.append(payload)
+        data_size += len(payload)
+    chunks.append(bytes(-data_size%8)) # whole blowfish blocks only
+
+    body = bytearray(b"".join(chunks))
+    body[:len(entries)*ARC_TOC_ENTRY_SIZE] = toc.tobytes()
+    if encrypt:
+        encrypt_arc_data(get_blowfish_library(), body, thread_count=thread_count)
+    with open(output_file + TEMP_SUFFIX, "wb") as file_out:
+        file_out.write(struct.pack("<IHH", ARC_MAGIC_ENCRYPTED if encrypt else ARC_MAGIC, version, len(entries)))
+        file_out.write(body)
+    os.replace(output_file + TEMP_SUFFIX, output_file)
+
+def repack_arcs(installation_path, modded_path, output_path, worker_count=1):
+    # Puts the files of modded_path (laid out as in the unpacked game) back in the archives they are
+    # extracted from. The repacked archives are written in output_path, at the same place as in the
+    # installation folder: the installation folder itself to replace them.
+    archived_files = find_archived_files(installation_path, worker_count)
+    arc_replacements = {}
+    skipped_file_count = 0
+    for modded_file in walk_directory(modded_path, worker_count):
+        relative_path = os.path.relpath(modded_file, modded_path).replace("\\", "/")
+        if relative_path.lower() not in archived_files:
+            logger.debug(relative_path + " is not in an archive, skipped")
+            skipped_file_count += 1
+            continue
+        file_info = archived_files[relative_path.lower()]
+        arc_replacements.setdefault(file_info["arc_file"], {})[relative_path] = modded_file
+    if skipped_file_count > 0:
+        logger.info(str(skipped_file_count) + " files of " + modded_path + " are not in an archive and were skipped.")
+
+    summary = {"arc_files": len(arc_replacements), "replaced_files": 0}
+    for arc_file, replacements in sorted(arc_replacements.items()):
+        output_file = os.path.join(output_path, os.path.relpath(arc_file, installation_path))
+        arc_summary = repack_arc(arc_file, output_file, replacements, worker_count)
+        summary["replaced_files"] += arc_summary["replaced_files"]
+        logger.info("Repacked " + os.path.relpath(arc_file, installation_path) + " (" + str(len(replacements)) + " files replaced)")
+    logger.info("Repacked " + str(summary["arc_files"]) + " arc files, " + str(summary["replaced_files"]) + " files replaced.")
+    return summary
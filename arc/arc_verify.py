@@ -0,0 +1,121 @@
+import os
+import zlib
+
+import logging
+logger = logging.getLogger("mhst2_import")
+
+from .arc_parser import find_archived_files, create_worker_pool, read_arc_file, extract_arc_entries, INFLATE_CHUNK_SIZE
+from .arc_pack import ArcPack, ARC_PACK_INDEX_FILENAME
+
+def compare_inflated(compressed_data, output_name):
+    # Inflates the payload chunk by chunk and compares it with the extracted file as it goes
+    decompressor = zlib.decompressobj()
+    with open(output_name, "rb") as file_in:
+        chunk = decompressor.decompress(compressed_data, INFLATE_CHUNK_SIZE)
+        while len(chunk) > 0:
+            if file_in.read(len(chunk)) != chunk:
+                return False
+            chunk = decompressor.decompress(decompressor.unconsumed_tail, INFLATE_CHUNK_SIZE)
+        return decompressor.eof and file_in.read(1) == b""
+
+def verify_arc_entries(arc_file, file_infos, extraction_path, deep=False):
+    # Returns the (path, problem) of the entries of arc_file whose extracted file is missing, doesn't
+    # have the size given by the TOC, or (when deep) doesn't have the content of the payload
+    problems = []
+    checked_file_infos = []
+    for file_info in file_infos:
+        path = file_info["file_path"] + file_info["extension"]
+        try:
+            size = os.path.getsize(os.path.join(extraction_path, path))
+        except OSError:
+            problems.append((path, "missing"))
+            continue
+        if size != file_info["decompressed_size"]:
+            problems.append((path, "size " + str(size) + " instead of " + str(file_info["decompressed_size"])))
+            continue
+        checked_file_infos.append(file_info)
+
+    if deep and len(checked_file_infos) > 0:
+        _, bs, _ = read_arc_file(arc_file)
+        for file_info in checked_file_infos:
+            path = file_info["file_path"] + file_info["extension"]
+            compressed_bytes = bs.data[file_info["offset"]:file_info["offset"] + file_info["compressed_size"]]
+            try:
+                if not compare_inflated(compressed_bytes, os.path.join(extraction_path, path)):
+                    problems.append((path, "content differs"))
+            except zlib.error as e:
+                logger.warning("Could not inflate " + path + " from " + arc_file + " (exception=" + str(e) + ")")
+    return problems
+
+def verify_pack_entries(arc_file, file_infos, pack_index_path, deep=False):
+    # Same as verify_arc_entries, for the files of a pack (see build_arc_pack) instead of the
+    # extracted ones
+    problems = []
+    checked_file_infos = []
+    pack = ArcPack(pack_index_path)
+    try:
+        for file_info in file_infos:
+            path = file_info["file_path"] + file_info["extension"]
+            entry = pack.lookup(path)
+            if entry is None:
+                problems.append((path, "missing"))
+                continue
+            size = entry["stored_size"] if not entry["compressed"] else entry["size"]
+            if size != file_info["decompressed_size"]:
+                problems.append((path, "size " + str(size) + " instead of " + str(file_info["decompressed_size"])))
+                continue
+            checked_file_infos.append(file_info)
+
+        if deep and len(checked_file_infos) > 0:
+            _, bs, _ = read_arc_file(arc_file)
+            for file_info in checked_file_infos:
+                path = file_info["file_path"] + file_info["extension"]
+                compressed_bytes = bs.data[file_info["offset"]:file_info["offset"] + file_info["compressed_size"]]
+                try:
+                    if pack.read(path) != zlib.decompress(compressed_bytes):
+                        problems.append((path, "content differs"))
+                except zlib.error as e:
+                    logger.warning("Could not inflate " + path + " from " + arc_file + " or from the pack (exception=" + str(e) + ")")
+    finally:
+        pack.close()
+    return problems
+
+def verify_extraction(installation_path, extraction_path, worker_count=1, arc_filter=None, deep=False, repair=True):
+    if arc_filter is not None and arc_filter.is_empty():
+        arc_filter = None
+    expected_files = find_archived_files(installation_path, worker_count, arc_filter)
+    # The game may be packed instead of extracted
+    pack_index_path = os.path.join(extraction_path, ARC_PACK_INDEX_FILENAME)
+    packed = os.path.isfile(pack_index_path)
+    logger.info("Verifying " + str(len(expected_files)) + (" packed" if packed else " extracted") + " files" + (", with their content" if deep else "") + ".")
+
+    arc_file_infos = {}
+    for file_info in expected_files.values():
+        arc_file_infos.setdefault(file_info["arc_file"], []).append(file_info)
+    if packed:
+        verify_entries, target = verify_pack_entries, pack_index_path
+    else:
+        verify_entries, target = verify_arc_entries, extraction_path
+    if worker_count == 1:
+        arc_problems = [verify_entries(arc_file, file_infos, target, deep) for arc_file, file_infos in arc_file_infos.items()]
+    else:
+        with create_worker_pool(worker_count) as pool:
+            futures = [pool.submit(verify_entries, arc_file, file_infos, target, deep) for arc_file, file_infos in arc_file_infos.items()]
+            arc_problems = [future.result() for future in futures]
+
+    problems = sorted(problem for problems in arc_problems for problem in problems)
+    for path, problem in problems:
+        logger.warning(path + ": " + problem)
+    summary = {"checked_files": len(expected_files), "bad_files": len(problems), "repaired_files": 0}
+    if len(problems) == 0:
+        logger.info("All the " + ("packed" if packed else "extracted") + " files are good.")
+    elif packed:
+        # A pack can't be patched file by file, and the importers read it rather than loose files
+        logger.info(str(len(problems)) + " packed files are missing or damaged, pack the game archives again to repair them.")
+    elif repair:
+        logger.info("Extracting " + str(len(problems)) + " files again.")
+        extract_arc_entries([expected_files[path.lower()] for path, _ in problems], extraction_path)
+        summary["repaired_files"] = len(problems)
+    else:
+        logger.info(str(len(problems)) + " extracted files are missing or damaged.")
+    return summary
@@ -45,7 +45,7 @@ void blowfish_decrypt(uint32_t* p, uint32_t* s, uint32_t* L, uint32_t* R) {
     *L = *L ^ p[0];
 }
 
-EXPORT uint32_t decrypt_arc(void* v_data, uint64_t data_size, void* v_key, uint64_t key_size) {
+static uint32_t cipher_arc(void* v_data, uint64_t data_size, void* v_key, uint64_t key_size, int encrypt) {
     if(data_size%8 != 0) {
         return -1;
     }
@@ -353,13 +353,25 @@ EXPORT uint32_t decrypt_arc(void* v_data, uint64_t data_size, void* v_key, uint6
     #pragma omp parallel for schedule(static)
 #endif
     for(int i=0 ; i<data_true_size ; i += 2) {
-        blowfish_decrypt(p, s, &(data[i]), &(data[i+1]));
+        if(encrypt) {
+            blowfish_encrypt(p, s, &(data[i]), &(data[i+1]));
+        } else {
+            blowfish_decrypt(p, s, &(data[i]), &(data[i+1]));
+        }
 //         result[i] = data[i];
 //         result[i+1] = data[i+1];
     }
     return s[0];
 }
 
+EXPORT uint32_t decrypt_arc(void* v_data, uint64_t data_size, void* v_key, uint64_t key_size) {
+    return cipher_arc(v_data, data_size, v_key, key_size, 0);
+}
+
+EXPORT uint32_t encrypt_arc(void* v_data, uint64_t data_size, void* v_key, uint64_t key_size) {
+    return cipher_arc(v_data, data_size, v_key, key_size, 1);
+}
+
 int main() {
     uint8_t* key = (uint8_t*)malloc(13);
     key[0] = 'Q';
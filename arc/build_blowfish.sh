@@ -0,0 +1,21 @@
+#!/bin/sh
+# Builds the blowfish libraries loaded by arc_parser.py from blowfish.c, on linux:
+#   blowfish.so   gcc, with OpenMP
+#   blowfish.dll  cross-compiled with zig 0.11.0 (pip install ziglang==0.11.0), which links msvcrt
+#                 like mingw-w64 does. The link timestamp is zeroed so that the dll can be rebuilt
+#                 byte for byte and compared with the one in the repository.
+set -e
+cd "$(dirname "$0")"
+
+gcc -O2 -shared -fPIC -fopenmp -o blowfish.so blowfish.c
+
+python3 -m ziglang cc -target x86_64-windows-gnu -O2 -shared -s -o blowfish.dll blowfish.c
+rm -f blowfish.lib blowfish.pdb
+python3 - <<'EOF'
+import struct
+with open("blowfish.dll", "r+b") as dll:
+    dll.seek(0x3c)
+    pe_offset = struct.unpack("<I", dll.read(4))[0]
+    dll.seek(pe_offset + 8) # TimeDateStamp of the COFF header
+    dll.write(struct.pack("<I", 0))
+EOF
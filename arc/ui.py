@@ -0,0 +1,262 @@
+import bpy
+import addon_utils
+
+import os
+import threading
+
+import logging
+logger = logging.getLogger("mhst2_import")
+
+from .arc_parser import extract_arcs, ArcFilter, ExtractionProgress, split_filter_string, SetLoggingLevel
+from .arc_index import build_arc_index, open_arc_index, ARC_INDEX_FILENAME
+from .arc_dependencies import extract_dependencies
+from .arc_verify import verify_extraction
+from .arc_pack import build_arc_pack
+from .arc_filesystem import close_arc_file_systems
+
+def get_addon_preferences(context):
+    candidate_modules = [mod for mod in addon_utils.modules() if mod.bl_info["name"] == "MH Stories 2 tool suite"]
+    if len(candidate_modules) > 1:
+        logger.warning("Inconsistencies while loading the addon preferences: make sure you don't have multiple versions of the addon installed.")
+    mod = candidate_modules[0]
+    addon_prefs = context.preferences.addons[mod.__name__].preferences
+    SetLoggingLevel(addon_prefs.logging_level)
+    return addon_prefs
+
+def get_game_paths(addon_prefs):
+    extraction_path = addon_prefs.game_path
+    if extraction_path == "":
+        logger.error("Fill the game path before starting the ARC file extraction")
+        return None, None
+
+    if not os.path.isdir(extraction_path):
+        logger.error("Unable to access folder " + str(extraction_path))
+        return None, None
+
+    if addon_prefs.installation_game_path == "":
+        installation_path = extraction_path
+    else:
+        if not os.path.isdir(addon_prefs.installation_game_path):
+            logger.error("Unable to access folder " + str(addon_prefs.installation_game_path))
+            return None, None
+        installation_path = addon_prefs.installation_game_path
+    return extraction_path, installation_path
+
+def get_arc_filter(addon_prefs):
+    return ArcFilter(
+        include_paths=split_filter_string(addon_prefs.extraction_include_paths),
+        exclude_paths=split_filter_string(addon_prefs.extraction_exclude_paths),
+        include_classes=split_filter_string(addon_prefs.extraction_include_classes),
+        exclude_classes=split_filter_string(addon_prefs.extraction_exclude_classes),
+    )
+
+def get_bulk_extraction(context, progress=None):
+    # The extraction to run with the addon preferences, read here as bpy can't be used from the
+    # thread running it. Returns None if the paths are wrong.
+    addon_prefs = get_addon_preferences(context)
+    extraction_path, installation_path = get_game_paths(addon_prefs)
+    if extraction_path is None:
+        return None
+    worker_count = addon_prefs.extraction_worker_count
+    arc_filter = get_arc_filter(addon_prefs)
+    if addon_prefs.extraction_format == "LOOSE":
+        dedup = addon_prefs.extraction_dedup
+        link_loose_files = addon_prefs.extraction_link_loose_files
+        return lambda: extract_arcs(installation_path, extraction_path, worker_count=worker_count, arc_filter=arc_filter, dedup=dedup, link_loose_files=link_loose_files, progress=progress)
+    compress = addon_prefs.extraction_format == "PACK"
+    return lambda: build_arc_pack(installation_path, extraction_path, worker_count=worker_count, arc_filter=arc_filter, compress=compress, progress=progress)
+
+# Set while an extraction runs: a second one would write the same files, journal and manifest
+extraction_running = False
+
+def poll_no_extraction(cls):
+    # The operators writing to the game folder wait for a running extraction
+    if extraction_running:
+        cls.poll_message_set("The game is being unpacked")
+        return False
+    return True
+
+def bulk_extract_arc(context):
+    global extraction_running
+    extraction = get_bulk_extraction(context)
+    if extraction is None:
+        return
+    close_arc_file_systems()
+    extraction_running = True
+    try:
+        extraction()
+    finally:
+        extraction_running = False
+
+def format_duration(seconds):
+    seconds = int(seconds)
+    if seconds >= 3600:
+        return str(seconds//3600) + "h" + str(seconds%3600//60).zfill(2)
+    return str(seconds//60) + "m" + str(seconds%60).zfill(2)
+
+def bulk_index_arc(context):
+    addon_prefs = get_addon_preferences(context)
+    extraction_path, installation_path = get_game_paths(addon_prefs)
+    if extraction_path is None:
+        return
+    build_arc_index(installation_path, os.path.join(extraction_path, ARC_INDEX_FILENAME), max(1, addon_prefs.extraction_worker_count))
+
+def bulk_extract_dependencies(context, root_path):
+    addon_prefs = get_addon_preferences(context)
+    extraction_path, installation_path = get_game_paths(addon_prefs)
+    if extraction_path is None:
+        return
+
+    index = open_arc_index(os.path.join(extraction_path, ARC_INDEX_FILENAME), installation_path, max(1, addon_prefs.extraction_worker_count))
+    try:
+        extract_dependencies(index, root_path, extraction_path)
+    finally:
+        index.close()
+
+def bulk_verify_arc(context, deep):
+    addon_prefs = get_addon_preferences(context)
+    extraction_path, installation_path = get_game_paths(addon_prefs)
+    if extraction_path is None:
+        return
+    verify_extraction(installation_path, extraction_path, worker_count=max(1, addon_prefs.extraction_worker_count), arc_filter=get_arc_filter(addon_prefs), deep=deep)
+
+
+class MHST2_ArcExtract(bpy.types.Operator):
+    bl_idname = "mhst2_import.mhst2_extract_arc"
+    bl_label = "Bulk extract arc files"
+    bl_options = {'REGISTER'}
+
+    # Started from the interface, the extraction runs in a thread while this operator shows its
+    # progress, until it's done or cancelled with Esc. Run from a script, it blocks.
+    @classmethod
+    def poll(cls, context):
+        return poll_no_extraction(cls)
+
+    def execute(self, context):
+        bulk_extract_arc(context)
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        global extraction_running
+        if extraction_running:
+            self.report({"WARNING"}, "The game is already being unpacked")
+            return {"CANCELLED"}
+        self.progress = ExtractionProgress()
+        extraction = get_bulk_extraction(context, self.progress)
+        if extraction is None:
+            self.report({"ERROR"}, "Check the game paths in the addon preferences")
+            return {"CANCELLED"}
+        # A cancelled extraction of loose files resumes where it stopped, a cancelled pack build is
+        # thrown away and starts over
+        self.resumable = get_addon_preferences(context).extraction_format == "LOOSE"
+        close_arc_file_systems()
+        self.error = None
+        extraction_running = True
+        self.thread = threading.Thread(target=self.run, args=(extraction,), daemon=True)
+        self.thread.start()
+
+        window_manager = context.window_manager
+        self.timer = window_manager.event_timer_add(0.5, window=context.window)
+        window_manager.modal_handler_add(self)
+        window_manager.progress_begin(0, 1000)
+        return {"RUNNING_MODAL"}
+
+    def run(self, extraction):
+        global extraction_running
+        try:
+            extraction()
+        except Exception as e:
+            logger.error("Extraction failed (exception=" + str(e) + ")")
+            self.error = e
+        finally:
+            extraction_running = False
+
+    def modal(self, context, event):
+        if event.type == "ESC" and event.value == "PRESS" and not self.progress.is_cancelled():
+            self.progress.cancel()
+            logger.info("Cancelling the extraction, waiting for the arc files being extracted.")
+        if event.type != "TIMER":
+            return {"PASS_THROUGH"}
+
+        if self.thread.is_alive():
+            progress = self.progress
+            context.window_manager.progress_update(int(progress.fraction()*1000))
+            if progress.is_cancelled():
+                status = "Cancelling the extraction..."
+            else:
+                eta = progress.eta()
+                status = "Extracting the game: " + str(progress.done_arc_files) + "/" + str(progress.total_arc_files) + " arc files, " + str(round(progress.written_bytes/1e9, 2)) + " GB written"
+                status += ", " + (format_duration(eta) + " left" if eta is not None else "estimating the time left")
+                status += " (Esc to cancel)" if self.resumable else " (Esc to cancel, the pack build will start over)"
+            context.workspace.status_text_set(status)
+            return {"PASS_THROUGH"}
+
+        context.window_manager.event_timer_remove(self.timer)
+        context.window_manager.progress_end()
+        context.workspace.status_text_set(None)
+        if self.error is not None:
+            self.report({"ERROR"}, "Extraction failed: " + str(self.error))
+            return {"CANCELLED"}
+        if self.progress.is_cancelled():
+            if self.resumable:
+                self.report({"WARNING"}, "Extraction cancelled, start it again to resume")
+            else:
+                self.report({"WARNING"}, "Pack build cancelled, nothing was kept: the next one starts over")
+            return {"CANCELLED"}
+        self.report({"INFO"}, "Extraction done")
+        return {"FINISHED"}
+
+
+class MHST2_ArcIndex(bpy.types.Operator):
+    bl_idname = "mhst2_import.mhst2_index_arc"
+    bl_label = "Index arc files"
+    bl_options = {'REGISTER'}
+
+    @classmethod
+    def poll(cls, context):
+        return poll_no_extraction(cls)
+
+    def execute(self, context):
+        bulk_index_arc(context)
+        return {'FINISHED'}
+
+
+class MHST2_ArcExtractDependencies(bpy.types.Operator):
+    bl_idname = "mhst2_import.mhst2_extract_arc_dependencies"
+    bl_label = "Extract an asset and its dependencies"
+    bl_options = {'REGISTER'}
+
+    asset_path: bpy.props.StringProperty(name="Asset path", description="Path of a .ipr or .mod file inside the game archives (e.g. stage/.../v01_00.ipr)", default="")
+
+    @classmethod
+    def poll(cls, context):
+        return poll_no_extraction(cls)
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        if self.asset_path == "":
+            self.report({"ERROR"}, "No asset path given")
+            return {"CANCELLED"}
+        bulk_extract_dependencies(context, self.asset_path)
+        return {'FINISHED'}
+
+
+class MHST2_ArcVerify(bpy.types.Operator):
+    bl_idname = "mhst2_import.mhst2_verify_arc"
+    bl_label = "Verify the extracted files"
+    bl_options = {'REGISTER'}
+
+    deep: bpy.props.BoolProperty(name="Compare the content", description="Inflate the archived files again and compare their content, not only their size. Much slower", default=False)
+
+    @classmethod
+    def poll(cls, context):
+        return poll_no_extraction(cls)
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        bulk_verify_arc(context, self.deep)
+        return {'FINISHED'}
@@ -7,6 +7,7 @@ import math
 
 from ..mod.mod_loader import load_mod
 from ..mrl.mrl_loader import load_mrl
+from ..arc.arc_filesystem import game_file_exists
 logger = logging.getLogger("mhst2_import")
 
 def load_object_instances(obj_instances, scene_collection, game_path, LOD, mesh_cache={}, mesh_hashes={}, zone_collection_dict={}, load_materials=True, use_png_cache=True, overwrite_png_cache=False):
@@ -72,7 +73,7 @@ def load_object_instances(obj_instances, scene_collection, game_path, LOD, mesh_
                         obj.scale = obj_scl
                     returned_objects.append(obj)
                 mrl_filepath = os.path.join(game_path, obj_instance["path"] + ".mrl")
-                if load_materials and os.path.exists(mrl_filepath):
+                if load_materials and game_file_exists(mrl_filepath):
                     try:
                         mats = load_mrl(game_path, mrl_filepath, use_loaded_mat=True, use_loaded_tex=True, use_png_cache=use_png_cache, overwrite_png_cache=overwrite_png_cache, mat_prefix=obj_name)
                     except Exception as e:
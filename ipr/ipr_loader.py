@@ -6,12 +6,13 @@ import logging
 import math
 
 from .ipr_parser import IprParser
+from ..arc.arc_filesystem import read_from_archives
 from ..common.object_loader import load_object_instances
 
 logger = logging.getLogger("mhst2_import")
 
 def load_ipr(game_path, filepath, LOD=0, mesh_cache={}, mesh_hashes={}, import_material=True, use_png_cache=True, overwrite_png_cache=False):
-    parser = IprParser(path=filepath)
+    parser = IprParser(path=filepath, data=read_from_archives(filepath))
     obj_instances = parser.read()
 
     scn_name = os.path.basename(filepath)
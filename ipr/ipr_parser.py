@@ -98,6 +98,7 @@ class IprParser():
         if data is None:
             with open(path, "rb") as file_in:
                 data = file_in.read()
+        if path is not None:
             self.basename = os.path.basename(self.path)
         self.bs = Reader(data)
     
@@ -6,11 +6,12 @@ import logging
 import math
 
 from .mod_parser import ModParser
+from ..arc.arc_filesystem import read_from_archives
 
 logger = logging.getLogger("mhst2_import")
 
 def load_mod(filepath, collection=None, LOD=0, fix_rotation=False, fix_scale=False, obj_name="", connect_bones=False):
-    parser = ModParser(path=filepath)
+    parser = ModParser(path=filepath, data=read_from_archives(filepath))
     armature_datas, mesh_datas = parser.read()
 
     file_name = os.path.basename(filepath)
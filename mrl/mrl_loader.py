@@ -4,11 +4,11 @@ from mathutils import Matrix, Vector
 import numpy as np
 import os
 import logging
-from glob import glob
 
 from .mrl_parser import MrlParser
 from .clc_parser import ClcParser
 from ..tex.tex_loader import load_tex
+from ..arc.arc_filesystem import read_from_archives, game_file_exists, glob_game_files
 
 logger = logging.getLogger("mhst2_import")
 
@@ -28,7 +28,7 @@ def create_img_node(game_path, nodes, filepath, position, use_loaded_tex=False,
 
     filepath = filepath.replace("\\", "/")
     new_filepath = os.path.join(game_path, filepath + ".tex")
-    if not os.path.isfile(new_filepath):
+    if not game_file_exists(new_filepath):
         logger.warning("Could not load texture, file does not exists (path=" + new_filepath + ")")
         return node_img
 
@@ -45,22 +45,22 @@ def create_img_node(game_path, nodes, filepath, position, use_loaded_tex=False,
     return node_img
 
 def load_mrl(game_path, filepath, mod_mat_hashes={}, use_loaded_mat=False, use_loaded_tex=False, use_png_cache=False, overwrite_png_cache=False, mat_prefix="", beautify=True, import_clc=False):
-    parser = MrlParser(path=filepath)
+    parser = MrlParser(path=filepath, data=read_from_archives(filepath))
     mat_dict = parser.read()
     returned_mats = []
     
     extra_color = None
     if import_clc:
         try:
-            clc_files = glob(os.path.join(os.path.dirname(filepath), ".", "*.clc"), recursive=True)
+            clc_files = glob_game_files(os.path.dirname(filepath), ".clc")
             if len(clc_files) == 0:
-                clc_files = glob(os.path.join(os.path.dirname(filepath), ".", "**", "*.clc"), recursive=True)
+                clc_files = glob_game_files(os.path.dirname(filepath), ".clc", recursive=True)
             if len(clc_files) == 0:
-                clc_files = glob(os.path.join(os.path.dirname(filepath), "..", "**", "*.clc"), recursive=True)
+                clc_files = glob_game_files(os.path.join(os.path.dirname(filepath), ".."), ".clc", recursive=True)
             if len(clc_files) > 0:
                 # print(clc_files)
                 clc_file = sorted(clc_files, key=len)[0]
-                clc_parser = ClcParser(clc_file)
+                clc_parser = ClcParser(clc_file, data=read_from_archives(clc_file))
                 extra_color = clc_parser.read()["color"] + [1.0]
                 # print(extra_color)
         except:
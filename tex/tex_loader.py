@@ -6,6 +6,7 @@ import logging
 logger = logging.getLogger("mhst2_import")
 
 from .tex_parser import TexParser
+from ..arc.arc_filesystem import read_from_archives
 
 def load_tex(filepath, use_loaded=False, use_png_cache=False, overwrite_png_cache=False):
     image_name = os.path.basename(filepath)
@@ -18,7 +19,7 @@ def load_tex(filepath, use_loaded=False, use_png_cache=False, overwrite_png_cach
         dir_name = os.path.dirname(filepath)
         png_name = image_name + ".png"
         if os.path.exists(os.path.join(dir_name, png_name)):
-            parser = TexParser(path=filepath)
+            parser = TexParser(path=filepath, data=read_from_archives(filepath))
             img = bpy.data.images.load(os.path.join(dir_name, png_name))
             if parser.DXGI_format.endswith("_SRGB"):
                 img.colorspace_settings.name = "sRGB"
@@ -28,7 +29,7 @@ def load_tex(filepath, use_loaded=False, use_png_cache=False, overwrite_png_cach
             img.alpha_mode="CHANNEL_PACKED"
             return img
     
-    parser = TexParser(path=filepath)
+    parser = TexParser(path=filepath, data=read_from_archives(filepath))
     img_array, could_read = parser.read()
     #print(filepath, parser.DXGI_format)
     if could_read:
@@ -41,6 +42,8 @@ def load_tex(filepath, use_loaded=False, use_png_cache=False, overwrite_png_cach
         img.file_format = 'PNG'
         img.pixels = (np.flip(img_array, 0).astype(np.float16)/255).ravel()
         if use_png_cache:
+            # The .tex file may have been read from the archives, without its folder existing
+            os.makedirs(os.path.dirname(img.filepath), exist_ok=True)
             img.save()
         else:
             img.pack()